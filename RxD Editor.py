@@ -72,12 +72,14 @@ https://digitzaki.github.io/
 
 import sys
 import os
+import bisect
 import re
 import struct
 import json
 import mmap
 import math
 from collections import Counter
+from itertools import islice
 from PyQt5.QtWidgets import *
 from PyQt5.QtGui import *
 from PyQt5.QtCore import *
@@ -85,6 +87,7 @@ from editor_themes import (THEMES, get_theme_stylesheet, get_theme_colors,
                            get_all_themes, CustomThemeEditor, load_custom_themes,
                            save_custom_themes, get_theme_categories)
 from datainspect import DataInspector
+from datainspect.data_inspector import HEX_BYTES, HEX_BYTE_VALUES, STRUCTS, format_integral
 from datainspect.pattern_scan import PatternScanner, PatternScanWidget, PatternResult
 from datainspect.pointers import SignaturePointer, SignatureWidget, SignatureScanner, ClickableOverlay
 from datainspect.statistics import StatisticsWidget
@@ -105,6 +108,104 @@ try:
 except ImportError:
     MATPLOTLIB_AVAILABLE = False
 
+# Byte -> ASCII column character. Printable ASCII (32-126) and extended Latin-1
+# (160-255) map to themselves, control characters (0x00-0x1F, 0x7F-0x9F) map to '.'
+ASCII_DISPLAY_TABLE = bytes(b if (32 <= b <= 126 or 160 <= b <= 255) else 0x2E for b in range(256))
+
+# FileTab attributes holding per-byte edit markers; they move together when bytes are cut or inserted
+BYTE_MARKER_SETS = ('modified_bytes', 'inserted_bytes', 'replaced_bytes')
+
+# FileTab attributes copied into every undo step (the order of an undo step's 'markers' tuple)
+UNDO_MARKER_ATTRS = BYTE_MARKER_SETS + ('byte_highlights', 'pattern_highlights')
+
+# Largest in-place overwrite that refresh_edited_bytes patches into the rendered documents;
+# bigger edits rebuild the window with display_hex
+INPLACE_REFRESH_MAX_BYTES = 256
+
+# str.translate tables that delete hex digits (either case, plus spaces) or decimal digits;
+# a string is made only of those characters when nothing is left over
+HEX_DIGIT_DELETE_TABLE = str.maketrans('', '', '0123456789ABCDEFabcdef ')
+DECIMAL_DIGIT_DELETE_TABLE = str.maketrans('', '', '0123456789')
+WHITESPACE_DELETE_TABLE = str.maketrans('', '', ' \t\r\n')
+
+# Chunk size for scanning several highlight patterns per pass over the file (see _scan_pattern_highlights)
+PATTERN_SCAN_BLOCK = 1 << 20
+
+# Find All lists at most this many results; the rest are only counted
+SEARCH_RESULT_LIMIT = 1000
+
+# Rows the Compare Data view renders at once; the window moves with the cursor and when
+# scrolling reaches either end, so large files never build a document for every row
+COMPARE_WINDOW_ROWS = 512
+
+# Columns of a Compare Data row: '0x%08X' offset and two spaces, 16 'XX ' hex cells, ' | ', text
+COMPARE_HEX_COLUMN = 12
+COMPARE_TEXT_COLUMN = COMPARE_HEX_COLUMN + 16 * 3 + 3
+
+
+def iter_pattern_matches(data, pattern, start=0, end=None):
+    """Yield offsets of non-overlapping occurrences of pattern in data[start:end], left to right"""
+    if not pattern:
+        # An empty pattern matches everywhere without advancing
+        return
+    if end is None:
+        end = len(data)
+    pos = data.find(pattern, start, end)
+    while pos != -1:
+        yield pos
+        # Skip past the entire pattern to avoid overlapping matches
+        pos = data.find(pattern, pos + len(pattern), end)
+
+
+def pattern_self_overlaps(pattern):
+    """Whether two occurrences of pattern can overlap (a proper prefix is also a suffix)
+
+    Without such overlaps a left-to-right non-overlapping scan finds every occurrence,
+    so the matches near an edit do not depend on the matches before it.
+    """
+    return any(pattern[:k] == pattern[-k:] for k in range(1, len(pattern)))
+
+
+# Maps every non-zero byte to 1, turning an XOR of two buffers into a 0/1 difference mask
+NONZERO_TO_ONE_TABLE = bytes(1) + b'\x01' * 255
+
+
+def byte_difference_mask(data1, data2):
+    """Return a mask with one byte per offset up to the longer buffer's length: 1 where
+    data1 and data2 differ (every offset past the shorter one differs), else 0"""
+    common = min(len(data1), len(data2))
+    xor = b''
+    if common:
+        # XOR the common prefix as two big integers - one C-level pass instead of a
+        # per-byte Python comparison
+        xor = (int.from_bytes(data1[:common], 'little') ^ int.from_bytes(data2[:common], 'little')).to_bytes(common, 'little')
+    return xor.translate(NONZERO_TO_ONE_TABLE) + b'\x01' * (max(len(data1), len(data2)) - common)
+
+
+def parse_hex_input(text):
+    """Parse typed hex such as "DE AD", "dead" or "0xDE 0xAD" into bytes (raises ValueError)"""
+    # One translate pass drops all whitespace; the 0x prefixes are only searched for once
+    text = text.translate(WHITESPACE_DELETE_TABLE)
+    if '0x' in text or '0X' in text:
+        text = text.replace('0x', '').replace('0X', '')
+    return bytes.fromhex(text)
+
+
+def read_leb128(data_bytes, signed=True):
+    """Decode a (U)LEB128 value from the start of data_bytes; returns (value, byte count)"""
+    result = 0
+    shift = 0
+    size = 0
+    for b in data_bytes:
+        size += 1
+        result |= (b & 0x7f) << shift
+        shift += 7
+        if (b & 0x80) == 0:
+            break
+    if signed and size > 0 and (result & (1 << (shift - 1))):
+        result -= (1 << shift)
+    return result, size
+
 
 class FileTab:
     """
@@ -167,6 +268,7 @@ class FileTab:
         self.byte_highlights = {}  # Per-file highlights: {offset: {color, message, underline, pattern (optional)}}
         self.pattern_highlights = []  # Pattern-based highlights that auto-search: [{pattern, color, message, underline}]
         self.pattern_highlights_dirty = False  # Flag to track if pattern highlights need reapplying
+        self.pattern_dirty_ranges = []  # In-place edited (start, end) ranges awaiting a local pattern rescan
         self.snapshots = []  # Version control snapshots for this file
         self.last_snapshot_data = None  # Last snapshot data to detect changes
         self.pattern_labels = {}  # Pattern scan labels: {offset: label}
@@ -187,6 +289,90 @@ class FileTab:
         else:
             self.file_data[offset] = value
 
+    def mark_pattern_range_dirty(self, start, end):
+        """Queue an in-place edited byte range [start, end) for a local pattern highlight rescan"""
+        if self.pattern_highlights:
+            self.pattern_dirty_ranges.append((start, end))
+
+    def has_byte_markers(self, start, end):
+        """Whether any byte in [start, end) carries a modified, inserted or replaced marker"""
+        # isdisjoint walks the range in C, stopping at the first marked offset
+        span = range(start, end)
+        return not all(getattr(self, name).isdisjoint(span) for name in BYTE_MARKER_SETS)
+
+    def delete_byte_markers(self, start, count):
+        """Drop edit markers in [start, start + count) and shift later markers down by count"""
+        end = start + count
+        for name in BYTE_MARKER_SETS:
+            markers = getattr(self, name)
+            # Only markers at or after start are affected; the sets are updated in place
+            moved = [pos for pos in markers if pos >= start]
+            if moved:
+                markers.difference_update(moved)
+                markers.update([pos - count for pos in moved if pos >= end])
+
+    def insert_byte_markers(self, position, count):
+        """Shift edit markers at or after position up by count to make room for inserted bytes"""
+        for name in BYTE_MARKER_SETS:
+            markers = getattr(self, name)
+            # Only markers at or after position move; the sets are updated in place
+            moved = [pos for pos in markers if pos >= position]
+            if moved:
+                markers.difference_update(moved)
+                markers.update([pos + count for pos in moved])
+
+    def delete_byte_markers_at(self, positions):
+        """Drop edit markers at the given ascending positions and shift later markers down to close the gaps"""
+        if not positions:
+            return
+        for name in BYTE_MARKER_SETS:
+            markers = getattr(self, name)
+            moved = sorted([pos for pos in markers if pos >= positions[0]])
+            if not moved:
+                continue
+            markers.difference_update(moved)
+            # Each surviving marker moves down by the number of cut positions before it, so
+            # the markers between two cut positions move together (as in replace_byte_markers)
+            i = 0
+            while i < len(moved):
+                index = bisect.bisect_left(positions, moved[i])
+                if index < len(positions) and positions[index] == moved[i]:
+                    # This marker's byte was cut
+                    i += 1
+                    continue
+                run_end = bisect.bisect_left(moved, positions[index], i) if index < len(positions) else len(moved)
+                markers.update(map((-index).__add__, moved[i:run_end]))
+                i = run_end
+
+    def replace_byte_markers(self, matches, old_length, new_length):
+        """Drop edit markers inside the ascending match spans and shift later markers by the size change
+
+        The affected markers are sorted once and handled a run at a time: every marker
+        between two matches moves by the same amount, so each run is one bisect plus a
+        C-level map over its slice rather than per-marker Python work.
+        """
+        if not matches or old_length == new_length:
+            return
+        size_diff = new_length - old_length
+        for name in BYTE_MARKER_SETS:
+            markers = getattr(self, name)
+            moved = sorted([pos for pos in markers if pos >= matches[0]])
+            if not moved:
+                continue
+            markers.difference_update(moved)
+            i = 0
+            while i < len(moved):
+                # Matches starting at or before this marker; it is inside the last of them or past it
+                index = bisect.bisect_right(matches, moved[i])
+                span_end = matches[index - 1] + old_length
+                if moved[i] < span_end:
+                    # Overwritten by the replacement: skip the rest of this match span
+                    i = bisect.bisect_left(moved, span_end, i)
+                    continue
+                run_end = bisect.bisect_left(moved, matches[index], i) if index < len(matches) else len(moved)
+                markers.update(map((index * size_diff).__add__, moved[i:run_end]))
+                i = run_end
+
     def __del__(self):
         """Clean up mmap and file handle"""
         if self.mmap:
@@ -911,6 +1097,88 @@ class HexTextEdit(QTextEdit):
         super().mouseMoveEvent(event)
 
 
+class CompareTextEdit(QPlainTextEdit):
+    """Plain-text row view for Compare Data; colors are applied by a CompareHighlighter"""
+    clicked = pyqtSignal(QMouseEvent)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setLineWrapMode(QPlainTextEdit.NoWrap)
+        font = QFont("Courier", 10)
+        font.setStyleHint(QFont.Monospace)
+        font.setFixedPitch(True)
+        self.setFont(font)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.clicked.emit(event)
+        super().mousePressEvent(event)
+
+
+class CompareHighlighter(QSyntaxHighlighter):
+    """Colors Compare Data rows with QTextCharFormats instead of HTML markup.
+
+    byte_styles(block_number) returns (index, color, bg_color, cursor_nibble) for each styled
+    byte of that row; cursor_nibble is None except for the byte under the cursor."""
+
+    def __init__(self, document, byte_styles):
+        super().__init__(document)
+        self.byte_styles = byte_styles
+        self.formats = {}
+
+    def char_format(self, color, bg_color, bold):
+        """Return the shared format for a color/background/weight combination"""
+        key = (color, bg_color, bold)
+        fmt = self.formats.get(key)
+        if fmt is None:
+            fmt = QTextCharFormat()
+            if color:
+                fmt.setForeground(QColor(color))
+            if bg_color:
+                fmt.setBackground(QColor(bg_color))
+            if bold:
+                fmt.setFontWeight(QFont.Bold)
+            self.formats[key] = fmt
+        return fmt
+
+    def format_run(self, run):
+        """Format a [first, last, color] run of bytes in both columns with one call each"""
+        if run is None:
+            return
+        first, last, color = run
+        fmt = self.char_format(color, None, True)
+        self.setFormat(COMPARE_HEX_COLUMN + first * 3, (last - first) * 3 + 2, fmt)
+        self.setFormat(COMPARE_TEXT_COLUMN + first, last - first + 1, fmt)
+
+    def highlightBlock(self, text):
+        self.setFormat(0, COMPARE_HEX_COLUMN - 2, self.char_format('#888', None, False))
+        # Adjacent bytes with the same foreground-only color (e.g. a differing span) are merged
+        # into one run; the spaces between their hex cells take the format invisibly
+        run = None
+        for index, color, bg_color, cursor_nibble in self.byte_styles(self.currentBlock().blockNumber()):
+            if cursor_nibble is None and bg_color is None:
+                if run is not None and run[1] == index - 1 and run[2] == color:
+                    run[1] = index
+                else:
+                    self.format_run(run)
+                    run = [index, index, color]
+                continue
+
+            hex_col = COMPARE_HEX_COLUMN + index * 3
+            text_col = COMPARE_TEXT_COLUMN + index
+            if cursor_nibble is not None:
+                # Highlight the whole byte, bold only the nibble being edited
+                self.setFormat(hex_col, 2, self.char_format(color, bg_color, False))
+                self.setFormat(hex_col + cursor_nibble, 1, self.char_format(color, bg_color, True))
+                self.setFormat(text_col, 1, self.char_format(color, bg_color, True))
+            else:
+                fmt = self.char_format(color, bg_color, bool(color))
+                self.setFormat(hex_col, 2, fmt)
+                self.setFormat(text_col, 1, fmt)
+        self.format_run(run)
+
+
 class SmartPasteDialog(QDialog):
     """Dialog for handling paste size mismatches over selections"""
 
@@ -1569,6 +1837,30 @@ class GradientWidget(QWidget):
             painter.end()
 
 
+class ColorPreviewCircle(QWidget):
+    """Round color swatch painted directly, so recoloring it doesn't go through a stylesheet"""
+    def __init__(self, border_color, border_width=3, parent=None):
+        super().__init__(parent)
+        self.color = QColor(0, 0, 0)
+        self.border_pen = QPen(QColor(border_color), border_width)
+
+    def set_color(self, color):
+        """Set the fill color (alpha is honored) and repaint if it changed"""
+        if color != self.color:
+            self.color = color
+            self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self.border_pen)
+        painter.setBrush(self.color)
+        # Keep the whole pen inside the widget
+        inset = self.border_pen.widthF() / 2
+        painter.drawEllipse(QRectF(self.rect()).adjusted(inset, inset, -inset, -inset))
+        painter.end()
+
+
 class DebugOutputRedirector:
     def __init__(self, text_widget):
         self.text_widget = text_widget
@@ -1717,8 +2009,8 @@ class HexEditorQt(QMainWindow):
         cursor_nibble (int): Which nibble of byte is selected (0 or 1)
         selection_start (int): Start offset of selection
         selection_end (int): End offset of selection
-        undo_stack (list): Stack of previous file states
-        redo_stack (list): Stack of undone file states
+        undo_stack (list): Stack of undo steps (full file snapshots or byte-range deltas)
+        redo_stack (list): Stack of undone steps, in the same format
         bytes_per_row (int): Number of bytes per row (default 16)
         endian_mode (str): 'little' or 'big' endian for multi-byte values
         current_theme (str): Name of active color theme
@@ -1742,6 +2034,7 @@ class HexEditorQt(QMainWindow):
         self.column_sel_end_row = None    # Ending row for column selection
         self.column_sel_end_col = None    # Ending column for column selection
         self.clipboard = None
+        self.clipboard_text = None  # Hex text last written to the system clipboard for self.clipboard
         self.clipboard_grid_rows = None  # Number of rows if clipboard data is from column selection
         self.clipboard_grid_cols = None  # Number of columns if clipboard data is from column selection
         self.endian_mode = 'little'
@@ -1756,12 +2049,25 @@ class HexEditorQt(QMainWindow):
         self.current_theme = self.load_theme_preference()
         self.notes_window = None
         self.debug_window = None
-        self.debug_redirector = None
+        # Replace, Go To and calculator dialogs are built on first use and reused afterwards
+        self.replace_dialog = None
+        self.goto_dialog = None
+        self.calculator_dialog = None
+        self.calculator_theme = None  # Theme the calculator was styled with
+        self.debug_redirector = None  # Set once the debugging console captures stdout; gates hot-path trace prints
         self.original_stdout = sys.stdout
         self.original_stderr = sys.stderr
         self.bytes_per_row = 16
+        self._hex_row_char_width = 0  # Characters per hex display row, including the newline
+        self._ascii_row_char_width = 0  # Characters per ASCII display row, including the newline
+        self._format_generation = 0  # Bumped by every apply_hex_formatting pass
+        self._last_highlight = None  # (format generation, saved hex formats, saved ASCII formats)
+        self.update_row_char_widths()
         self.offset_mode = 'h'  # 'h' for hex, 'd' for decimal, 'o' for octal
         self._last_inspector_pos = None
+        self._last_status_key = None  # Inputs of the text last written by update_status
+        self._last_hover_byte = None  # (display, byte_index) last handled by a hover event
+        self._drag_render_pending = False  # Coalesces drag-selection re-renders to one per event loop pass
         self.auxiliary_windows = []  # Track all open auxiliary windows
         self.ignore_file_size_warnings = False  # Flag to suppress file size change warnings
         self.pattern_result_to_update = None  # Track pattern result for color box update
@@ -2755,87 +3061,125 @@ class HexEditorQt(QMainWindow):
             self.handle_ascii_input(text)
             return True
 
+        # Multi-character key events (input methods, paste via key stream)
+        if len(text) > 1 and text.isascii() and text.isprintable():
+            self.handle_ascii_bulk(text)
+            return True
+
         return False
 
     def handle_arrow_keys(self, key):
-        if self.cursor_position is None:
+        pos = self.cursor_position
+        if pos is None:
             return
 
+        # Hoist hot attributes into locals; this runs on every key autorepeat
+        nibble = self.cursor_nibble
+        bytes_per_row = self.bytes_per_row
+        file_size = len(self.open_files[self.current_tab_index].file_data)
+
         if key == Qt.Key_Left:
-            if self.cursor_nibble == 1:
-                self.cursor_nibble = 0
-            elif self.cursor_position > 0:
-                self.cursor_position -= 1
-                self.cursor_nibble = 1
+            if nibble == 1:
+                nibble = 0
+            elif pos > 0:
+                pos -= 1
+                nibble = 1
         elif key == Qt.Key_Right:
-            if self.cursor_nibble == 0:
-                self.cursor_nibble = 1
-            else:
-                current_file = self.open_files[self.current_tab_index]
-                if self.cursor_position < len(current_file.file_data) - 1:
-                    self.cursor_position += 1
-                    self.cursor_nibble = 0
+            if nibble == 0:
+                nibble = 1
+            elif pos < file_size - 1:
+                pos += 1
+                nibble = 0
         elif key == Qt.Key_Up:
-            if self.cursor_position >= self.bytes_per_row:
-                self.cursor_position -= self.bytes_per_row
+            if pos >= bytes_per_row:
+                pos -= bytes_per_row
         elif key == Qt.Key_Down:
-            current_file = self.open_files[self.current_tab_index]
-            if self.cursor_position + self.bytes_per_row < len(current_file.file_data):
-                self.cursor_position += self.bytes_per_row
+            if pos + bytes_per_row < file_size:
+                pos += bytes_per_row
+
+        self.cursor_position = pos
+        self.cursor_nibble = nibble
 
         self.update_cursor_highlight()
         self.data_inspector.update()
 
     def handle_hex_input(self, char):
         current_file = self.open_files[self.current_tab_index]
-        if self.cursor_position >= len(current_file.file_data):
+        file_data = current_file.file_data
+        file_size = len(file_data)
+        pos = self.cursor_position
+        if pos >= file_size:
             return
 
-        self.save_undo_state()
+        self.save_undo_delta(pos, file_data[pos:pos + 1])
 
-        old_value = current_file.file_data[self.cursor_position]
+        nibble = self.cursor_nibble
+        old_value = file_data[pos]
         nibble_value = int(char, 16)
 
-        if self.cursor_nibble == 0:
+        if nibble == 0:
             new_value = (nibble_value << 4) | (old_value & 0x0F)
         else:
             new_value = (old_value & 0xF0) | nibble_value
 
-        current_file.file_data[self.cursor_position] = new_value
+        file_data[pos] = new_value
         current_file.modified = True
-        current_file.modified_bytes.add(self.cursor_position)
-        current_file.pattern_highlights_dirty = True  # Mark pattern highlights for reapplication
+        current_file.modified_bytes.add(pos)
+        current_file.mark_pattern_range_dirty(pos, pos + 1)
 
         # Move cursor
-        if self.cursor_nibble == 0:
+        if nibble == 0:
             self.cursor_nibble = 1
         else:
             self.cursor_nibble = 0
-            if self.cursor_position < len(current_file.file_data) - 1:
-                self.cursor_position += 1
+            if pos < file_size - 1:
+                self.cursor_position = pos + 1
 
         self.display_hex()
-        self.update_cursor_highlight()
-        self.data_inspector.update()
 
     def handle_ascii_input(self, char):
         current_file = self.open_files[self.current_tab_index]
-        if self.cursor_position >= len(current_file.file_data):
+        file_data = current_file.file_data
+        file_size = len(file_data)
+        pos = self.cursor_position
+        if pos >= file_size:
             return
 
-        self.save_undo_state()
+        self.save_undo_delta(pos, file_data[pos:pos + 1])
 
-        current_file.file_data[self.cursor_position] = ord(char)
+        file_data[pos] = ord(char)
         current_file.modified = True
-        current_file.modified_bytes.add(self.cursor_position)
-        current_file.pattern_highlights_dirty = True  # Mark pattern highlights for reapplication
+        current_file.modified_bytes.add(pos)
+        current_file.mark_pattern_range_dirty(pos, pos + 1)
 
-        if self.cursor_position < len(current_file.file_data) - 1:
-            self.cursor_position += 1
+        if pos < file_size - 1:
+            self.cursor_position = pos + 1
+
+        self.display_hex()
+
+    def handle_ascii_bulk(self, text):
+        """Overwrite bytes at the cursor with a run of ASCII text as a single edit"""
+        current_file = self.open_files[self.current_tab_index]
+        file_data = current_file.file_data
+        file_size = len(file_data)
+        pos = self.cursor_position
+        if pos >= file_size:
+            return
+
+        new_bytes = text.encode('latin-1')[:file_size - pos]
+        end = pos + len(new_bytes)
+
+        # One undo state and one redraw for the whole run instead of one per character
+        self.save_undo_delta(pos, file_data[pos:end])
+
+        file_data[pos:end] = new_bytes
+        current_file.modified = True
+        current_file.modified_bytes.update(range(pos, end))
+        current_file.mark_pattern_range_dirty(pos, end)
+
+        self.cursor_position = min(end, file_size - 1)
 
         self.display_hex()
-        self.update_cursor_highlight()
-        self.data_inspector.update()
 
     def open_file(self):
         file_path, _ = QFileDialog.getOpenFileName(
@@ -2966,6 +3310,7 @@ class HexEditorQt(QMainWindow):
             self.signature_overlays.clear()
 
         self.current_tab_index = index
+        self._last_hover_byte = None
         if index >= 0:
             self.cursor_position = 0
             self.cursor_nibble = 0
@@ -3100,47 +3445,143 @@ class HexEditorQt(QMainWindow):
                     current_file.byte_highlights[offset + shift_amount] = info
 
     def reapply_pattern_highlights(self, current_file):
-        """Dynamically reapply pattern-based highlights by searching for patterns"""
-        # Only reapply if dirty flag is set or if this is the first time
-        if not current_file.pattern_highlights_dirty and current_file.pattern_highlights:
-            # Check if we have any pattern highlights in byte_highlights
-            has_pattern_highlights = any("pattern" in info for info in current_file.byte_highlights.values())
-            if has_pattern_highlights:
-                return  # Already applied and not dirty, skip
-
+        """Dynamically reapply pattern-based highlights by searching for patterns
+
+        A full-file rescan only happens when pattern_highlights_dirty is set (patterns
+        changed, or bytes were inserted/removed). In-place edits queue their ranges in
+        pattern_dirty_ranges and only the windows around those ranges are rescanned,
+        unless a pattern can overlap itself: then which occurrences a non-overlapping
+        scan picks near the edit depends on every match before it, so the whole file
+        is rescanned instead.
+        """
         if not current_file.pattern_highlights:
+            current_file.pattern_highlights_dirty = False
+            current_file.pattern_dirty_ranges.clear()
             return
 
-        # Clear all pattern-based highlights first
-        current_file.byte_highlights = {
-            offset: info for offset, info in current_file.byte_highlights.items()
-            if "pattern" not in info
-        }
+        if current_file.pattern_dirty_ranges and not current_file.pattern_highlights_dirty:
+            current_file.pattern_highlights_dirty = any(
+                pattern_self_overlaps(bytes(p["pattern"])) for p in current_file.pattern_highlights)
 
-        # Reapply each pattern highlight
-        file_data = current_file.file_data
-        for pattern_info in current_file.pattern_highlights:
-            pattern = pattern_info["pattern"]
-            color = pattern_info["color"]
-            message = pattern_info["message"]
-            underline = pattern_info["underline"]
-
-            pos = 0
-            while pos <= len(file_data) - len(pattern):
-                if bytes(file_data[pos:pos+len(pattern)]) == pattern:
-                    for i in range(len(pattern)):
-                        current_file.byte_highlights[pos + i] = {
-                            "color": color,
-                            "message": message,
-                            "underline": underline,
-                            "pattern": bytes(pattern)
-                        }
-                    pos += len(pattern)
-                else:
-                    pos += 1
+        if current_file.pattern_highlights_dirty:
+            # Clear all pattern-based highlights first
+            current_file.byte_highlights = {
+                offset: info for offset, info in current_file.byte_highlights.items()
+                if "pattern" not in info
+            }
+
+            # Reapply every pattern highlight across the whole file
+            self._scan_pattern_highlights(current_file, current_file.pattern_highlights,
+                                          0, len(current_file.file_data))
+
+        elif current_file.pattern_dirty_ranges:
+            file_size = len(current_file.file_data)
+            max_len = max(len(p["pattern"]) for p in current_file.pattern_highlights)
+
+            for start, end in current_file.pattern_dirty_ranges:
+                # Any match touching the edited range lies within max_len - 1 bytes of it
+                window_start = max(0, start - max_len + 1)
+                window_end = min(file_size, end + max_len - 1)
+                for offset in range(window_start, window_end):
+                    info = current_file.byte_highlights.get(offset)
+                    if info is not None and "pattern" in info:
+                        del current_file.byte_highlights[offset]
+
+                # Rescan every occurrence touching the window but stamp only the bytes inside it:
+                # owners of bytes outside the window are unchanged, and stamping them here could
+                # overwrite a later pattern's match that this window does not reach
+                for pattern_info in current_file.pattern_highlights:
+                    pattern_len = len(pattern_info["pattern"])
+                    self._scan_pattern_highlight(current_file, pattern_info,
+                                                 max(0, window_start - pattern_len + 1),
+                                                 min(file_size, window_end + pattern_len - 1),
+                                                 window_start, window_end)
 
         # Mark as clean after reapplying
         current_file.pattern_highlights_dirty = False
+        current_file.pattern_dirty_ranges.clear()
+
+    def _scan_pattern_highlight(self, current_file, pattern_info, start, end, stamp_start=None, stamp_end=None):
+        """Highlight non-overlapping occurrences of one pattern within file_data[start:end]
+
+        When stamp_start/stamp_end are given, only bytes in [stamp_start, stamp_end) are
+        highlighted. Returns the number of occurrences found.
+        """
+        pattern = bytes(pattern_info["pattern"])
+        if not pattern:
+            return 0
+
+        # One shared, read-only info dict for every byte of every match (highlight entries are never
+        # mutated in place, only replaced or deleted)
+        highlight = {
+            "color": pattern_info["color"],
+            "message": pattern_info["message"],
+            "underline": pattern_info["underline"],
+            "pattern": pattern
+        }
+
+        file_data = current_file.file_data
+        byte_highlights = current_file.byte_highlights
+        if stamp_start is None:
+            stamp_start, stamp_end = start, end
+        found_count = 0
+        pos = file_data.find(pattern, start, end)
+        while pos != -1:
+            byte_highlights.update(dict.fromkeys(
+                range(max(pos, stamp_start), min(pos + len(pattern), stamp_end)), highlight))
+            found_count += 1
+            pos = file_data.find(pattern, pos + len(pattern), end)
+        return found_count
+
+    def _scan_pattern_highlights(self, current_file, pattern_infos, start, end):
+        """Highlight the occurrences of several patterns within file_data[start:end] in one pass
+
+        The range is walked in PATTERN_SCAN_BLOCK chunks and every pattern is searched
+        while a chunk is still in cache, instead of streaming the whole file once per
+        pattern. Each pattern keeps its own non-overlapping match sequence, and matches
+        are applied in pattern order so later patterns still win where they overlap.
+        """
+        if len(pattern_infos) < 2 or end - start <= PATTERN_SCAN_BLOCK:
+            for pattern_info in pattern_infos:
+                self._scan_pattern_highlight(current_file, pattern_info, start, end)
+            return
+
+        file_data = current_file.file_data
+        patterns = [bytes(pattern_info["pattern"]) for pattern_info in pattern_infos]
+        matches = [[] for _ in patterns]
+        next_pos = [start] * len(patterns)  # Where each pattern's next match may start
+
+        for block_start in range(start, end, PATTERN_SCAN_BLOCK):
+            block_end = min(block_start + PATTERN_SCAN_BLOCK, end)
+            for i, pattern in enumerate(patterns):
+                if not pattern:
+                    continue
+                # Matches starting in this block may run up to len(pattern) - 1 bytes past it
+                search_end = min(block_end + len(pattern) - 1, end)
+                pos = file_data.find(pattern, next_pos[i], search_end)
+                while pos != -1:
+                    matches[i].append(pos)
+                    next_pos[i] = pos + len(pattern)
+                    pos = file_data.find(pattern, next_pos[i], search_end)
+                next_pos[i] = max(next_pos[i], block_end)
+
+        byte_highlights = current_file.byte_highlights
+        for pattern_info, pattern, positions in zip(pattern_infos, patterns, matches):
+            highlight = {
+                "color": pattern_info["color"],
+                "message": pattern_info["message"],
+                "underline": pattern_info["underline"],
+                "pattern": pattern
+            }
+            for pos in positions:
+                byte_highlights.update(dict.fromkeys(range(pos, pos + len(pattern)), highlight))
+
+    def update_row_char_widths(self):
+        """Recompute the fixed per-row character widths of the hex and ASCII documents"""
+        # Hex rows are "  " + "XX " * bytes_per_row with the trailing space stripped, plus "\n"
+        self._hex_row_char_width = self.bytes_per_row * 3 + 2
+        # ASCII rows are one character per byte plus "\n"
+        self._ascii_row_char_width = self.bytes_per_row + 1
 
     def display_hex(self, preserve_scroll=False):
         if self.current_tab_index < 0 or not self.open_files:
@@ -3148,10 +3589,14 @@ class HexEditorQt(QMainWindow):
 
         current_file = self.open_files[self.current_tab_index]
 
-        # Reapply pattern-based highlights dynamically
+        # Reapply pattern-based highlights (no-op unless patterns or edited ranges are dirty)
         self.reapply_pattern_highlights(current_file)
 
         file_data = current_file.file_data
+        self.update_row_char_widths()
+
+        # Rendered content may shift under the mouse, so the next hover must be handled
+        self._last_hover_byte = None
 
         # Save scroll position if preserving
         hex_scroll_pos = self.hex_display.verticalScrollBar().value() if preserve_scroll else 0
@@ -3202,14 +3647,7 @@ class HexEditorQt(QMainWindow):
             row_data = file_data[i:i + self.bytes_per_row]
 
             # Check if any bytes in this row have changes (modified, inserted, or replaced)
-            row_has_changes = False
-            for j in range(len(row_data)):
-                byte_index = i + j
-                if (byte_index in current_file.modified_bytes or
-                    byte_index in current_file.inserted_bytes or
-                    byte_index in current_file.replaced_bytes):
-                    row_has_changes = True
-                    break
+            row_has_changes = current_file.has_byte_markers(i, i + len(row_data))
 
             # Offset - centered without prefix, bold if row has changes
             if self.offset_mode == 'h':
@@ -3224,29 +3662,12 @@ class HexEditorQt(QMainWindow):
                 offset_line += " ●"  # Temporary marker for bold formatting
             offset_lines.append(offset_line)
 
-            # Hex - build plain text row with leading spaces for alignment
-            hex_row = "  "  # Add 2 leading spaces to align with header
-            for j, byte in enumerate(row_data):
-                hex_row += f"{byte:02X} "
+            # Hex - build plain text row with 2 leading spaces to align with header
+            # (incomplete rows need no padding since trailing spaces are stripped anyway)
+            hex_lines.append("  " + " ".join([HEX_BYTES[byte] for byte in row_data]))
 
-            # Pad with spaces if row is incomplete
-            if len(row_data) < self.bytes_per_row:
-                hex_row += "   " * (self.bytes_per_row - len(row_data))
-
-            hex_lines.append(hex_row.rstrip())
-
-            # ASCII - build plain text row
-            ascii_row = ""
-            for j, byte in enumerate(row_data):
-                # Show extended ASCII (160-255) always enabled
-                # Control characters (0x00-0x1F, 0x7F-0x9F) displayed as dots
-                if 32 <= byte <= 126:
-                    char = chr(byte)
-                elif 160 <= byte <= 255:
-                    char = chr(byte)
-                else:
-                    char = '.'
-                ascii_row += char
+            # ASCII - build plain text row with a single table lookup per row
+            ascii_row = row_data.translate(ASCII_DISPLAY_TABLE).decode('latin-1')
 
             # Pad with spaces if row is incomplete
             if len(row_data) < self.bytes_per_row:
@@ -3278,6 +3699,7 @@ class HexEditorQt(QMainWindow):
         self.offset_display.setPlainText(offset_text_clean)
         self.hex_display.setPlainText(hex_text)
         self.ascii_display.setPlainText(ascii_text)
+        self._format_generation += 1  # New documents carry no saved highlight
 
         # Apply color formatting to marked lines without changing size
         highlight_format = QTextCharFormat()
@@ -3306,15 +3728,13 @@ class HexEditorQt(QMainWindow):
         fmt.setAlignment(Qt.AlignCenter)
         cursor.mergeBlockFormat(fmt)
 
-        # Apply formatting after setting plain text
-        self.apply_hex_formatting(current_file)
-
         # Restore scroll position if preserving
         if preserve_scroll:
             self.hex_display.verticalScrollBar().setValue(hex_scroll_pos)
             self.offset_display.verticalScrollBar().setValue(offset_scroll_pos)
             self.ascii_display.verticalScrollBar().setValue(ascii_scroll_pos)
 
+        # Apply formatting after setting plain text (cursor/selection included)
         self.update_cursor_highlight()
         self.update_edit_box_overlay()  # Update edit box if active
         self.data_inspector.update()
@@ -3331,6 +3751,77 @@ class HexEditorQt(QMainWindow):
         if hasattr(self, 'fields_widget'):
             self.fields_widget.rebuild_tree()
 
+    def refresh_edited_bytes(self, position, count, preserve_scroll=False):
+        """Refresh the displays after count bytes were overwritten in place at position
+
+        Rewrites just the affected characters of the hex, ASCII and offset documents
+        instead of rebuilding the rendered window. An overwrite never shifts the layout,
+        so only the part of the range inside the rendered window is redrawn; falls back
+        to display_hex when that part is large.
+        """
+        if self.current_tab_index < 0 or not self.open_files:
+            return
+
+        current_file = self.open_files[self.current_tab_index]
+        file_data = current_file.file_data
+        # Clip the dirty range to the rendered rows - bytes outside it have no text yet
+        end = min(position + count, len(file_data), self.rendered_end_byte)
+        position = max(position, self.rendered_start_byte)
+
+        if end - position > INPLACE_REFRESH_MAX_BYTES:
+            self.display_hex(preserve_scroll=preserve_scroll)
+            return
+
+        self.reapply_pattern_highlights(current_file)
+
+        bytes_per_row = self.bytes_per_row
+        hex_cursor = self.hex_display.textCursor()
+        ascii_cursor = self.ascii_display.textCursor()
+        offset_cursor = self.offset_display.textCursor()
+        offset_doc = self.offset_display.document()
+
+        changed_format = QTextCharFormat()
+        changed_format.setForeground(QColor("#FF6B6B"))
+        changed_format.setFontWeight(QFont.Normal)
+
+        byte_index = position
+        while byte_index < end:
+            row_num = (byte_index - self.rendered_start_byte) // bytes_per_row
+            col_num = byte_index % bytes_per_row
+            run = min(bytes_per_row - col_num, end - byte_index)
+            run_data = file_data[byte_index:byte_index + run]
+
+            # Replace the run's hex digits (the spaces between them are unchanged)
+            hex_pos = row_num * self._hex_row_char_width + 2 + (col_num * 3)
+            hex_cursor.setPosition(hex_pos)
+            hex_cursor.setPosition(hex_pos + run * 3 - 1, QTextCursor.KeepAnchor)
+            hex_cursor.insertText(" ".join([HEX_BYTES[byte] for byte in run_data]))
+
+            ascii_pos = row_num * self._ascii_row_char_width + col_num
+            ascii_cursor.setPosition(ascii_pos)
+            ascii_cursor.setPosition(ascii_pos + run, QTextCursor.KeepAnchor)
+            ascii_cursor.insertText(run_data.translate(ASCII_DISPLAY_TABLE).decode('latin-1'))
+
+            # Recolor the row offset, as display_hex does for rows with changes
+            row_start = byte_index - col_num
+            row_has_changes = current_file.has_byte_markers(row_start, min(row_start + bytes_per_row, len(file_data)))
+            block = offset_doc.findBlockByNumber(row_num)
+            offset_cursor.setPosition(block.position())
+            offset_cursor.setPosition(block.position() + block.length() - 1, QTextCursor.KeepAnchor)
+            offset_cursor.setCharFormat(changed_format if row_has_changes else QTextCharFormat())
+
+            byte_index += run
+
+        # Same follow-up work as display_hex, minus the document rebuild
+        self.update_cursor_highlight()
+        self.update_edit_box_overlay()
+        self.data_inspector.update()
+        self.update_status()
+        self.update_tab_title()
+        self.update_signature_overlays()
+        if hasattr(self, 'fields_widget'):
+            self.fields_widget.rebuild_tree()
+
     def scroll_to_offset(self, offset, center=True):
         """Scroll the hex display to show the given offset, using proper QTextEdit scrolling"""
         if self.current_tab_index < 0 or not self.open_files:
@@ -3401,6 +3892,8 @@ class HexEditorQt(QMainWindow):
 
     def apply_hex_formatting(self, current_file):
         """Apply colors and cursor highlighting to the hex and ASCII displays - optimized"""
+        self._format_generation += 1  # Invalidates any saved inspector highlight (see highlight_bytes)
+
         # Clear all existing formatting first
         hex_cursor = self.hex_display.textCursor()
         hex_cursor.select(QTextCursor.Document)
@@ -3480,10 +3973,8 @@ class HexEditorQt(QMainWindow):
                     # Calculate display positions
                     row_num = (idx - self.rendered_start_byte) // self.bytes_per_row
                     j = idx % self.bytes_per_row
-                    hex_chars_per_row = self.bytes_per_row * 3 + 2
-                    hex_pos = row_num * hex_chars_per_row + 2 + (j * 3)
-                    ascii_chars_per_row = self.bytes_per_row + 1
-                    ascii_pos = row_num * ascii_chars_per_row + j
+                    hex_pos = row_num * self._hex_row_char_width + 2 + (j * 3)
+                    ascii_pos = row_num * self._ascii_row_char_width + j
 
                     # Apply grey color to hex display
                     hex_cursor.setPosition(hex_pos)
@@ -3495,9 +3986,12 @@ class HexEditorQt(QMainWindow):
                     ascii_cursor.movePosition(QTextCursor.Right, QTextCursor.KeepAnchor, 1)
                     ascii_cursor.mergeCharFormat(delimiter_format)
 
+        # Theme lookup reads the theme tables (including custom themes), so do it once per pass
+        dark = self.is_dark_theme()
+
         # Format for cursor
         cursor_format = QTextCharFormat()
-        if self.is_dark_theme():
+        if dark:
             cursor_format.setBackground(QColor(64, 64, 64))
         else:
             cursor_format.setBackground(QColor(200, 220, 255))
@@ -3517,38 +4011,53 @@ class HexEditorQt(QMainWindow):
 
         # Format for selection
         selection_format = QTextCharFormat()
-        if self.is_dark_theme():
+        if dark:
             selection_format.setBackground(QColor(100, 100, 150))
         else:
             selection_format.setBackground(QColor(173, 216, 230))
 
         # Helper function to calculate positions (relative to rendered window)
+        hex_row_char_width = self._hex_row_char_width
+        ascii_row_char_width = self._ascii_row_char_width
+        rendered_start_byte = self.rendered_start_byte
+        rendered_end_byte = self.rendered_end_byte
+        bytes_per_row = self.bytes_per_row
+
         def get_positions(byte_index):
             # Calculate row relative to the rendered window, not absolute file position
-            if byte_index < self.rendered_start_byte or byte_index >= self.rendered_end_byte:
+            if byte_index < rendered_start_byte or byte_index >= rendered_end_byte:
                 return None, None  # Byte is outside rendered range
-            row_num = (byte_index - self.rendered_start_byte) // self.bytes_per_row
-            j = byte_index % self.bytes_per_row
-            hex_chars_per_row = self.bytes_per_row * 3 + 2
-            hex_pos = row_num * hex_chars_per_row + 2 + (j * 3)
-            ascii_chars_per_row = self.bytes_per_row + 1
-            ascii_pos = row_num * ascii_chars_per_row + j
+            row_num = (byte_index - rendered_start_byte) // bytes_per_row
+            j = byte_index % bytes_per_row
+            hex_pos = row_num * hex_row_char_width + 2 + (j * 3)
+            ascii_pos = row_num * ascii_row_char_width + j
             return hex_pos, ascii_pos
 
-        # Collect all bytes that need formatting
+        # Collect all bytes that need formatting, limited to the rendered window (get_positions
+        # skips everything else anyway, so file-wide markers and selections needn't be expanded)
         bytes_to_format = set()
+        window_start = self.rendered_start_byte
+        window_end = min(self.rendered_end_byte, len(current_file.file_data))
+        window = range(window_start, window_end)
+
+        def add_visible(positions):
+            """Add the rendered members of a marker set or highlight dict, walking whichever is smaller"""
+            if len(positions) <= len(window):
+                bytes_to_format.update([pos for pos in positions if window_start <= pos < window_end])
+            else:
+                bytes_to_format.update([pos for pos in window if pos in positions])
 
         # Add highlighted bytes
-        bytes_to_format.update(current_file.byte_highlights.keys())
+        add_visible(current_file.byte_highlights)
 
         # Don't add signature pointer bytes to formatting (overlays handle display)
         # for pointer in self.signature_widget.pointers:
         #     bytes_to_format.update(range(pointer.offset, pointer.offset + pointer.length))
 
         # Add modified bytes
-        bytes_to_format.update(current_file.modified_bytes)
-        bytes_to_format.update(current_file.inserted_bytes)
-        bytes_to_format.update(current_file.replaced_bytes)
+        add_visible(current_file.modified_bytes)
+        add_visible(current_file.inserted_bytes)
+        add_visible(current_file.replaced_bytes)
 
         # Add cursor position
         if self.cursor_position is not None:
@@ -3568,13 +4077,12 @@ class HexEditorQt(QMainWindow):
                 max_col = max(self.column_sel_start_col, self.column_sel_end_col)
 
                 for row in range(min_row, max_row + 1):
-                    for col in range(min_col, max_col + 1):
-                        byte_index = row * self.bytes_per_row + col
-                        if byte_index < len(current_file.file_data):
-                            bytes_to_format.add(byte_index)
+                    row_start = row * self.bytes_per_row
+                    bytes_to_format.update(range(max(row_start + min_col, window_start),
+                                                 min(row_start + max_col + 1, window_end)))
             else:
                 # Normal linear selection
-                bytes_to_format.update(range(sel_start, sel_end + 1))
+                bytes_to_format.update(range(max(sel_start, window_start), min(sel_end + 1, window_end)))
 
         # Only format bytes that need it
         for byte_index in bytes_to_format:
@@ -3946,12 +4454,14 @@ class HexEditorQt(QMainWindow):
                     # Snap to start boundary
                     byte_in_row = self.boundary_start_col
                     byte_index = absolute_row * self.bytes_per_row + byte_in_row
-                    print(f"Click on column {clicked_col} snapped to start boundary {self.boundary_start_col}")
+                    if self.debug_redirector:
+                        print(f"Click on column {clicked_col} snapped to start boundary {self.boundary_start_col}")
                 elif clicked_col > self.boundary_end_col:
                     # Snap to end boundary
                     byte_in_row = self.boundary_end_col
                     byte_index = absolute_row * self.bytes_per_row + byte_in_row
-                    print(f"Click on column {clicked_col} snapped to end boundary {self.boundary_end_col}")
+                    if self.debug_redirector:
+                        print(f"Click on column {clicked_col} snapped to end boundary {self.boundary_end_col}")
 
             # Check if edit box is active and byte is outside the edit box range
             if self.edit_box_active and (byte_index < self.edit_box_start or byte_index > self.edit_box_end):
@@ -3959,7 +4469,8 @@ class HexEditorQt(QMainWindow):
                 self.edit_box_active = False
                 if hasattr(self, 'edit_box_overlay'):
                     self.edit_box_overlay.clear_edit_box()
-                print(f"Edit box deactivated - clicked byte {byte_index} outside range [{self.edit_box_start}, {self.edit_box_end}]")
+                if self.debug_redirector:
+                    print(f"Edit box deactivated - clicked byte {byte_index} outside range [{self.edit_box_start}, {self.edit_box_end}]")
 
             self.cursor_position = byte_index
             # Always start at the first nibble (high nibble) of the byte
@@ -3973,7 +4484,8 @@ class HexEditorQt(QMainWindow):
                 self.column_sel_start_col = byte_in_row
                 self.column_sel_end_row = absolute_row
                 self.column_sel_end_col = byte_in_row
-                print(f"Column selection started: row={absolute_row}, col={byte_in_row}")
+                if self.debug_redirector:
+                    print(f"Column selection started: row={absolute_row}, col={byte_in_row}")
             else:
                 # Normal selection mode
                 self.column_selection_mode = False
@@ -3986,7 +4498,9 @@ class HexEditorQt(QMainWindow):
             self.selection_start = byte_index
             self.selection_end = byte_index
 
-            print(f"Hex click: line={line}, col={col}, byte_in_row={byte_in_row}, byte_index={byte_index}")
+            # Only trace clicks while the debugging console is capturing output
+            if self.debug_redirector:
+                print(f"Hex click: line={line}, col={col}, byte_in_row={byte_in_row}, byte_index={byte_index}")
             # Just update cursor/selection highlighting, don't redraw everything
             self.update_cursor_highlight()
             self.data_inspector.update()
@@ -4024,12 +4538,14 @@ class HexEditorQt(QMainWindow):
                     # Snap to start boundary
                     col = self.boundary_start_col
                     byte_index = absolute_row * self.bytes_per_row + col
-                    print(f"ASCII click on column snapped to start boundary {self.boundary_start_col}")
+                    if self.debug_redirector:
+                        print(f"ASCII click on column snapped to start boundary {self.boundary_start_col}")
                 elif col > self.boundary_end_col:
                     # Snap to end boundary
                     col = self.boundary_end_col
                     byte_index = absolute_row * self.bytes_per_row + col
-                    print(f"ASCII click on column snapped to end boundary {self.boundary_end_col}")
+                    if self.debug_redirector:
+                        print(f"ASCII click on column snapped to end boundary {self.boundary_end_col}")
 
             self.cursor_position = byte_index
             self.cursor_nibble = 0
@@ -4042,7 +4558,8 @@ class HexEditorQt(QMainWindow):
                 self.column_sel_start_col = col
                 self.column_sel_end_row = absolute_row
                 self.column_sel_end_col = col
-                print(f"Column selection started: row={absolute_row}, col={col}")
+                if self.debug_redirector:
+                    print(f"Column selection started: row={absolute_row}, col={col}")
             else:
                 # Normal selection mode
                 self.column_selection_mode = False
@@ -4055,7 +4572,9 @@ class HexEditorQt(QMainWindow):
             self.selection_start = byte_index
             self.selection_end = byte_index
 
-            print(f"ASCII click: line={line}, col={col}, byte_index={byte_index}, cursor_pos={self.cursor_position}")
+            # Only trace clicks while the debugging console is capturing output
+            if self.debug_redirector:
+                print(f"ASCII click: line={line}, col={col}, byte_index={byte_index}, cursor_pos={self.cursor_position}")
             # Just update cursor/selection highlighting, don't redraw everything
             self.update_cursor_highlight()
             self.data_inspector.update()
@@ -4083,6 +4602,12 @@ class HexEditorQt(QMainWindow):
             absolute_row = start_row + line
             byte_index = absolute_row * self.bytes_per_row + byte_col
 
+            # Nothing to do while hovering over the same byte without dragging
+            hover_key = ('hex', byte_index)
+            if hover_key == self._last_hover_byte and not (event.buttons() & Qt.LeftButton):
+                return
+            self._last_hover_byte = hover_key
+
             # Handle drag selection - check if left mouse button is pressed
             if event.buttons() & Qt.LeftButton:
                 if self.selection_start is not None and byte_index < len(current_file.file_data):
@@ -4100,14 +4625,15 @@ class HexEditorQt(QMainWindow):
                         # Set selection bounds to encompass the column range
                         self.selection_start = min_row * self.bytes_per_row + min_col
                         self.selection_end = max_row * self.bytes_per_row + max_col
-                        print(f"Column drag: rows {min_row}-{max_row}, cols {min_col}-{max_col}")
+                        # Drag events are frequent; only trace them into the debugging console
+                        if self.debug_redirector:
+                            print(f"Column drag: rows {min_row}-{max_row}, cols {min_col}-{max_col}")
                     else:
                         # Normal linear selection
                         self.selection_end = byte_index
 
                     self.cursor_position = byte_index
-                    self.display_hex(preserve_scroll=True)
-                    self.update_status()
+                    self.schedule_drag_render()
 
             # Show tooltip for highlighted bytes
             if byte_index in current_file.byte_highlights and byte_index < len(current_file.file_data):
@@ -4138,6 +4664,12 @@ class HexEditorQt(QMainWindow):
             absolute_row = start_row + line
             byte_index = absolute_row * self.bytes_per_row + col
 
+            # Nothing to do while hovering over the same byte without dragging
+            hover_key = ('ascii', byte_index)
+            if hover_key == self._last_hover_byte and not (event.buttons() & Qt.LeftButton):
+                return
+            self._last_hover_byte = hover_key
+
             # Handle drag selection - check if left mouse button is pressed
             if event.buttons() & Qt.LeftButton:
                 if self.selection_start is not None and byte_index < len(current_file.file_data):
@@ -4155,14 +4687,15 @@ class HexEditorQt(QMainWindow):
                         # Set selection bounds to encompass the column range
                         self.selection_start = min_row * self.bytes_per_row + min_col
                         self.selection_end = max_row * self.bytes_per_row + max_col
-                        print(f"Column drag: rows {min_row}-{max_row}, cols {min_col}-{max_col}")
+                        # Drag events are frequent; only trace them into the debugging console
+                        if self.debug_redirector:
+                            print(f"Column drag: rows {min_row}-{max_row}, cols {min_col}-{max_col}")
                     else:
                         # Normal linear selection
                         self.selection_end = byte_index
 
                     self.cursor_position = byte_index
-                    self.display_hex(preserve_scroll=True)
-                    self.update_status()
+                    self.schedule_drag_render()
 
             # Show tooltip for highlighted bytes
             if byte_index in current_file.byte_highlights and byte_index < len(current_file.file_data):
@@ -4174,6 +4707,25 @@ class HexEditorQt(QMainWindow):
             else:
                 QToolTip.hideText()
 
+    def schedule_drag_render(self):
+        """Queue a single re-render for drag selection, however many mouse moves arrive before it runs"""
+        if not self._drag_render_pending:
+            self._drag_render_pending = True
+            QTimer.singleShot(0, self._flush_drag_render)
+
+    def _flush_drag_render(self):
+        self._drag_render_pending = False
+        if self.current_tab_index < 0:
+            return
+        # Dragging only moves the cursor and selection; while the cursor stays in the
+        # rendered window the text is unchanged, so re-apply formatting instead of re-rendering
+        if self.rendered_start_byte <= self.cursor_position < self.rendered_end_byte:
+            self.update_cursor_highlight()
+            self.data_inspector.update()
+        else:
+            self.display_hex(preserve_scroll=True)
+        self.update_status()
+
     def on_hex_right_click(self, event):
         menu = QMenu(self)
 
@@ -4262,10 +4814,9 @@ class HexEditorQt(QMainWindow):
         # Don't sync nav scrollbar if we're in the middle of handling a nav scroll event
         # (prevents feedback loop that causes scrollbar to jump)
         if not self.in_nav_scroll:
-            # Sync navigation scrollbar (block signals to prevent loop)
-            self.hex_nav_scrollbar.blockSignals(True)
-            self.hex_nav_scrollbar.setValue(value)
-            self.hex_nav_scrollbar.blockSignals(False)
+            # Sync navigation scrollbar (block signals to prevent loop; unblocked even if setValue raises)
+            with QSignalBlocker(self.hex_nav_scrollbar):
+                self.hex_nav_scrollbar.setValue(value)
 
     def on_nav_scroll(self, value):
         """Handle navigation scrollbar changes - represents full file, not just rendered portion"""
@@ -4323,19 +4874,18 @@ class HexEditorQt(QMainWindow):
         file_data = current_file.file_data
         total_rows = (len(file_data) + self.bytes_per_row - 1) // self.bytes_per_row
 
-        self.hex_nav_scrollbar.blockSignals(True)
-        # Set range to represent full file (0 to total_rows in pixel units)
-        # Use a large range for smooth scrolling
-        total_pixels = total_rows * 100  # Arbitrary multiplier for smooth scrolling
-        self.hex_nav_scrollbar.setRange(0, total_pixels)
+        with QSignalBlocker(self.hex_nav_scrollbar):
+            # Set range to represent full file (0 to total_rows in pixel units)
+            # Use a large range for smooth scrolling
+            total_pixels = total_rows * 100  # Arbitrary multiplier for smooth scrolling
+            self.hex_nav_scrollbar.setRange(0, total_pixels)
 
-        # Set page step based on visible rows
-        viewport_height = self.hex_display.viewport().height()
-        line_height = self.hex_display.fontMetrics().height()
-        visible_rows = viewport_height // line_height if line_height > 0 else 20
-        page_step = (visible_rows / total_rows * total_pixels) if total_rows > 0 else 100
-        self.hex_nav_scrollbar.setPageStep(int(page_step))
-        self.hex_nav_scrollbar.blockSignals(False)
+            # Set page step based on visible rows
+            viewport_height = self.hex_display.viewport().height()
+            line_height = self.hex_display.fontMetrics().height()
+            visible_rows = viewport_height // line_height if line_height > 0 else 20
+            page_step = (visible_rows / total_rows * total_pixels) if total_rows > 0 else 100
+            self.hex_nav_scrollbar.setPageStep(int(page_step))
 
         # Update scrollbar position to reflect current_top_row
         self.update_nav_scrollbar_position()
@@ -4358,9 +4908,8 @@ class HexEditorQt(QMainWindow):
             ratio = self.current_top_row / total_rows
             new_value = int(ratio * max_scroll)
 
-            self.hex_nav_scrollbar.blockSignals(True)
-            self.hex_nav_scrollbar.setValue(new_value)
-            self.hex_nav_scrollbar.blockSignals(False)
+            with QSignalBlocker(self.hex_nav_scrollbar):
+                self.hex_nav_scrollbar.setValue(new_value)
 
     # NOTE: update_data_inspector, clear_inspector, and update_bytes_from_inspector
     # have been moved to the datainspect.DataInspector class.
@@ -4369,6 +4918,7 @@ class HexEditorQt(QMainWindow):
 
     def update_status(self):
         if self.current_tab_index < 0:
+            self._last_status_key = None
             self.status_label.setText("Ready")
             return
 
@@ -4387,6 +4937,13 @@ class HexEditorQt(QMainWindow):
             else:
                 byte_status = " [Original]"
 
+        # Skip rebuilding the label when nothing it shows has changed (e.g. held arrow keys at a boundary)
+        status_key = (current_file.file_path, file_size, self.cursor_position, byte_status,
+                      self.rendered_start_byte, self.rendered_end_byte, self.bytes_per_row, self.max_initial_rows)
+        if status_key == self._last_status_key:
+            return
+        self._last_status_key = status_key
+
         status = f"File: {os.path.basename(current_file.file_path)} | Size: {file_size} bytes"
         if self.cursor_position is not None:
             status += f" | Offset: 0x{self.cursor_position:X}"
@@ -4638,6 +5195,7 @@ class HexEditorQt(QMainWindow):
                             self.display_hex(preserve_scroll=True)
 
                             # Show info in status bar
+                            self._last_status_key = None  # The next update_status must overwrite this message
                             self.status_label.setText(
                                 f"Segment: 0x{segment_start:X} - 0x{segment_end:X} ({segment_length} bytes)"
                             )
@@ -4704,6 +5262,7 @@ class HexEditorQt(QMainWindow):
                         for i, byte in enumerate(new_bytes):
                             if pointer.offset + i < len(file_data):
                                 file_data[pointer.offset + i] = byte
+                        current_file.mark_pattern_range_dirty(pointer.offset, min(pointer.offset + len(new_bytes), len(file_data)))
 
                         # Re-interpret the value
                         pointer.value = self.signature_widget.interpret_value(
@@ -4730,11 +5289,12 @@ class HexEditorQt(QMainWindow):
                     # Save undo state
                     self.save_undo_state()
 
-                    # Update file data
-                    for i, byte in enumerate(new_bytes):
-                        if pointer.offset + i < len(file_data):
-                            file_data[pointer.offset + i] = byte
-                            current_file.modified_bytes.add(pointer.offset + i)
+                    # Update file data and mark it in one slice each (bytes past the end are dropped)
+                    end = min(pointer.offset + len(new_bytes), len(file_data))
+                    if end > pointer.offset:
+                        file_data[pointer.offset:end] = new_bytes[:end - pointer.offset]
+                        current_file.modified_bytes.update(range(pointer.offset, end))
+                        current_file.mark_pattern_range_dirty(pointer.offset, end)
 
                     # Mark file as modified
                     current_file.modified = True
@@ -4867,27 +5427,7 @@ class HexEditorQt(QMainWindow):
 
     def format_integral(self, value, num_digits=None, signed=False):
         """Format an integral value based on current basis setting."""
-        if self.integral_basis == 'hex':
-            if signed and value < 0:
-                # For signed negative values, convert to unsigned representation
-                if num_digits == 2:
-                    value = value & 0xFF
-                elif num_digits == 4:
-                    value = value & 0xFFFF
-                elif num_digits == 6:
-                    value = value & 0xFFFFFF
-                elif num_digits == 8:
-                    value = value & 0xFFFFFFFF
-                elif num_digits == 16:
-                    value = value & 0xFFFFFFFFFFFFFFFF
-            if num_digits:
-                return f"0x{value:0{num_digits}X}"
-            else:
-                return f"0x{value:X}"
-        elif self.integral_basis == 'oct':
-            return f"0o{value:o}"
-        else:  # dec
-            return str(value)
+        return format_integral(value, self.integral_basis, num_digits, signed)
 
     def on_basis_changed(self, basis_type):
         """Handle basis checkbox changes - ensure only one is selected at a time."""
@@ -4921,8 +5461,9 @@ class HexEditorQt(QMainWindow):
 
     def highlight_bytes(self, start_pos, byte_count):
         """Highlight a range of bytes in the hex and ASCII displays"""
-        print(f"DEBUG highlight_bytes: start_pos={start_pos} (0x{start_pos:X}), byte_count={byte_count}")
-        print(f"  Will highlight bytes 0x{start_pos:X} through 0x{start_pos + byte_count - 1:X}")
+        if self.debug_redirector:
+            print(f"DEBUG highlight_bytes: start_pos={start_pos} (0x{start_pos:X}), byte_count={byte_count}")
+            print(f"  Will highlight bytes 0x{start_pos:X} through 0x{start_pos + byte_count - 1:X}")
 
         if self.current_tab_index < 0 or not self.open_files:
             return
@@ -4933,51 +5474,67 @@ class HexEditorQt(QMainWindow):
         if start_pos < 0 or start_pos >= len(file_data):
             return
 
-        # Clear all existing formatting first
-        hex_cursor = self.hex_display.textCursor()
-        hex_cursor.select(QTextCursor.Document)
-        hex_cursor.setCharFormat(QTextCharFormat())
-        hex_cursor.clearSelection()
-
-        ascii_cursor = self.ascii_display.textCursor()
-        ascii_cursor.select(QTextCursor.Document)
-        ascii_cursor.setCharFormat(QTextCharFormat())
-        ascii_cursor.clearSelection()
-
-        # Apply formatting
-        self.apply_hex_formatting(current_file)
+        # Put back the formatting under the previous highlight if it is still on screen. Any
+        # apply_hex_formatting pass since then has already repainted those characters.
+        if self._last_highlight and self._last_highlight[0] == self._format_generation:
+            self.restore_char_formats(self.hex_display, self._last_highlight[1])
+            self.restore_char_formats(self.ascii_display, self._last_highlight[2])
+        self._last_highlight = None
 
         # Highlight format for inspector selection (blue)
         highlight_format = QTextCharFormat()
         highlight_format.setBackground(QColor(50, 100, 200))
 
-        # Highlight the range
-        for i in range(byte_count):
-            byte_index = start_pos + i
-            if byte_index >= len(file_data):
-                break
-
-            row_num = byte_index // self.bytes_per_row
-            col_num = byte_index % self.bytes_per_row
+        # Highlight the range with one selection per row and display, clipped to the rendered window
+        bytes_per_row = self.bytes_per_row
+        first = max(start_pos, self.rendered_start_byte)
+        last = min(start_pos + byte_count, len(file_data), self.rendered_end_byte)  # Exclusive
 
-            # Highlight in hex display (only the 2 hex digits, not the trailing space)
-            hex_chars_per_row = self.bytes_per_row * 3 + 2
-            hex_pos = row_num * hex_chars_per_row + 2 + (col_num * 3)
-
-            hex_cursor = self.hex_display.textCursor()
+        hex_cursor = self.hex_display.textCursor()
+        ascii_cursor = self.ascii_display.textCursor()
+        saved_hex = []
+        saved_ascii = []
+
+        byte_index = first
+        while byte_index < last:
+            row_num = (byte_index - self.rendered_start_byte) // bytes_per_row
+            col_num = byte_index % bytes_per_row
+            run = min(bytes_per_row - col_num, last - byte_index)
+
+            # Highlight in hex display (from the first hex digit to the last, not the trailing space)
+            hex_pos = row_num * self._hex_row_char_width + 2 + (col_num * 3)
+            saved_hex.extend(self.save_char_formats(hex_cursor, hex_pos, hex_pos + run * 3 - 1))
             hex_cursor.setPosition(hex_pos)
-            hex_cursor.setPosition(hex_pos + 2, QTextCursor.KeepAnchor)
+            hex_cursor.setPosition(hex_pos + run * 3 - 1, QTextCursor.KeepAnchor)
             hex_cursor.setCharFormat(highlight_format)
 
             # Highlight in ASCII display
-            ascii_chars_per_row = self.bytes_per_row
-            ascii_pos = row_num * ascii_chars_per_row + col_num
-
-            ascii_cursor = self.ascii_display.textCursor()
+            ascii_pos = row_num * self._ascii_row_char_width + col_num
+            saved_ascii.extend(self.save_char_formats(ascii_cursor, ascii_pos, ascii_pos + run))
             ascii_cursor.setPosition(ascii_pos)
-            ascii_cursor.setPosition(ascii_pos + 1, QTextCursor.KeepAnchor)
+            ascii_cursor.setPosition(ascii_pos + run, QTextCursor.KeepAnchor)
             ascii_cursor.setCharFormat(highlight_format)
 
+            byte_index += run
+
+        self._last_highlight = (self._format_generation, saved_hex, saved_ascii)
+
+    def save_char_formats(self, cursor, start, end):
+        """Return (position, format) pairs for the characters in start..end of a display"""
+        formats = []
+        for pos in range(start, end):
+            cursor.setPosition(pos + 1)  # charFormat() reports the character before the cursor
+            formats.append((pos, cursor.charFormat()))
+        return formats
+
+    def restore_char_formats(self, display, formats):
+        """Re-apply formats captured by save_char_formats"""
+        cursor = display.textCursor()
+        for pos, char_format in formats:
+            cursor.setPosition(pos)
+            cursor.setPosition(pos + 1, QTextCursor.KeepAnchor)
+            cursor.setCharFormat(char_format)
+
     def cycle_offset_mode(self, event):
         """Cycle through hex -> decimal -> octal offset modes"""
         modes = ['h', 'd', 'o']
@@ -4992,18 +5549,41 @@ class HexEditorQt(QMainWindow):
         self.display_hex()
 
     def save_undo_state(self):
+        """Record an undo step holding a full copy of the current file data"""
         if self.current_tab_index < 0:
             return
 
         current_file = self.open_files[self.current_tab_index]
-        state = {
-            'data': bytearray(current_file.file_data),
-            'modified_bytes': set(current_file.modified_bytes),
-            'inserted_bytes': set(current_file.inserted_bytes),
-            'replaced_bytes': set(current_file.replaced_bytes),
-            'byte_highlights': dict(current_file.byte_highlights),
-            'pattern_highlights': list(current_file.pattern_highlights)
-        }
+        state = self.capture_marker_state(current_file)
+        state['data'] = bytearray(current_file.file_data)
+        self.push_undo_state(state)
+
+    def save_undo_delta(self, position, old_bytes, new_length=None):
+        """Record an undo step for an edit that replaced old_bytes at position
+
+        Only the touched range is stored, so small edits don't copy the whole file.
+        new_length is the size of the range after the edit (defaults to an in-place
+        overwrite of the same size; 0 for a deletion). Must be called before the
+        edit's marker changes, like save_undo_state.
+        """
+        if self.current_tab_index < 0:
+            return
+
+        current_file = self.open_files[self.current_tab_index]
+        state = self.capture_marker_state(current_file)
+        state['position'] = position
+        state['old_bytes'] = bytes(old_bytes)
+        state['new_length'] = len(old_bytes) if new_length is None else new_length
+        self.push_undo_state(state)
+
+    def capture_marker_state(self, current_file):
+        """Copy the edit markers and highlights that an undo step restores
+
+        All five copies go into one 'markers' tuple, in UNDO_MARKER_ATTRS order.
+        """
+        return {'markers': tuple(getattr(current_file, name).copy() for name in UNDO_MARKER_ATTRS)}
+
+    def push_undo_state(self, state):
         self.undo_stack.append(state)
         self.redo_stack.clear()
 
@@ -5014,35 +5594,41 @@ class HexEditorQt(QMainWindow):
         # Schedule snapshot creation after edit
         self.schedule_snapshot()
 
+    def apply_undo_state(self, current_file, state):
+        """Restore an undo/redo step and return the step that reverses it"""
+        reverse_state = self.capture_marker_state(current_file)
+
+        if 'data' in state:
+            # Full snapshot
+            reverse_state['data'] = bytearray(current_file.file_data)
+            current_file.file_data = state['data']
+        else:
+            # Delta: swap the recorded bytes back into the edited range
+            position = state['position']
+            end = position + state['new_length']
+            reverse_state['position'] = position
+            reverse_state['old_bytes'] = bytes(current_file.file_data[position:end])
+            reverse_state['new_length'] = len(state['old_bytes'])
+            current_file.file_data[position:end] = state['old_bytes']
+
+        (current_file.modified_bytes, current_file.inserted_bytes, current_file.replaced_bytes,
+         current_file.byte_highlights, current_file.pattern_highlights) = state['markers']
+        current_file.modified = bool(current_file.modified_bytes or current_file.inserted_bytes or current_file.replaced_bytes)
+        current_file.pattern_highlights_dirty = True  # Mark pattern highlights for reapplication
+
+        return reverse_state
+
     def undo(self):
         if not self.undo_stack or self.current_tab_index < 0:
             return
 
         current_file = self.open_files[self.current_tab_index]
 
-        # Save current state to redo stack
-        current_state = {
-            'data': bytearray(current_file.file_data),
-            'modified_bytes': set(current_file.modified_bytes),
-            'inserted_bytes': set(current_file.inserted_bytes),
-            'replaced_bytes': set(current_file.replaced_bytes),
-            'byte_highlights': dict(current_file.byte_highlights),
-            'pattern_highlights': list(current_file.pattern_highlights)
-        }
-        self.redo_stack.append(current_state)
-
-        # Restore previous state
+        # Restore previous state, saving the current one to the redo stack
         state = self.undo_stack.pop()
-        current_file.file_data = state['data']
-        current_file.modified_bytes = state['modified_bytes']
-        current_file.inserted_bytes = state['inserted_bytes']
-        current_file.replaced_bytes = state.get('replaced_bytes', set())
-        current_file.byte_highlights = state.get('byte_highlights', {})
-        current_file.pattern_highlights = state.get('pattern_highlights', [])
-        current_file.modified = len(state['modified_bytes']) > 0 or len(state['inserted_bytes']) > 0 or len(current_file.replaced_bytes) > 0
-        current_file.pattern_highlights_dirty = True  # Mark pattern highlights for reapplication after undo
+        self.redo_stack.append(self.apply_undo_state(current_file, state))
 
-        self.display_hex()
+        self.refresh_after_undo_state(state)
 
     def redo(self):
         if not self.redo_stack or self.current_tab_index < 0:
@@ -5050,29 +5636,18 @@ class HexEditorQt(QMainWindow):
 
         current_file = self.open_files[self.current_tab_index]
 
-        # Save current state to undo stack
-        current_state = {
-            'data': bytearray(current_file.file_data),
-            'modified_bytes': set(current_file.modified_bytes),
-            'inserted_bytes': set(current_file.inserted_bytes),
-            'replaced_bytes': set(current_file.replaced_bytes),
-            'byte_highlights': dict(current_file.byte_highlights),
-            'pattern_highlights': list(current_file.pattern_highlights)
-        }
-        self.undo_stack.append(current_state)
-
-        # Restore redo state
+        # Restore redo state, saving the current one to the undo stack
         state = self.redo_stack.pop()
-        current_file.file_data = state['data']
-        current_file.modified_bytes = state['modified_bytes']
-        current_file.inserted_bytes = state['inserted_bytes']
-        current_file.replaced_bytes = state.get('replaced_bytes', set())
-        current_file.byte_highlights = state.get('byte_highlights', {})
-        current_file.pattern_highlights = state.get('pattern_highlights', [])
-        current_file.modified = len(state['modified_bytes']) > 0 or len(state['inserted_bytes']) > 0 or len(current_file.replaced_bytes) > 0
-        current_file.pattern_highlights_dirty = True  # Mark pattern highlights for reapplication after redo
+        self.undo_stack.append(self.apply_undo_state(current_file, state))
 
-        self.display_hex()
+        self.refresh_after_undo_state(state)
+
+    def refresh_after_undo_state(self, state):
+        """Redraw after apply_undo_state, patching in place for same-size deltas"""
+        if 'data' not in state and state['new_length'] == len(state['old_bytes']):
+            self.refresh_edited_bytes(state['position'], state['new_length'])
+        else:
+            self.display_hex()
 
     def show_file_size_warning(self, parent, num_bytes, is_increase):
         """Show file size change warning with checkbox to ignore future warnings"""
@@ -5164,8 +5739,9 @@ class HexEditorQt(QMainWindow):
         if self.clipboard:
             system_clipboard = QApplication.clipboard()
             # Copy as hex string for easy viewing/pasting
-            hex_string = ' '.join(f'{b:02X}' for b in self.clipboard)
+            hex_string = self.clipboard.hex(' ').upper()
             system_clipboard.setText(hex_string)
+            self.clipboard_text = hex_string  # Lets get_paste_data recognize our own copy
 
     def cut(self):
         if self.current_tab_index < 0:
@@ -5214,49 +5790,31 @@ class HexEditorQt(QMainWindow):
                 # Sort in reverse order to delete from end to beginning
                 positions_to_remove.sort(reverse=True)
 
-                # Track cumulative shift for each deletion
-                for idx, pos in enumerate(positions_to_remove):
-                    # Calculate how many positions were already removed before this one
-                    shift_amount = idx
-
-                    # Shift markers after this position
-                    old_modified = set(current_file.modified_bytes)
-                    old_inserted = set(current_file.inserted_bytes)
-                    old_replaced = set(current_file.replaced_bytes)
-
-                    current_file.modified_bytes.clear()
-                    current_file.inserted_bytes.clear()
-                    current_file.replaced_bytes.clear()
-
-                    for p in old_modified:
-                        if p < pos:
-                            current_file.modified_bytes.add(p)
-                        elif p > pos:
-                            current_file.modified_bytes.add(p - 1)
-
-                    for p in old_inserted:
-                        if p < pos:
-                            current_file.inserted_bytes.add(p)
-                        elif p > pos:
-                            current_file.inserted_bytes.add(p - 1)
-
-                    for p in old_replaced:
-                        if p < pos:
-                            current_file.replaced_bytes.add(p)
-                        elif p > pos:
-                            current_file.replaced_bytes.add(p - 1)
+                # Remove and shift the edit markers for all cut positions in one pass
+                current_file.delete_byte_markers_at(positions_to_remove[::-1])
+
+                # Each row's cut columns are one contiguous run: shift and delete a run at a time,
+                # bottom row first, so every row costs one memmove instead of one per byte
+                file_len = len(current_file.file_data)
+                for row in range(max_row, min_row - 1, -1):
+                    run_start = row * self.bytes_per_row + min_col
+                    run_end = min(row * self.bytes_per_row + max_col + 1, file_len)
+                    if run_start >= run_end:
+                        continue
+                    run_len = run_end - run_start
 
                     # Shift highlights and labels
-                    self.shift_non_pattern_highlights(current_file, pos, -1)
-                    self.shift_pattern_labels(current_file, pos, -1)
-                    self.shift_signature_pointers(pos, -1)
+                    self.shift_non_pattern_highlights(current_file, run_start, -run_len)
+                    self.shift_pattern_labels(current_file, run_start, -run_len)
+                    self.shift_signature_pointers(run_start, -run_len)
 
-                    # Adjust fields
+                    # Adjust fields (byte by byte, as field ranges treat partial overlaps per byte)
                     if hasattr(self, 'fields_widget'):
-                        self.fields_widget.adjust_for_delete(pos, 1, self.current_tab_index)
+                        for pos in range(run_end - 1, run_start - 1, -1):
+                            self.fields_widget.adjust_for_delete(pos, 1, self.current_tab_index)
 
-                    # Delete the byte
-                    del current_file.file_data[pos]
+                    # Delete the run
+                    del current_file.file_data[run_start:run_end]
 
                 current_file.modified = True
                 current_file.pattern_highlights_dirty = True
@@ -5282,38 +5840,11 @@ class HexEditorQt(QMainWindow):
                 self.clipboard_grid_rows = None
                 self.clipboard_grid_cols = None
 
-                # Then remove the bytes
-                self.save_undo_state()
+                # Then remove the bytes (undo only needs the removed range back)
+                self.save_undo_delta(start, current_file.file_data[start:end + 1], 0)
 
                 # Shift all markers: remove markers in the cut range and shift markers after
-                old_modified = set(current_file.modified_bytes)
-                old_inserted = set(current_file.inserted_bytes)
-                old_replaced = set(current_file.replaced_bytes)
-
-                current_file.modified_bytes.clear()
-                current_file.inserted_bytes.clear()
-                current_file.replaced_bytes.clear()
-
-                for pos in old_modified:
-                    if pos < start:
-                        current_file.modified_bytes.add(pos)
-                    elif pos > end:
-                        current_file.modified_bytes.add(pos - num_bytes)
-                    # Positions within [start, end] are removed
-
-                for pos in old_inserted:
-                    if pos < start:
-                        current_file.inserted_bytes.add(pos)
-                    elif pos > end:
-                        current_file.inserted_bytes.add(pos - num_bytes)
-                    # Positions within [start, end] are removed
-
-                for pos in old_replaced:
-                    if pos < start:
-                        current_file.replaced_bytes.add(pos)
-                    elif pos > end:
-                        current_file.replaced_bytes.add(pos - num_bytes)
-                    # Positions within [start, end] are removed
+                current_file.delete_byte_markers(start, num_bytes)
 
                 # Shift non-pattern highlights
                 self.shift_non_pattern_highlights(current_file, start, -num_bytes)
@@ -5348,37 +5879,10 @@ class HexEditorQt(QMainWindow):
             self.clipboard_grid_rows = None
             self.clipboard_grid_cols = None
 
-            self.save_undo_state()
+            self.save_undo_delta(self.cursor_position, current_file.file_data[self.cursor_position:self.cursor_position + 1], 0)
 
             # Shift all markers: remove marker at cursor position and shift markers after
-            old_modified = set(current_file.modified_bytes)
-            old_inserted = set(current_file.inserted_bytes)
-            old_replaced = set(current_file.replaced_bytes)
-
-            current_file.modified_bytes.clear()
-            current_file.inserted_bytes.clear()
-            current_file.replaced_bytes.clear()
-
-            for pos in old_modified:
-                if pos < self.cursor_position:
-                    current_file.modified_bytes.add(pos)
-                elif pos > self.cursor_position:
-                    current_file.modified_bytes.add(pos - 1)
-                # Position at cursor is removed
-
-            for pos in old_inserted:
-                if pos < self.cursor_position:
-                    current_file.inserted_bytes.add(pos)
-                elif pos > self.cursor_position:
-                    current_file.inserted_bytes.add(pos - 1)
-                # Position at cursor is removed
-
-            for pos in old_replaced:
-                if pos < self.cursor_position:
-                    current_file.replaced_bytes.add(pos)
-                elif pos > self.cursor_position:
-                    current_file.replaced_bytes.add(pos - 1)
-                # Position at cursor is removed
+            current_file.delete_byte_markers(self.cursor_position, 1)
 
             # Shift non-pattern highlights
             self.shift_non_pattern_highlights(current_file, self.cursor_position, -1)
@@ -5402,8 +5906,9 @@ class HexEditorQt(QMainWindow):
         # Also copy to system clipboard as hex string
         if self.clipboard:
             system_clipboard = QApplication.clipboard()
-            hex_string = ' '.join(f'{b:02X}' for b in self.clipboard)
+            hex_string = self.clipboard.hex(' ').upper()
             system_clipboard.setText(hex_string)
+            self.clipboard_text = hex_string  # Lets get_paste_data recognize our own copy
 
     def get_paste_data(self):
         """Get paste data from system clipboard or internal clipboard.
@@ -5413,13 +5918,17 @@ class HexEditorQt(QMainWindow):
         system_clipboard = QApplication.clipboard()
         clipboard_text = system_clipboard.text().strip()
 
+        if clipboard_text and clipboard_text == self.clipboard_text:
+            # Still the text our last copy/cut put there: reuse the bytes instead of re-parsing them
+            return self.clipboard
+
         if clipboard_text:
             # Try to parse as hex data first
             # Remove common separators
             hex_clean = clipboard_text.replace(' ', '').replace(':', '').replace('-', '').replace(',', '')
 
             # Check if it looks like hex (all chars are 0-9, A-F, a-f)
-            if all(c in '0123456789ABCDEFabcdef' for c in hex_clean):
+            if not hex_clean.translate(HEX_DIGIT_DELETE_TABLE):
                 # Must be even number of characters for valid hex
                 if len(hex_clean) % 2 == 0:
                     try:
@@ -5453,6 +5962,7 @@ class HexEditorQt(QMainWindow):
             return
 
         current_file = self.open_files[self.current_tab_index]
+        patch_count = 0  # Set by the linear overwrite paths, which keep the row layout
 
         # Check if pasting over a selection
         if self.selection_start is not None and self.selection_end is not None:
@@ -5638,9 +6148,8 @@ class HexEditorQt(QMainWindow):
                 # Check if clipboard has grid structure to preserve it
                 paste_position = sel_start
 
-                self.save_undo_state()
-
                 if self.clipboard_grid_rows is not None and self.clipboard_grid_cols is not None:
+                    self.save_undo_state()
                     # Preserve grid structure during paste
                     src_rows = self.clipboard_grid_rows
                     src_cols = self.clipboard_grid_cols
@@ -5662,19 +6171,22 @@ class HexEditorQt(QMainWindow):
                                 data_index += 1
                 else:
                     # Linear paste (no grid structure)
-                    for i, byte in enumerate(paste_data):
-                        pos = paste_position + i
-                        if pos < len(current_file.file_data):
-                            current_file.file_data[pos] = byte
-                            if pos not in current_file.inserted_bytes:
-                                current_file.modified_bytes.add(pos)
+                    # One slice assignment, clipped at the end of the file (overwrite never grows it)
+                    patch_count = max(0, min(len(paste_data), len(current_file.file_data) - paste_position))
+                    patch_end = paste_position + patch_count
+                    self.save_undo_delta(paste_position, current_file.file_data[paste_position:patch_end])
+                    current_file.file_data[paste_position:patch_end] = paste_data[:patch_count]
+                    if current_file.inserted_bytes:
+                        current_file.modified_bytes.update(
+                            pos for pos in range(paste_position, patch_end) if pos not in current_file.inserted_bytes)
+                    else:
+                        current_file.modified_bytes.update(range(paste_position, patch_end))
         else:
             # No selection, paste at cursor
             paste_position = self.cursor_position
 
-            self.save_undo_state()
-
             if self.clipboard_grid_rows is not None and self.clipboard_grid_cols is not None:
+                self.save_undo_state()
                 # Preserve grid structure during paste
                 src_rows = self.clipboard_grid_rows
                 src_cols = self.clipboard_grid_cols
@@ -5696,16 +6208,24 @@ class HexEditorQt(QMainWindow):
                             data_index += 1
             else:
                 # Linear paste (no grid structure)
-                for i, byte in enumerate(paste_data):
-                    pos = paste_position + i
-                    if pos < len(current_file.file_data):
-                        current_file.file_data[pos] = byte
-                        if pos not in current_file.inserted_bytes:
-                            current_file.modified_bytes.add(pos)
+                # One slice assignment, clipped at the end of the file (overwrite never grows it)
+                patch_count = max(0, min(len(paste_data), len(current_file.file_data) - paste_position))
+                patch_end = paste_position + patch_count
+                self.save_undo_delta(paste_position, current_file.file_data[paste_position:patch_end])
+                current_file.file_data[paste_position:patch_end] = paste_data[:patch_count]
+                if current_file.inserted_bytes:
+                    current_file.modified_bytes.update(
+                        pos for pos in range(paste_position, patch_end) if pos not in current_file.inserted_bytes)
+                else:
+                    current_file.modified_bytes.update(range(paste_position, patch_end))
 
         current_file.modified = True
         current_file.pattern_highlights_dirty = True  # Mark pattern highlights for reapplication
-        self.display_hex(preserve_scroll=True)
+        if patch_count:
+            # Linear overwrite: layout is unchanged, so patch the rendered rows in place
+            self.refresh_edited_bytes(paste_position, patch_count, preserve_scroll=True)
+        else:
+            self.display_hex(preserve_scroll=True)
         self.scroll_to_offset(paste_position)
 
     def paste_insert(self):
@@ -5849,14 +6369,26 @@ class HexEditorQt(QMainWindow):
             if not self.show_file_size_warning(self, -net_size_change, is_increase=False):
                 return
 
-        self.save_undo_state()
-
         # Handle column selection specially - process row by row to maintain shape
         # Skip row-by-row processing if 'ignore' chosen without grid metadata
-        if (self.selection_start is not None and self.selection_end is not None and
-            self.column_selection_mode and self.column_sel_start_row is not None and
-            not (smart_paste_choice == 'ignore' and
-                 (self.clipboard_grid_rows is None or self.clipboard_grid_cols is None))):
+        column_paste = (self.selection_start is not None and self.selection_end is not None and
+                        self.column_selection_mode and self.column_sel_start_row is not None and
+                        not (smart_paste_choice == 'ignore' and
+                             (self.clipboard_grid_rows is None or self.clipboard_grid_cols is None)))
+
+        if column_paste:
+            # Rows are rewritten across the whole selection, so keep a full snapshot
+            self.save_undo_state()
+        elif self.selection_start is not None and self.selection_end is not None:
+            # The selected range is replaced by the pasted bytes
+            sel_start = min(self.selection_start, self.selection_end)
+            sel_end = max(self.selection_start, self.selection_end)
+            self.save_undo_delta(sel_start, current_file.file_data[sel_start:sel_end + 1], len(paste_data))
+        else:
+            # Pure insert at the cursor
+            self.save_undo_delta(insert_position, b'', len(paste_data))
+
+        if column_paste:
 
             min_row = min(self.column_sel_start_row, self.column_sel_end_row)
             max_row = max(self.column_sel_start_row, self.column_sel_end_row)
@@ -5907,26 +6439,20 @@ class HexEditorQt(QMainWindow):
                 # Delete this row's column bytes (from end to start) only if within selection
                 delete_count = 0
                 if target_row <= max_row and row_positions:
-                    for pos in sorted(row_positions, reverse=True):
-                        current_file.file_data.pop(pos)
-                        current_file.modified_bytes.discard(pos)
-                        current_file.inserted_bytes.discard(pos)
-                        current_file.replaced_bytes.discard(pos)
+                    # The row's selected columns are contiguous: one slice delete
+                    del current_file.file_data[row_positions[0]:row_positions[-1] + 1]
+                    current_file.modified_bytes.difference_update(row_positions)
+                    current_file.inserted_bytes.difference_update(row_positions)
+                    current_file.replaced_bytes.difference_update(row_positions)
                     delete_count = len(row_positions)
 
                 # Extract the bytes for this row from paste_data using source columns
-                row_paste_data = []
-                for _ in range(src_cols):
-                    if data_index < len(paste_data):
-                        row_paste_data.append(paste_data[data_index])
-                        data_index += 1
-                    else:
-                        break
+                row_paste_data = paste_data[data_index:data_index + src_cols]
+                data_index += len(row_paste_data)
 
-                # Insert the new bytes for this row
-                for i, byte in enumerate(row_paste_data):
-                    current_file.file_data.insert(first_row_pos + i, byte)
-                    current_file.inserted_bytes.add(first_row_pos + i)
+                # Insert the new bytes for this row with one slice assignment
+                current_file.file_data[first_row_pos:first_row_pos] = row_paste_data
+                current_file.inserted_bytes.update(range(first_row_pos, first_row_pos + len(row_paste_data)))
 
                 # Update cumulative offset
                 cumulative_offset += len(row_paste_data) - delete_count
@@ -5940,42 +6466,12 @@ class HexEditorQt(QMainWindow):
             sel_start = min(self.selection_start, self.selection_end)
             sel_end = max(self.selection_start, self.selection_end)
 
-            # Delete selected bytes (from end to start to maintain positions)
-            for pos in range(sel_end, sel_start - 1, -1):
-                if pos < len(current_file.file_data):
-                    current_file.file_data.pop(pos)
-                    # Remove from tracking sets
-                    current_file.modified_bytes.discard(pos)
-                    current_file.inserted_bytes.discard(pos)
-                    current_file.replaced_bytes.discard(pos)
+            # Delete selected bytes with one slice delete (clipped at end of file)
+            del current_file.file_data[sel_start:sel_end + 1]
 
-            # Shift all markers after the deleted range
+            # Drop markers in the deleted range and shift all markers after it
             delete_count = sel_end - sel_start + 1
-            old_modified = set(current_file.modified_bytes)
-            old_inserted = set(current_file.inserted_bytes)
-            old_replaced = set(current_file.replaced_bytes)
-
-            current_file.modified_bytes.clear()
-            current_file.inserted_bytes.clear()
-            current_file.replaced_bytes.clear()
-
-            for pos in old_modified:
-                if pos > sel_end:
-                    current_file.modified_bytes.add(pos - delete_count)
-                elif pos < sel_start:
-                    current_file.modified_bytes.add(pos)
-
-            for pos in old_inserted:
-                if pos > sel_end:
-                    current_file.inserted_bytes.add(pos - delete_count)
-                elif pos < sel_start:
-                    current_file.inserted_bytes.add(pos)
-
-            for pos in old_replaced:
-                if pos > sel_end:
-                    current_file.replaced_bytes.add(pos - delete_count)
-                elif pos < sel_start:
-                    current_file.replaced_bytes.add(pos)
+            current_file.delete_byte_markers(sel_start, delete_count)
 
             # Shift non-pattern highlights
             self.shift_non_pattern_highlights(current_file, sel_end + 1, -delete_count)
@@ -5990,34 +6486,9 @@ class HexEditorQt(QMainWindow):
             if hasattr(self, 'fields_widget'):
                 self.fields_widget.adjust_for_delete(sel_start, delete_count, self.current_tab_index)
 
-            # When inserting, we need to shift all existing markers that come after the insertion point
+            # When inserting, shift all existing markers at or after the insertion point
             insert_count = len(paste_data)
-            old_modified = set(current_file.modified_bytes)
-            old_inserted = set(current_file.inserted_bytes)
-            old_replaced = set(current_file.replaced_bytes)
-
-            # Clear and rebuild the sets with shifted positions
-            current_file.modified_bytes.clear()
-            current_file.inserted_bytes.clear()
-            current_file.replaced_bytes.clear()
-
-            for pos in old_modified:
-                if pos >= insert_position:
-                    current_file.modified_bytes.add(pos + insert_count)
-                else:
-                    current_file.modified_bytes.add(pos)
-
-            for pos in old_inserted:
-                if pos >= insert_position:
-                    current_file.inserted_bytes.add(pos + insert_count)
-                else:
-                    current_file.inserted_bytes.add(pos)
-
-            for pos in old_replaced:
-                if pos >= insert_position:
-                    current_file.replaced_bytes.add(pos + insert_count)
-                else:
-                    current_file.replaced_bytes.add(pos)
+            current_file.insert_byte_markers(insert_position, insert_count)
 
             # Shift non-pattern highlights
             self.shift_non_pattern_highlights(current_file, insert_position, insert_count)
@@ -6032,40 +6503,13 @@ class HexEditorQt(QMainWindow):
             if hasattr(self, 'fields_widget'):
                 self.fields_widget.adjust_for_insert(insert_position, insert_count, self.current_tab_index)
 
-            # Insert bytes
-            for i, byte in enumerate(paste_data):
-                pos = insert_position + i
-                current_file.file_data.insert(pos, byte)
-                current_file.inserted_bytes.add(pos)
+            # Insert bytes with one slice assignment (a single memmove of the tail)
+            current_file.file_data[insert_position:insert_position] = paste_data
+            current_file.inserted_bytes.update(range(insert_position, insert_position + insert_count))
         else:
-            # No selection, just insert at cursor
+            # No selection, just insert at cursor; shift markers at or after the insertion point
             insert_count = len(paste_data)
-            old_modified = set(current_file.modified_bytes)
-            old_inserted = set(current_file.inserted_bytes)
-            old_replaced = set(current_file.replaced_bytes)
-
-            # Clear and rebuild the sets with shifted positions
-            current_file.modified_bytes.clear()
-            current_file.inserted_bytes.clear()
-            current_file.replaced_bytes.clear()
-
-            for pos in old_modified:
-                if pos >= insert_position:
-                    current_file.modified_bytes.add(pos + insert_count)
-                else:
-                    current_file.modified_bytes.add(pos)
-
-            for pos in old_inserted:
-                if pos >= insert_position:
-                    current_file.inserted_bytes.add(pos + insert_count)
-                else:
-                    current_file.inserted_bytes.add(pos)
-
-            for pos in old_replaced:
-                if pos >= insert_position:
-                    current_file.replaced_bytes.add(pos + insert_count)
-                else:
-                    current_file.replaced_bytes.add(pos)
+            current_file.insert_byte_markers(insert_position, insert_count)
 
             # Shift non-pattern highlights
             self.shift_non_pattern_highlights(current_file, insert_position, insert_count)
@@ -6080,11 +6524,9 @@ class HexEditorQt(QMainWindow):
             if hasattr(self, 'fields_widget'):
                 self.fields_widget.adjust_for_insert(insert_position, insert_count, self.current_tab_index)
 
-            # Insert bytes
-            for i, byte in enumerate(paste_data):
-                pos = insert_position + i
-                current_file.file_data.insert(pos, byte)
-                current_file.inserted_bytes.add(pos)
+            # Insert bytes with one slice assignment (a single memmove of the tail)
+            current_file.file_data[insert_position:insert_position] = paste_data
+            current_file.inserted_bytes.update(range(insert_position, insert_position + insert_count))
 
         current_file.modified = True
         current_file.pattern_highlights_dirty = True  # Mark pattern highlights for reapplication
@@ -6222,8 +6664,6 @@ class HexEditorQt(QMainWindow):
 
                 current_file = self.open_files[self.current_tab_index]
 
-                self.save_undo_state()
-
                 # Parse column range
                 col_start_text = col_start_input.text().strip()
                 col_end_text = col_end_input.text().strip()
@@ -6237,6 +6677,23 @@ class HexEditorQt(QMainWindow):
                                         "Please enter valid hex columns (00-0F).")
                     return
 
+                def write_fill(fill_data):
+                    """Write fill_data (one byte per selection offset) over the selection, only in the chosen columns"""
+                    # A fill only overwrites the selection, so undo just needs its old bytes
+                    # (recorded here, once the input has been validated)
+                    self.save_undo_delta(start, current_file.file_data[start:start + length])
+                    if col_start == 0 and col_end == 15:
+                        current_file.file_data[start:start + length] = fill_data
+                        current_file.modified_bytes.update(range(start, start + length))
+                        return
+                    # The chosen columns of each 16-byte row are one contiguous run
+                    for row_start in range(start - start % 16, start + length, 16):
+                        run_start = max(start, row_start + col_start)
+                        run_end = min(start + length, row_start + col_end + 1)
+                        if run_start < run_end:
+                            current_file.file_data[run_start:run_end] = fill_data[run_start - start:run_end - start]
+                            current_file.modified_bytes.update(range(run_start, run_end))
+
                 import random
 
                 if random_checkbox.isChecked():
@@ -6245,12 +6702,12 @@ class HexEditorQt(QMainWindow):
                     if min_val > max_val:
                         min_val, max_val = max_val, min_val
 
-                    for offset in range(length):
-                        row = (start + offset) // 16
-                        col = (start + offset) % 16
-                        if col_start <= col <= col_end:
-                            current_file.file_data[start + offset] = random.randint(min_val, max_val)
-                            current_file.modified_bytes.add(start + offset)
+                    # Generate the whole buffer at once: os.urandom for the full byte range, otherwise
+                    # random.choices over the allowed values (numpy is not a dependency)
+                    if min_val == 0 and max_val == 255:
+                        write_fill(os.urandom(length))
+                    else:
+                        write_fill(bytes(random.choices(range(min_val, max_val + 1), k=length)))
                 else:
                     # Parse hex pattern
                     pattern_text = pattern_input.text().strip()
@@ -6259,37 +6716,42 @@ class HexEditorQt(QMainWindow):
                         return
 
                     pattern_parts = pattern_text.replace(',', ' ').split()
-                    pattern_bytes = []
+                    pattern_bytes = bytearray()
                     for part in pattern_parts:
-                        try:
-                            byte_val = int(part, 16)
-                            if 0 <= byte_val <= 255:
-                                pattern_bytes.append(byte_val)
-                            else:
-                                raise ValueError()
-                        except:
-                            QMessageBox.warning(dialog, "Invalid Pattern",
-                                                f"Invalid hex value: {part}\nPlease use hex values 00-FF.")
-                            return
+                        # One table lookup parses and range-checks the usual 1-2 digit tokens;
+                        # int() only runs for other spellings such as 0x1F
+                        byte_val = HEX_BYTE_VALUES.get(part.upper())
+                        if byte_val is None:
+                            try:
+                                byte_val = int(part, 16)
+                            except ValueError:
+                                byte_val = -1
+                            if not 0 <= byte_val <= 255:
+                                QMessageBox.warning(dialog, "Invalid Pattern",
+                                                    f"Invalid hex value: {part}\nPlease use hex values 00-FF.")
+                                return
+                        pattern_bytes.append(byte_val)
 
                     if not pattern_bytes:
                         QMessageBox.warning(dialog, "Invalid Pattern", "Please enter at least one hex byte.")
                         return
 
-                    for offset in range(length):
-                        row = (start + offset) // 16
-                        col = (start + offset) % 16
-                        if col_start <= col <= col_end:
-                            current_file.file_data[start + offset] = pattern_bytes[offset % len(pattern_bytes)]
-                            current_file.modified_bytes.add(start + offset)
+                    if len(pattern_bytes) == 1:
+                        # Single byte (Zerobytes/DoD presets): memset paths with no trimming copy
+                        write_fill(bytes(length) if pattern_bytes[0] == 0 else bytes(pattern_bytes) * length)
+                    else:
+                        # Repeat the pattern in C to cover the selection
+                        repeats = (length + len(pattern_bytes) - 1) // len(pattern_bytes)
+                        write_fill((bytes(pattern_bytes) * repeats)[:length])
 
                 current_file.modified = True
-                current_file.pattern_highlights_dirty = True  # Mark pattern highlights for reapplication
+                current_file.mark_pattern_range_dirty(start, start + length)
                 # Update tab title
                 tab_text = os.path.basename(current_file.file_path) + " *"
                 self.tab_widget.setTabText(self.current_tab_index, tab_text)
 
-                self.display_hex(preserve_scroll=True)
+                # A fill overwrites in place, so only the selection's rows need redrawing
+                self.refresh_edited_bytes(start, length, preserve_scroll=True)
                 dialog.accept()
             except Exception as e:
                 QMessageBox.critical(dialog, "Error", f"Failed to fill selection: {str(e)}")
@@ -6319,13 +6781,14 @@ class HexEditorQt(QMainWindow):
         if has_selection:
             start = min(self.selection_start, self.selection_end)
             end = max(self.selection_start, self.selection_end)
-            # Always read bytes in their file order (not reversed)
-            selected_bytes = bytes(current_file.file_data[start:end+1])
+            # Always read bytes in their file order (not reversed); slicing a memoryview
+            # copies once, where slicing the bytearray first would copy twice
+            selected_bytes = bytes(memoryview(current_file.file_data)[start:end+1])
         elif self.cursor_position is not None and self.cursor_position < len(current_file.file_data):
             # Use byte at cursor position
             start = self.cursor_position
             end = self.cursor_position
-            selected_bytes = bytes([current_file.file_data[self.cursor_position]])
+            selected_bytes = bytes(current_file.file_data[start:start + 1])
             has_selection = True  # Treat cursor position as a single-byte selection
         else:
             start = None
@@ -6376,7 +6839,7 @@ class HexEditorQt(QMainWindow):
         selection_info_layout = QVBoxLayout()
         if has_selection:
             selection_info_layout.addWidget(QLabel(f"Selected: {len(selected_bytes)} byte(s)"))
-            byte_preview = ' '.join(f'{b:02X}' for b in selected_bytes[:16])
+            byte_preview = selected_bytes[:16].hex(' ').upper()
             if len(selected_bytes) > 16:
                 byte_preview += "..."
             selection_info_layout.addWidget(QLabel(f"Bytes: {byte_preview}"))
@@ -6492,23 +6955,9 @@ class HexEditorQt(QMainWindow):
                     "underline": use_underline
                 })
 
-                # Apply highlights to current file data
-                file_data = current_file.file_data
-                pos = 0
-                found_count = 0
-                while pos <= len(file_data) - len(pattern):
-                    if bytes(file_data[pos:pos+len(pattern)]) == pattern:
-                        for i in range(len(pattern)):
-                            current_file.byte_highlights[pos + i] = {
-                                "color": color,
-                                "message": message,
-                                "underline": use_underline,
-                                "pattern": bytes(pattern)  # Mark as pattern-based
-                            }
-                        pos += len(pattern)
-                        found_count += 1
-                    else:
-                        pos += 1
+                # Apply highlights to current file data (same bytes.find scan as reapply_pattern_highlights)
+                found_count = self._scan_pattern_highlight(
+                    current_file, current_file.pattern_highlights[-1], 0, len(current_file.file_data))
 
                 # Pattern has been applied, so not dirty
                 current_file.pattern_highlights_dirty = False
@@ -6532,25 +6981,23 @@ class HexEditorQt(QMainWindow):
                     # Start search from cursor position (for search mode)
                     start_pos = self.cursor_position if self.cursor_position is not None else 0
 
-                pos = start_pos
-                found = False
-                while pos <= len(file_data) - len(pattern):
-                    if bytes(file_data[pos:pos+len(pattern)]) == pattern:
-                        for i in range(len(pattern)):
-                            current_file.byte_highlights[pos + i] = {
-                                "color": color,
-                                "message": message,
-                                "underline": use_underline
-                            }
-                        found = True
-                        break
-                    pos += 1
-
-                if not found:
+                # In selection mode the selection itself is the first match, which find confirms
+                # with a single compare at start_pos
+                pos = file_data.find(bytes(pattern), start_pos)
+                if pos != -1:
+                    # One shared info dict for the matched bytes, as pattern highlights use
+                    highlight = {
+                        "color": color,
+                        "message": message,
+                        "underline": use_underline
+                    }
+                    current_file.byte_highlights.update(dict.fromkeys(range(pos, pos + len(pattern)), highlight))
+                else:
                     QMessageBox.information(dialog, "Not Found", f"No matching byte sequence found from position 0x{start_pos:X}")
                     return
 
-            self.display_hex(preserve_scroll=True)
+            # Highlights change no bytes - reformatting the rendered window is enough
+            self.update_cursor_highlight()
 
             # Update pattern result color box and description if this was triggered from pattern scan
             if hasattr(self, 'pattern_result_to_update') and self.pattern_result_to_update:
@@ -6757,13 +7204,18 @@ class HexEditorQt(QMainWindow):
         # Convert pattern to bytes
         if is_hex:
             try:
-                pattern = bytes.fromhex(pattern_text.replace(" ", ""))
+                pattern = parse_hex_input(pattern_text)
             except ValueError:
                 QMessageBox.critical(self, "Error", "Invalid hex pattern")
                 return
         else:
             pattern = pattern_text.encode()
 
+        if not pattern:
+            # e.g. hex input of only spaces, which find would match at every offset
+            QMessageBox.critical(self, "Error", "Invalid hex pattern")
+            return
+
         # Create results overlay if it doesn't exist
         self.create_results_overlay()
 
@@ -6771,7 +7223,8 @@ class HexEditorQt(QMainWindow):
         for i in reversed(range(self.search_results_layout.count())):
             self.search_results_layout.itemAt(i).widget().setParent(None)
 
-        data = bytes(current_file.file_data)
+        # bytearray and mmap both provide find/rfind, so search the live buffer instead of a full copy
+        data = current_file.file_data
 
         if self.search_forward_radio.isChecked():
             # Search forward from current position
@@ -6804,20 +7257,17 @@ class HexEditorQt(QMainWindow):
                 self.add_search_result_label("No match found")
 
         else:  # Find All
-            # Find all occurrences
-            matches = []
-            offset = 0
-            while True:
-                pos = data.find(pattern, offset)
-                if pos == -1:
-                    break
-                matches.append(pos)
-                # Skip past the entire pattern to avoid overlapping matches
-                offset = pos + len(pattern)
+            # Find all occurrences; only the first SEARCH_RESULT_LIMIT get a result row
+            match_iter = iter_pattern_matches(data, pattern)
+            matches = list(islice(match_iter, SEARCH_RESULT_LIMIT))
 
             if matches:
-                for pos in matches:
-                    self.show_search_result(pos, pattern, data, clickable=True)
+                self.show_search_results(matches, pattern, data)
+                # Count the rest without building widgets for them
+                remaining = sum(1 for _ in match_iter)
+                if remaining:
+                    self.add_search_result_label(
+                        f"Showing first {len(matches):,} of {len(matches) + remaining:,} matches")
             else:
                 self.add_search_result_label("No matches found")
 
@@ -6825,7 +7275,8 @@ class HexEditorQt(QMainWindow):
         self.results_overlay.show()
         self.results_overlay.raise_()
 
-    def show_search_result(self, pos, pattern, data, clickable=False):
+    def search_result_html(self, pos, pattern, data):
+        """Rich-text line for one search result: hex context with the match in blue, and its offset"""
         # Show context: 4 bytes before and after
         context_before = 4
         context_after = 4
@@ -6833,34 +7284,44 @@ class HexEditorQt(QMainWindow):
         start = max(0, pos - context_before)
         end = min(len(data), pos + len(pattern) + context_after)
 
+        # Build the hex display with blue colored matched bytes: each of the three runs
+        # (context, match, context) is formatted in C by bytes.hex
+        match_end = min(pos + len(pattern), end)
+        hex_parts = [
+            data[start:pos].hex(' ').upper(),
+            # Searched bytes in blue
+            f"<span style='color: #2196F3; font-weight: bold;'>{data[pos:match_end].hex(' ').upper()}</span>",
+            data[match_end:end].hex(' ').upper()
+        ]
+
+        hex_str = " ".join(part for part in hex_parts if part)
+        return f"Result: {hex_str} | Offset: 0x{pos:X}"
+
+    def show_search_result(self, pos, pattern, data):
         result_widget = QWidget()
         result_layout = QHBoxLayout()
         result_layout.setContentsMargins(5, 2, 5, 2)
 
-        # Build the hex display with blue colored matched bytes
-        hex_parts = []
-        for i in range(start, end):
-            if i >= pos and i < pos + len(pattern):
-                # Searched bytes in blue
-                hex_parts.append(f"<span style='color: #2196F3; font-weight: bold;'>{data[i]:02X}</span>")
-            else:
-                hex_parts.append(f"{data[i]:02X}")
-
-        hex_str = " ".join(hex_parts)
-
-        result_label = QLabel(f"Result: {hex_str} | Offset: 0x{pos:X}")
+        result_label = QLabel(self.search_result_html(pos, pattern, data))
         result_label.setFont(QFont("Courier", 8))
         result_label.setTextFormat(Qt.RichText)
 
-        if clickable:
-            result_label.mousePressEvent = lambda event, p=pos: self.goto_search_result(p)
-            result_label.setCursor(Qt.PointingHandCursor)
-            result_label.setStyleSheet("text-decoration: underline;")
-
         result_layout.addWidget(result_label)
         result_widget.setLayout(result_layout)
         self.search_results_layout.addWidget(result_widget)
 
+    def show_search_results(self, matches, pattern, data):
+        """Show many clickable search results in one QTextBrowser instead of a widget per result"""
+        rows = [f"<a href='goto:{pos}'>{self.search_result_html(pos, pattern, data)}</a>" for pos in matches]
+
+        results_browser = QTextBrowser()
+        results_browser.setOpenLinks(False)
+        results_browser.setFont(QFont("Courier", 8))
+        results_browser.setFrameShape(QFrame.NoFrame)
+        results_browser.anchorClicked.connect(lambda url: self.goto_search_result(int(url.path())))
+        results_browser.setHtml("<br>".join(rows))
+        self.search_results_layout.addWidget(results_browser)
+
     def add_search_result_label(self, text):
         label = QLabel(text)
         label.setFont(QFont("Arial", 7))
@@ -6876,7 +7337,29 @@ class HexEditorQt(QMainWindow):
         self.data_inspector.update()
 
     def show_replace_window(self):
+        if self.replace_dialog is None:
+            self.build_replace_dialog()
+        else:
+            # Reset the reused dialog to the state of a freshly built one
+            self.replace_find_edit.clear()
+            self.replace_with_edit.clear()
+            self.replace_type_btn.setChecked(True)
+            self.toggle_replace_type()
+            self.replace_forward_radio.setChecked(True)
+        self.replace_dialog.show()
+        self.replace_dialog.raise_()
+        self.replace_dialog.activateWindow()
+
+    def toggle_replace_type(self):
+        if self.replace_type_btn.isChecked():
+            self.replace_type_btn.setText("Hex")
+        else:
+            self.replace_type_btn.setText("Text")
+
+    def build_replace_dialog(self):
+        """Create the Replace dialog's widgets once; show_replace_window reuses them"""
         dialog = QDialog(self)
+        self.replace_dialog = dialog
         dialog.setWindowTitle("Replace")
         dialog.setMinimumSize(400, 220)
 
@@ -6904,14 +7387,7 @@ class HexEditorQt(QMainWindow):
         self.replace_type_btn.setCheckable(True)
         self.replace_type_btn.setChecked(True)
         self.replace_type_btn.setMaximumWidth(100)
-
-        def toggle_replace_type():
-            if self.replace_type_btn.isChecked():
-                self.replace_type_btn.setText("Hex")
-            else:
-                self.replace_type_btn.setText("Text")
-
-        self.replace_type_btn.clicked.connect(toggle_replace_type)
+        self.replace_type_btn.clicked.connect(self.toggle_replace_type)
         type_layout.addWidget(self.replace_type_btn)
         type_layout.addStretch()
         layout.addLayout(type_layout)
@@ -6948,7 +7424,6 @@ class HexEditorQt(QMainWindow):
         layout.addLayout(button_layout)
 
         dialog.setLayout(layout)
-        dialog.show()
 
     def perform_replace(self, dialog):
         if self.current_tab_index < 0:
@@ -6968,8 +7443,8 @@ class HexEditorQt(QMainWindow):
         try:
             if is_hex:
                 # Parse hex patterns
-                find_pattern = bytes.fromhex(find_text.replace(' ', '').replace('0x', ''))
-                replace_pattern = bytes.fromhex(replace_text.replace(' ', '').replace('0x', ''))
+                find_pattern = parse_hex_input(find_text)
+                replace_pattern = parse_hex_input(replace_text)
             else:
                 # Use text patterns (decoded)
                 find_pattern = find_text.encode('utf-8')
@@ -6978,8 +7453,14 @@ class HexEditorQt(QMainWindow):
             QMessageBox.warning(dialog, "Error", f"Invalid pattern format: {str(e)}")
             return
 
+        if not find_pattern:
+            # e.g. hex input of only spaces or "0x"
+            QMessageBox.warning(dialog, "Error", "Please enter search pattern")
+            return
+
         current_file = self.open_files[self.current_tab_index]
-        data = bytearray(current_file.file_data)
+        # Scan the file data directly; it is only copied once the replacement is confirmed
+        data = current_file.file_data
 
         # Determine search range based on radio selection
         if self.replace_forward_radio.isChecked():
@@ -7000,15 +7481,10 @@ class HexEditorQt(QMainWindow):
             search_start = 0
             search_end = len(data)
 
-        # Find all occurrences in range
-        matches = []
-        offset = search_start
-        while offset < search_end:
-            pos = data.find(find_pattern, offset, search_end)
-            if pos == -1:
-                break
-            matches.append(pos)
-            offset = pos + len(find_pattern)
+        # Find all occurrences in range (find already runs CPython's two-way fastsearch).
+        # They come out in ascending order, which both replacement paths below rely on:
+        # every write and marker update walks the file once, front to back
+        matches = list(iter_pattern_matches(data, find_pattern, search_start, search_end))
 
         if not matches:
             QMessageBox.information(dialog, "Replace", "No matches found")
@@ -7033,62 +7509,68 @@ class HexEditorQt(QMainWindow):
             if reply != QMessageBox.Yes:
                 return
 
-        # Perform replacement
-        self.save_undo_state()
-
-        # Replace from end to start to maintain correct positions
-        # and track how we need to shift existing markers
-        size_diff = len(replace_pattern) - len(find_pattern)
-
-        # Process replacements from end to start
-        for match_idx in range(len(matches) - 1, -1, -1):
-            pos = matches[match_idx]
-
-            # If size changes, shift all existing markers that are after this position
-            if size_diff != 0:
-                old_modified = set(current_file.modified_bytes)
-                old_inserted = set(current_file.inserted_bytes)
-                old_replaced = set(current_file.replaced_bytes)
-
-                current_file.modified_bytes.clear()
-                current_file.inserted_bytes.clear()
-                current_file.replaced_bytes.clear()
-
-                # Shift markers after the current replacement position
-                for p in old_modified:
-                    if p >= pos + len(find_pattern):
-                        current_file.modified_bytes.add(p + size_diff)
-                    elif p < pos:
-                        current_file.modified_bytes.add(p)
-
-                for p in old_inserted:
-                    if p >= pos + len(find_pattern):
-                        current_file.inserted_bytes.add(p + size_diff)
-                    elif p < pos:
-                        current_file.inserted_bytes.add(p)
-
-                for p in old_replaced:
-                    if p >= pos + len(find_pattern):
-                        current_file.replaced_bytes.add(p + size_diff)
-                    elif p < pos:
-                        current_file.replaced_bytes.add(p)
-
-            # Remove old bytes
-            del data[pos:pos + len(find_pattern)]
-            # Insert new bytes and mark as replaced (blue)
-            for i, byte_val in enumerate(replace_pattern):
-                data.insert(pos + i, byte_val)
-                current_file.replaced_bytes.add(pos + i)
+        # Perform replacement. Undo only needs the bytes from the first match to the end of
+        # the last one, not a copy of the whole file
+        span_start = matches[0]
+        span_end = matches[-1] + len(find_pattern)
+        self.save_undo_delta(span_start, data[span_start:span_end],
+                             span_end - span_start + (len(replace_pattern) - len(find_pattern)) * len(matches))
+
+        if len(find_pattern) == len(replace_pattern):
+            # Same size: nothing moves, so the markers need no shifting and each match is
+            # overwritten in place. Only a read-only mmap needs copying into a bytearray first
+            if not isinstance(data, bytearray):
+                data = bytearray(data)
+            for pos in matches:
+                data[pos:pos + len(find_pattern)] = replace_pattern
+            # Mark every replacement (blue) with a single set update
+            current_file.replaced_bytes.update(*[range(pos, pos + len(replace_pattern)) for pos in matches])
+        else:
+            # Shift existing markers for all matches in one pass
+            current_file.replace_byte_markers(matches, len(find_pattern), len(replace_pattern))
+
+            # Size changes: copy the gaps between matches and the replacements into a buffer
+            # allocated at its final size, in one left-to-right pass (no tail shifts or regrowth)
+            new_data = bytearray(len(data) + (len(replace_pattern) - len(find_pattern)) * len(matches))
+            replaced_ranges = []
+            src = 0
+            dst = 0
+            with memoryview(data) as view, memoryview(new_data) as out:
+                for pos in matches:
+                    gap = pos - src
+                    out[dst:dst + gap] = view[src:pos]
+                    dst += gap
+                    out[dst:dst + len(replace_pattern)] = replace_pattern
+                    # Remember the replacement's final offset in the new buffer
+                    replaced_ranges.append(range(dst, dst + len(replace_pattern)))
+                    dst += len(replace_pattern)
+                    src = pos + len(find_pattern)
+                out[dst:] = view[src:]
+            data = new_data
+            # Mark every replacement (blue) with a single set update
+            current_file.replaced_bytes.update(*replaced_ranges)
 
         current_file.file_data = data
         current_file.modified = True
+        current_file.pattern_highlights_dirty = True  # Mark pattern highlights for reapplication
         self.display_hex(preserve_scroll=True)
 
         QMessageBox.information(dialog, "Replace Complete", f"Replaced {len(matches)} occurrence(s)")
         dialog.close()
 
     def show_goto_window(self):
+        if self.goto_dialog is None:
+            self.build_goto_dialog()
+        else:
+            self.goto_offset_edit.clear()
+        self.goto_dialog.show()
+        self.goto_dialog.raise_()
+        self.goto_dialog.activateWindow()
+
+    def build_goto_dialog(self):
+        """Create the Go To Offset dialog's widgets once; show_goto_window reuses them"""
         dialog = QDialog(self)
+        self.goto_dialog = dialog
         dialog.setWindowTitle("Go To Offset")
         dialog.setMinimumSize(280, 140)
 
@@ -7096,48 +7578,48 @@ class HexEditorQt(QMainWindow):
 
         offset_layout = QHBoxLayout()
         offset_layout.addWidget(QLabel("Offset:"))
-        offset_edit = QLineEdit()
-        offset_layout.addWidget(offset_edit)
+        self.goto_offset_edit = QLineEdit()
+        offset_layout.addWidget(self.goto_offset_edit)
         layout.addLayout(offset_layout)
 
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.goto_dialog_offset)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
 
-        def goto_offset():
-            try:
-                offset_text = offset_edit.text()
-                # Always parse as hex by default (users expect hex offsets in a hex editor)
-                if offset_text.startswith('0x') or offset_text.startswith('0X'):
-                    offset = int(offset_text, 16)
-                else:
-                    # Parse as hex even without 0x prefix
-                    offset = int(offset_text, 16)
-
-                if self.current_tab_index >= 0:
-                    current_file = self.open_files[self.current_tab_index]
-                    if 0 <= offset < len(current_file.file_data):
-                        self.cursor_position = offset
-                        self.cursor_nibble = 0
+        dialog.setLayout(layout)
 
-                        # Scroll to the offset (handles re-rendering if needed)
-                        self.scroll_to_offset(offset, center=True)
+    def goto_dialog_offset(self):
+        """Jump to the offset entered in the Go To Offset dialog"""
+        dialog = self.goto_dialog
+        try:
+            offset_text = self.goto_offset_edit.text()
+            # Always parse as hex by default (users expect hex offsets in a hex editor)
+            if offset_text.startswith('0x') or offset_text.startswith('0X'):
+                offset = int(offset_text, 16)
+            else:
+                # Parse as hex even without 0x prefix
+                offset = int(offset_text, 16)
 
-                        # Refresh display to show cursor at new position
-                        self.display_hex(preserve_scroll=True)
+            if self.current_tab_index >= 0:
+                current_file = self.open_files[self.current_tab_index]
+                if 0 <= offset < len(current_file.file_data):
+                    self.cursor_position = offset
+                    self.cursor_nibble = 0
 
-                        self.update_cursor_highlight()
-                        self.data_inspector.update()
-                        dialog.accept()
-                    else:
-                        QMessageBox.critical(dialog, "Error", "Offset out of range")
-            except ValueError:
-                QMessageBox.critical(dialog, "Error", "Invalid offset format")
+                    # Scroll to the offset (handles re-rendering if needed)
+                    self.scroll_to_offset(offset, center=True)
 
-        buttons.accepted.connect(goto_offset)
-        buttons.rejected.connect(dialog.reject)
-        layout.addWidget(buttons)
+                    # Refresh display to show cursor at new position
+                    self.display_hex(preserve_scroll=True)
 
-        dialog.setLayout(layout)
-        dialog.show()
+                    self.update_cursor_highlight()
+                    self.data_inspector.update()
+                    dialog.accept()
+                else:
+                    QMessageBox.critical(dialog, "Error", "Offset out of range")
+        except ValueError:
+            QMessageBox.critical(dialog, "Error", "Invalid offset format")
 
     def show_delimiter_config(self):
         """Show the delimiter configuration dialog"""
@@ -7978,7 +8460,21 @@ class HexEditorQt(QMainWindow):
             QMessageBox.information(self, "Success", "All highlights, pattern labels, pointers, and hidden delimiters cleared")
 
     def show_calculator_window(self):
+        # Reuse the calculator unless the theme changed since it was styled
+        if self.calculator_dialog is None or self.calculator_theme != self.current_theme:
+            if self.calculator_dialog is not None:
+                self.calculator_dialog.close()
+                self.auxiliary_windows.remove(self.calculator_dialog)
+            self.build_calculator_dialog()
+        self.calculator_dialog.show()
+        self.calculator_dialog.raise_()
+        self.calculator_dialog.activateWindow()
+
+    def build_calculator_dialog(self):
+        """Create the Hex Calculator window's widgets once; show_calculator_window reuses them"""
         dialog = QDialog(self, Qt.Window)
+        self.calculator_dialog = dialog
+        self.calculator_theme = self.current_theme
         dialog.setWindowTitle("Hex Calculator")
         dialog.setMinimumSize(550, 650)
         dialog.setModal(False)
@@ -8003,6 +8499,7 @@ class HexEditorQt(QMainWindow):
         main_layout.addWidget(input_label)
 
         input_edit = QLineEdit()
+        self.calc_input_edit = input_edit
         input_edit.setFont(QFont("Courier", 11))
         input_edit.setPlaceholderText("Enter hex or number...")
         input_edit.setMinimumHeight(35)
@@ -8028,12 +8525,14 @@ class HexEditorQt(QMainWindow):
         inspector_scroll.setWidget(inspector_content)
         main_layout.addWidget(inspector_scroll)
 
-        # State variables
-        current_endianness = ['little']
-        current_basis = ['dec']
+        # State read by update_calculator_inspector
+        self.calc_endianness = 'little'
+        self.calc_basis = 'dec'
+        self.calc_updating = False
 
         # Inspector data fields (label: value)
         inspector_fields = {}
+        self.calc_fields = inspector_fields
 
         def add_inspector_row(label_text):
             # Get base theme colors (Light or Dark based on current theme brightness)
@@ -8127,246 +8626,27 @@ class HexEditorQt(QMainWindow):
 
         dialog.setLayout(main_layout)
 
-        # Helper functions
-        def format_integral(value, width, signed=False):
-            if current_basis[0] == 'hex':
-                if signed and value < 0:
-                    mask = (1 << (width * 4)) - 1
-                    value = value & mask
-                return f"0x{value:0{width}X}"
-            elif current_basis[0] == 'oct':
-                if signed and value < 0:
-                    bits = width * 4
-                    mask = (1 << bits) - 1
-                    value = value & mask
-                return f"0o{value:o}"
-            else:
-                return str(value)
-
-        def read_leb128(data_bytes, signed=True):
-            result = 0
-            shift = 0
-            size = 0
-            for b in data_bytes:
-                size += 1
-                result |= (b & 0x7f) << shift
-                shift += 7
-                if (b & 0x80) == 0:
-                    break
-            if signed and size > 0 and (result & (1 << (shift - 1))):
-                result -= (1 << shift)
-            return result, size
-
-        updating = [False]
-
-        def update_inspector():
-            if updating[0]:
-                return
-
-            updating[0] = True
-
-            value_str = input_edit.text().strip().upper()
-
-            # Clear all fields
-            for field in inspector_fields.values():
-                field.clear()
-
-            if not value_str:
-                updating[0] = False
-                return
-
-            try:
-                # Detect input type
-                is_hex_string = False
-                hex_value_str = value_str
-                is_float = '.' in value_str
-
-                if value_str.startswith('0X'):
-                    hex_value_str = value_str[2:]
-                    is_hex_string = True
-                elif ' ' in value_str:
-                    if all(c in '0123456789ABCDEF ' for c in value_str):
-                        is_hex_string = True
-                elif all(c in '0123456789ABCDEF' for c in value_str):
-                    if not is_float and any(c in 'ABCDEF' for c in value_str):
-                        is_hex_string = True
-
-                if is_hex_string:
-                    hex_clean = hex_value_str.replace(' ', '')
-                    if len(hex_clean) % 2 != 0:
-                        hex_clean = '0' + hex_clean
-
-                    hex_bytes = bytes.fromhex(hex_clean)
-                    endian = '<' if current_endianness[0] == 'little' else '>'
-
-                    # Populate integer fields
-                    if len(hex_bytes) >= 1:
-                        int8_val = struct.unpack('b', hex_bytes[:1])[0]
-                        uint8_val = hex_bytes[0]
-                        inspector_fields["Int8:"].setText(format_integral(int8_val, 2, signed=True))
-                        inspector_fields["UInt8:"].setText(format_integral(uint8_val, 2))
-
-                    if len(hex_bytes) >= 2:
-                        int16_val = struct.unpack(f'{endian}h', hex_bytes[:2])[0]
-                        uint16_val = struct.unpack(f'{endian}H', hex_bytes[:2])[0]
-                        inspector_fields["Int16:"].setText(format_integral(int16_val, 4, signed=True))
-                        inspector_fields["UInt16:"].setText(format_integral(uint16_val, 4))
-
-                    if len(hex_bytes) >= 4:
-                        int32_val = struct.unpack(f'{endian}i', hex_bytes[:4])[0]
-                        uint32_val = struct.unpack(f'{endian}I', hex_bytes[:4])[0]
-                        inspector_fields["Int32:"].setText(format_integral(int32_val, 8, signed=True))
-                        inspector_fields["UInt32:"].setText(format_integral(uint32_val, 8))
-
-                        float32_val = struct.unpack(f'{endian}f', hex_bytes[:4])[0]
-                        inspector_fields["Float32:"].setText(f"{float32_val:.6f}")
-
-                    if len(hex_bytes) >= 8:
-                        int64_val = struct.unpack(f'{endian}q', hex_bytes[:8])[0]
-                        uint64_val = struct.unpack(f'{endian}Q', hex_bytes[:8])[0]
-                        inspector_fields["Int64:"].setText(format_integral(int64_val, 16, signed=True))
-                        inspector_fields["UInt64:"].setText(format_integral(uint64_val, 16))
-
-                        float64_val = struct.unpack(f'{endian}d', hex_bytes[:8])[0]
-                        inspector_fields["Float64:"].setText(f"{float64_val:.15f}")
-
-                    # LEB128
-                    if len(hex_bytes) > 0:
-                        try:
-                            leb_val, leb_size = read_leb128(hex_bytes, signed=True)
-                            inspector_fields["LEB128:"].setText(str(leb_val))
-                        except:
-                            inspector_fields["LEB128:"].setText("Invalid")
-
-                        try:
-                            uleb_val, uleb_size = read_leb128(hex_bytes, signed=False)
-                            inspector_fields["ULEB128:"].setText(str(uleb_val))
-                        except:
-                            inspector_fields["ULEB128:"].setText("Invalid")
-
-                elif is_float:
-                    float_value = float(value_str)
-                    endian = '<' if current_endianness[0] == 'little' else '>'
-
-                    # Float32
-                    float32_bytes = struct.pack(f'{endian}f', float_value)
-                    float32_hex = ' '.join(f"{b:02X}" for b in float32_bytes)
-                    inspector_fields["Float32:"].setText(float32_hex)
-
-                    # Float64
-                    float64_bytes = struct.pack(f'{endian}d', float_value)
-                    float64_hex = ' '.join(f"{b:02X}" for b in float64_bytes)
-                    inspector_fields["Float64:"].setText(float64_hex)
-
-                else:
-                    int_value = int(value_str)
-                    endian = '<' if current_endianness[0] == 'little' else '>'
-
-                    # Pack to different sizes and show hex
-                    try:
-                        int8_bytes = struct.pack('b', int_value)
-                        inspector_fields["Int8:"].setText(' '.join(f"{b:02X}" for b in int8_bytes))
-                    except:
-                        inspector_fields["Int8:"].setText("Overflow")
-
-                    try:
-                        uint8_bytes = struct.pack('B', int_value)
-                        inspector_fields["UInt8:"].setText(' '.join(f"{b:02X}" for b in uint8_bytes))
-                    except:
-                        inspector_fields["UInt8:"].setText("Overflow")
-
-                    try:
-                        int16_bytes = struct.pack(f'{endian}h', int_value)
-                        inspector_fields["Int16:"].setText(' '.join(f"{b:02X}" for b in int16_bytes))
-                    except:
-                        inspector_fields["Int16:"].setText("Overflow")
-
-                    try:
-                        uint16_bytes = struct.pack(f'{endian}H', int_value)
-                        inspector_fields["UInt16:"].setText(' '.join(f"{b:02X}" for b in uint16_bytes))
-                    except:
-                        inspector_fields["UInt16:"].setText("Overflow")
-
-                    try:
-                        int32_bytes = struct.pack(f'{endian}i', int_value)
-                        inspector_fields["Int32:"].setText(' '.join(f"{b:02X}" for b in int32_bytes))
-                    except:
-                        inspector_fields["Int32:"].setText("Overflow")
-
-                    try:
-                        uint32_bytes = struct.pack(f'{endian}I', int_value)
-                        inspector_fields["UInt32:"].setText(' '.join(f"{b:02X}" for b in uint32_bytes))
-                    except:
-                        inspector_fields["UInt32:"].setText("Overflow")
-
-                    try:
-                        int64_bytes = struct.pack(f'{endian}q', int_value)
-                        inspector_fields["Int64:"].setText(' '.join(f"{b:02X}" for b in int64_bytes))
-                    except:
-                        inspector_fields["Int64:"].setText("Overflow")
-
-                    try:
-                        uint64_bytes = struct.pack(f'{endian}Q', int_value)
-                        inspector_fields["UInt64:"].setText(' '.join(f"{b:02X}" for b in uint64_bytes))
-                    except:
-                        inspector_fields["UInt64:"].setText("Overflow")
-
-                    # LEB128 encoding
-                    try:
-                        leb_bytes = []
-                        val = int_value
-                        while True:
-                            byte = val & 0x7f
-                            val >>= 7
-                            if (val == 0 and (byte & 0x40) == 0) or (val == -1 and (byte & 0x40) != 0):
-                                leb_bytes.append(byte)
-                                break
-                            leb_bytes.append(byte | 0x80)
-                        inspector_fields["LEB128:"].setText(' '.join(f"{b:02X}" for b in leb_bytes))
-                    except:
-                        inspector_fields["LEB128:"].setText("Error")
-
-                    # ULEB128 encoding
-                    try:
-                        uleb_bytes = []
-                        val = int_value if int_value >= 0 else 0
-                        while True:
-                            byte = val & 0x7f
-                            val >>= 7
-                            if val == 0:
-                                uleb_bytes.append(byte)
-                                break
-                            uleb_bytes.append(byte | 0x80)
-                        inspector_fields["ULEB128:"].setText(' '.join(f"{b:02X}" for b in uleb_bytes))
-                    except:
-                        inspector_fields["ULEB128:"].setText("Error")
-
-            except (ValueError, OverflowError, struct.error):
-                pass
-
-            updating[0] = False
-
         def toggle_endian():
-            if current_endianness[0] == 'little':
-                current_endianness[0] = 'big'
+            if self.calc_endianness == 'little':
+                self.calc_endianness = 'big'
                 endian_btn.setText("Byte Order: Big Endian")
             else:
-                current_endianness[0] = 'little'
+                self.calc_endianness = 'little'
                 endian_btn.setText("Byte Order: Little Endian")
-            update_inspector()
+            self.update_calculator_inspector()
 
         def on_basis_changed():
             if hex_basis_radio.isChecked():
-                current_basis[0] = 'hex'
+                self.calc_basis = 'hex'
             elif dec_basis_radio.isChecked():
-                current_basis[0] = 'dec'
+                self.calc_basis = 'dec'
             elif oct_basis_radio.isChecked():
-                current_basis[0] = 'oct'
-            update_inspector()
+                self.calc_basis = 'oct'
+            self.update_calculator_inspector()
 
         def on_field_edited(field_name):
             """Handle when a data inspector field is edited"""
-            if updating[0]:
+            if self.calc_updating:
                 return
 
             field = inspector_fields[field_name]
@@ -8376,56 +8656,56 @@ class HexEditorQt(QMainWindow):
                 return
 
             try:
-                endian = '<' if current_endianness[0] == 'little' else '>'
+                structs = STRUCTS[self.calc_endianness]
 
                 # Parse the value and convert to hex bytes
                 if field_name == "Int8:":
                     val = int(value_str, 0)
-                    data = struct.pack('b', val)
+                    data = structs['b'].pack(val)
                 elif field_name == "UInt8:":
                     val = int(value_str, 0)
-                    data = struct.pack('B', val)
+                    data = structs['B'].pack(val)
                 elif field_name == "Int16:":
                     val = int(value_str, 0)
-                    data = struct.pack(f'{endian}h', val)
+                    data = structs['h'].pack(val)
                 elif field_name == "UInt16:":
                     val = int(value_str, 0)
-                    data = struct.pack(f'{endian}H', val)
+                    data = structs['H'].pack(val)
                 elif field_name == "Int32:":
                     val = int(value_str, 0)
-                    data = struct.pack(f'{endian}i', val)
+                    data = structs['i'].pack(val)
                 elif field_name == "UInt32:":
                     val = int(value_str, 0)
-                    data = struct.pack(f'{endian}I', val)
+                    data = structs['I'].pack(val)
                 elif field_name == "Int64:":
                     val = int(value_str, 0)
-                    data = struct.pack(f'{endian}q', val)
+                    data = structs['q'].pack(val)
                 elif field_name == "UInt64:":
                     val = int(value_str, 0)
-                    data = struct.pack(f'{endian}Q', val)
+                    data = structs['Q'].pack(val)
                 elif field_name == "Float32:":
                     # Check if it's hex bytes or float value
-                    if ' ' in value_str or all(c in '0123456789ABCDEFabcdef' for c in value_str.replace(' ', '')):
+                    if ' ' in value_str or not value_str.translate(HEX_DIGIT_DELETE_TABLE):
                         # It's hex bytes
                         hex_clean = value_str.replace(' ', '')
                         data = bytes.fromhex(hex_clean)
                     else:
                         val = float(value_str)
-                        data = struct.pack(f'{endian}f', val)
+                        data = structs['f'].pack(val)
                 elif field_name == "Float64:":
                     # Check if it's hex bytes or float value
-                    if ' ' in value_str or all(c in '0123456789ABCDEFabcdef' for c in value_str.replace(' ', '')):
+                    if ' ' in value_str or not value_str.translate(HEX_DIGIT_DELETE_TABLE):
                         # It's hex bytes
                         hex_clean = value_str.replace(' ', '')
                         data = bytes.fromhex(hex_clean)
                     else:
                         val = float(value_str)
-                        data = struct.pack(f'{endian}d', val)
+                        data = structs['d'].pack(val)
                 else:
                     return
 
                 # Update input with hex representation
-                hex_str = ' '.join(f'{b:02X}' for b in data)
+                hex_str = data.hex(' ').upper()
                 input_edit.setText(hex_str)
 
             except:
@@ -8433,7 +8713,7 @@ class HexEditorQt(QMainWindow):
                 pass
 
         # Connect signals
-        input_edit.textChanged.connect(update_inspector)
+        input_edit.textChanged.connect(self.update_calculator_inspector)
         endian_btn.clicked.connect(toggle_endian)
         hex_basis_radio.toggled.connect(on_basis_changed)
         dec_basis_radio.toggled.connect(on_basis_changed)
@@ -8443,7 +8723,207 @@ class HexEditorQt(QMainWindow):
         for field_name, field_widget in inspector_fields.items():
             field_widget.editingFinished.connect(lambda fn=field_name: on_field_edited(fn))
 
-        dialog.show()
+    def format_calculator_integral(self, value, width, signed=False):
+        """Format an integer in the calculator's display basis (negative values as two's complement)"""
+        if self.calc_basis == 'hex':
+            if signed and value < 0:
+                mask = (1 << (width * 4)) - 1
+                value = value & mask
+            return f"0x{value:0{width}X}"
+        elif self.calc_basis == 'oct':
+            if signed and value < 0:
+                bits = width * 4
+                mask = (1 << bits) - 1
+                value = value & mask
+            return f"0o{value:o}"
+        else:
+            return str(value)
+
+    def update_calculator_inspector(self):
+        """Reinterpret the calculator input as every inspector type (runs on each keystroke)"""
+        if self.calc_updating:
+            return
+
+        self.calc_updating = True
+
+        value_str = self.calc_input_edit.text().strip().upper()
+
+        # Clear all fields
+        for field in self.calc_fields.values():
+            field.clear()
+
+        if not value_str:
+            self.calc_updating = False
+            return
+
+        try:
+            # Detect input type
+            is_hex_string = False
+            hex_value_str = value_str
+            is_float = '.' in value_str
+
+            if value_str.startswith('0X'):
+                hex_value_str = value_str[2:]
+                is_hex_string = True
+            elif not value_str.translate(HEX_DIGIT_DELETE_TABLE):
+                # Only hex digits: spaced input is hex bytes, unspaced input needs a letter
+                # digit to tell it apart from a decimal number
+                is_hex_string = ' ' in value_str or bool(value_str.translate(DECIMAL_DIGIT_DELETE_TABLE))
+
+            if is_hex_string:
+                hex_clean = hex_value_str.replace(' ', '')
+                if len(hex_clean) % 2 != 0:
+                    hex_clean = '0' + hex_clean
+
+                hex_bytes = bytes.fromhex(hex_clean)
+                structs = STRUCTS[self.calc_endianness]
+
+                # Populate integer fields
+                if len(hex_bytes) >= 1:
+                    int8_val = structs['b'].unpack_from(hex_bytes)[0]
+                    uint8_val = hex_bytes[0]
+                    self.calc_fields["Int8:"].setText(self.format_calculator_integral(int8_val, 2, signed=True))
+                    self.calc_fields["UInt8:"].setText(self.format_calculator_integral(uint8_val, 2))
+
+                if len(hex_bytes) >= 2:
+                    int16_val = structs['h'].unpack_from(hex_bytes)[0]
+                    uint16_val = structs['H'].unpack_from(hex_bytes)[0]
+                    self.calc_fields["Int16:"].setText(self.format_calculator_integral(int16_val, 4, signed=True))
+                    self.calc_fields["UInt16:"].setText(self.format_calculator_integral(uint16_val, 4))
+
+                if len(hex_bytes) >= 4:
+                    int32_val = structs['i'].unpack_from(hex_bytes)[0]
+                    uint32_val = structs['I'].unpack_from(hex_bytes)[0]
+                    self.calc_fields["Int32:"].setText(self.format_calculator_integral(int32_val, 8, signed=True))
+                    self.calc_fields["UInt32:"].setText(self.format_calculator_integral(uint32_val, 8))
+
+                    float32_val = structs['f'].unpack_from(hex_bytes)[0]
+                    self.calc_fields["Float32:"].setText(f"{float32_val:.6f}")
+
+                if len(hex_bytes) >= 8:
+                    int64_val = structs['q'].unpack_from(hex_bytes)[0]
+                    uint64_val = structs['Q'].unpack_from(hex_bytes)[0]
+                    self.calc_fields["Int64:"].setText(self.format_calculator_integral(int64_val, 16, signed=True))
+                    self.calc_fields["UInt64:"].setText(self.format_calculator_integral(uint64_val, 16))
+
+                    float64_val = structs['d'].unpack_from(hex_bytes)[0]
+                    self.calc_fields["Float64:"].setText(f"{float64_val:.15f}")
+
+                # LEB128
+                if len(hex_bytes) > 0:
+                    try:
+                        leb_val, leb_size = read_leb128(hex_bytes, signed=True)
+                        self.calc_fields["LEB128:"].setText(str(leb_val))
+                    except:
+                        self.calc_fields["LEB128:"].setText("Invalid")
+
+                    try:
+                        uleb_val, uleb_size = read_leb128(hex_bytes, signed=False)
+                        self.calc_fields["ULEB128:"].setText(str(uleb_val))
+                    except:
+                        self.calc_fields["ULEB128:"].setText("Invalid")
+
+            elif is_float:
+                float_value = float(value_str)
+                structs = STRUCTS[self.calc_endianness]
+
+                # Float32
+                float32_bytes = structs['f'].pack(float_value)
+                float32_hex = float32_bytes.hex(' ').upper()
+                self.calc_fields["Float32:"].setText(float32_hex)
+
+                # Float64
+                float64_bytes = structs['d'].pack(float_value)
+                float64_hex = float64_bytes.hex(' ').upper()
+                self.calc_fields["Float64:"].setText(float64_hex)
+
+            else:
+                int_value = int(value_str)
+                structs = STRUCTS[self.calc_endianness]
+
+                # Pack to different sizes and show hex
+                try:
+                    int8_bytes = structs['b'].pack(int_value)
+                    self.calc_fields["Int8:"].setText(int8_bytes.hex(' ').upper())
+                except:
+                    self.calc_fields["Int8:"].setText("Overflow")
+
+                try:
+                    uint8_bytes = structs['B'].pack(int_value)
+                    self.calc_fields["UInt8:"].setText(uint8_bytes.hex(' ').upper())
+                except:
+                    self.calc_fields["UInt8:"].setText("Overflow")
+
+                try:
+                    int16_bytes = structs['h'].pack(int_value)
+                    self.calc_fields["Int16:"].setText(int16_bytes.hex(' ').upper())
+                except:
+                    self.calc_fields["Int16:"].setText("Overflow")
+
+                try:
+                    uint16_bytes = structs['H'].pack(int_value)
+                    self.calc_fields["UInt16:"].setText(uint16_bytes.hex(' ').upper())
+                except:
+                    self.calc_fields["UInt16:"].setText("Overflow")
+
+                try:
+                    int32_bytes = structs['i'].pack(int_value)
+                    self.calc_fields["Int32:"].setText(int32_bytes.hex(' ').upper())
+                except:
+                    self.calc_fields["Int32:"].setText("Overflow")
+
+                try:
+                    uint32_bytes = structs['I'].pack(int_value)
+                    self.calc_fields["UInt32:"].setText(uint32_bytes.hex(' ').upper())
+                except:
+                    self.calc_fields["UInt32:"].setText("Overflow")
+
+                try:
+                    int64_bytes = structs['q'].pack(int_value)
+                    self.calc_fields["Int64:"].setText(int64_bytes.hex(' ').upper())
+                except:
+                    self.calc_fields["Int64:"].setText("Overflow")
+
+                try:
+                    uint64_bytes = structs['Q'].pack(int_value)
+                    self.calc_fields["UInt64:"].setText(uint64_bytes.hex(' ').upper())
+                except:
+                    self.calc_fields["UInt64:"].setText("Overflow")
+
+                # LEB128 encoding
+                try:
+                    leb_bytes = []
+                    val = int_value
+                    while True:
+                        byte = val & 0x7f
+                        val >>= 7
+                        if (val == 0 and (byte & 0x40) == 0) or (val == -1 and (byte & 0x40) != 0):
+                            leb_bytes.append(byte)
+                            break
+                        leb_bytes.append(byte | 0x80)
+                    self.calc_fields["LEB128:"].setText(bytes(leb_bytes).hex(' ').upper())
+                except:
+                    self.calc_fields["LEB128:"].setText("Error")
+
+                # ULEB128 encoding
+                try:
+                    uleb_bytes = []
+                    val = int_value if int_value >= 0 else 0
+                    while True:
+                        byte = val & 0x7f
+                        val >>= 7
+                        if val == 0:
+                            uleb_bytes.append(byte)
+                            break
+                        uleb_bytes.append(byte | 0x80)
+                    self.calc_fields["ULEB128:"].setText(bytes(uleb_bytes).hex(' ').upper())
+                except:
+                    self.calc_fields["ULEB128:"].setText("Error")
+
+        except (ValueError, OverflowError, struct.error):
+            pass
+
+        self.calc_updating = False
 
     def show_color_picker_window(self):
         dialog = QDialog(self, Qt.Window)
@@ -8514,9 +8994,8 @@ class HexEditorQt(QMainWindow):
         preview_frame = QWidget()
         preview_frame_layout = QHBoxLayout()
         preview_frame_layout.setAlignment(Qt.AlignCenter)
-        preview_canvas = QLabel()
+        preview_canvas = ColorPreviewCircle(theme['border'])
         preview_canvas.setFixedSize(140, 140)
-        preview_canvas.setStyleSheet(f"background-color: #000000; border: 3px solid {theme['border']}; border-radius: 70px;")
         preview_frame_layout.addWidget(preview_canvas)
         preview_frame.setLayout(preview_frame_layout)
         layout.addWidget(preview_frame)
@@ -8677,13 +9156,8 @@ class HexEditorQt(QMainWindow):
             b_value.setText(str(b))
             a_value.setText(str(a))
 
-            # Update preview with transparency support
-            if has_alpha:
-                # Use rgba() format for transparency
-                preview_canvas.setStyleSheet(f"background-color: rgba({r}, {g}, {b}, {a/255.0:.2f}); border: 3px solid {theme['border']}; border-radius: 70px;")
-            else:
-                hex_color = f"#{r:02X}{g:02X}{b:02X}"
-                preview_canvas.setStyleSheet(f"background-color: {hex_color}; border: 3px solid {theme['border']}; border-radius: 70px;")
+            # Update preview with transparency support (no stylesheet re-parse per change)
+            preview_canvas.set_color(QColor(r, g, b, a if has_alpha else 255))
 
             # Always update translate output with decimal values (0.00-1.00)
             r_decimal = r / 255.0
@@ -8791,12 +9265,19 @@ class HexEditorQt(QMainWindow):
 
             QApplication.clipboard().setText(rgb_str)
 
+        # Slider drags fire valueChanged for every step; coalesce them so the preview is
+        # redrawn at most once per frame (start() restarts the pending countdown)
+        color_timer = QTimer(dialog)
+        color_timer.setSingleShot(True)
+        color_timer.setInterval(16)
+        color_timer.timeout.connect(update_color)
+
         # Connect signals
         alpha_assist_btn.clicked.connect(cycle_alpha_assist)
-        r_slider.valueChanged.connect(update_color)
-        g_slider.valueChanged.connect(update_color)
-        b_slider.valueChanged.connect(update_color)
-        a_slider.valueChanged.connect(update_color)
+        r_slider.valueChanged.connect(lambda _value: color_timer.start())
+        g_slider.valueChanged.connect(lambda _value: color_timer.start())
+        b_slider.valueChanged.connect(lambda _value: color_timer.start())
+        a_slider.valueChanged.connect(lambda _value: color_timer.start())
         copy_raw_btn.clicked.connect(copy_raw)
         copy_hex_btn.clicked.connect(copy_hex)
         copy_rgb_btn.clicked.connect(copy_rgb)
@@ -8951,7 +9432,7 @@ class HexEditorQt(QMainWindow):
 
         file1_container_layout.addLayout(file1_headers)
 
-        file1_display = HexTextEdit()
+        file1_display = CompareTextEdit()
         file1_display.setFont(QFont("Courier", 10))
         file1_display.setReadOnly(True)
         file1_display.setMinimumHeight(500)
@@ -8996,7 +9477,7 @@ class HexEditorQt(QMainWindow):
 
         file2_container_layout.addLayout(file2_headers)
 
-        file2_display = HexTextEdit()
+        file2_display = CompareTextEdit()
         file2_display.setFont(QFont("Courier", 10))
         file2_display.setReadOnly(True)
         file2_display.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
@@ -9016,8 +9497,12 @@ class HexEditorQt(QMainWindow):
                 syncing[0] = True
                 file2_display.verticalScrollBar().setValue(value)
                 syncing[0] = False
+            shift_comparison_window(file1_display.verticalScrollBar(), value)
 
         file1_display.verticalScrollBar().valueChanged.connect(sync_file1_to_file2)
+        # file2 scrolled on its own must also be able to move the rendered window
+        file2_display.verticalScrollBar().valueChanged.connect(
+            lambda value: shift_comparison_window(file2_display.verticalScrollBar(), value))
 
         # Store data for comparison
         file1_original_data = None
@@ -9027,190 +9512,167 @@ class HexEditorQt(QMainWindow):
         current_style_swapped = False
         comp_cursor_position = None
         comp_cursor_nibble = 0
-
-        def format_comparison_view(data, differences_set, show_red_diff, original_data_for_edit_check=None, reference_data=None, cursor_pos=None, cursor_nibble=0, user_highlights=None, original_differences_set=None):
-            html = '<pre style="font-family: Courier; line-height: 1.4;">'
-
+        # First row of the rendered window (see COMPARE_WINDOW_ROWS) and a re-entry guard
+        # for the scroll handler while the window is being re-rendered
+        comparison_window = [0]
+        rendering_window = [False]
+        # comparison_row_styles arguments for each side, set by update_comparison_display
+        # and read back by the highlighters whenever a row is (re)highlighted
+        row_style_args = [None, None]
+        # Rendered line per row for each side, keyed by row offset (see comparison_row_line)
+        row_line_caches = ({}, {})
+        # Rows to redraw on the next comparison_timer tick, and the cursor row last drawn
+        dirty_rows = set()
+        drawn_cursor_row = [None]
+
+        def file1_byte_styles(block_number):
+            if row_style_args[0] is None:
+                return []
+            return comparison_row_styles((comparison_window[0] + block_number) * 16, *row_style_args[0])
+
+        def file2_byte_styles(block_number):
+            if row_style_args[1] is None:
+                return []
+            return comparison_row_styles((comparison_window[0] + block_number) * 16, *row_style_args[1])
+
+        file1_highlighter = CompareHighlighter(file1_display.document(), file1_byte_styles)
+        file2_highlighter = CompareHighlighter(file2_display.document(), file2_byte_styles)
+
+        def comparison_row_line(data, row_start, cache):
+            # Reuse the line rendered for this row while its bytes are unchanged
             bytes_per_row = 16
-            for row_start in range(0, len(data), bytes_per_row):
-                row_end = min(row_start + bytes_per_row, len(data))
-                row_data = data[row_start:row_end]
-
-                # Offset
-                offset_str = f"0x{row_start:08X}"
-                html += f'<span style="color: #888;">{offset_str}</span>  '
-
-                # Hex bytes
-                for i, byte in enumerate(row_data):
-                    offset = row_start + i
-                    hex_str = f"{byte:02X}"
-
-                    color = None
-                    bg_color = None
-                    is_cursor = (cursor_pos is not None and offset == cursor_pos)
-
-                    # Check for user highlights first
-                    if user_highlights and offset in user_highlights:
-                        highlight_info = user_highlights[offset]
-                        if highlight_info.get("underline", False):
-                            # Use underline - keep as text decoration later
-                            pass
-                        else:
-                            # Use background color with 25% opacity
-                            hex_color = highlight_info["color"].lstrip('#')
-                            r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
-                            bg_color = f'rgba({r}, {g}, {b}, 0.25)'
-
-                    if original_data_for_edit_check and reference_data and original_differences_set is not None:
-                        # Check if this byte was edited INSIDE Compare Data (after snapshot)
-                        if offset < len(original_data_for_edit_check) and byte != original_data_for_edit_check[offset]:
-                            # Byte was edited inside Compare Data
-                            if offset < len(reference_data) and byte == reference_data[offset]:
-                                # Edited to match File 2 - green
-                                color = '#00AA00'
-                            elif offset in original_differences_set:
-                                # Was different at snapshot (including pre-existing edits) - keep red
-                                color = '#FF0000'
-                            else:
-                                # Was matching at snapshot, edited to differ - show as blue (new edit)
-                                color = '#0066FF'
-                        elif offset in differences_set and show_red_diff:
-                            # Not edited in Compare Data, but different - show as red
+            row_data = bytes(data[row_start:row_start + bytes_per_row])
+            cached = cache.get(row_start)
+            if cached is not None and cached[0] == row_data:
+                return cached[1]
+            # Control characters (0x00-0x1F, 0x7F-0x9F) shown as dots, one table lookup per row
+            row_text = row_data.translate(ASCII_DISPLAY_TABLE).decode('latin-1')
+            padding = '   ' * (bytes_per_row - len(row_data))
+            line = f"0x{row_start:08X}  {row_data.hex(' ').upper()} {padding} | {row_text}"
+            cache[row_start] = (row_data, line)
+            return line
+
+        def format_comparison_view(data, first_row, row_count, cache):
+            # Plain rows only; CompareHighlighter colors them from comparison_row_styles
+            bytes_per_row = 16
+            window_end = min(len(data), (first_row + row_count) * bytes_per_row)
+            window_rows = range(first_row * bytes_per_row, window_end, bytes_per_row)
+            lines = [comparison_row_line(data, row_start, cache) for row_start in window_rows]
+            # Keep only this window's rows so the cache stays bounded as the window moves
+            for row_start in cache.keys() - set(window_rows):
+                del cache[row_start]
+            return '\n'.join(lines)
+
+        def comparison_row_styles(row_start, data, differences_mask, show_red_diff, original_data_for_edit_check=None, reference_data=None, cursor_pos=None, cursor_nibble=0, user_highlights=None, original_differences_mask=None):
+            bytes_per_row = 16
+            row_end = min(row_start + bytes_per_row, len(data))
+            row_data = data[row_start:row_end]
+
+            # Most rows have nothing to color: no cursor, user highlight, shown difference
+            # or byte edited since the snapshot. Those rows skip the per-byte checks below
+            row_plain = not (
+                (cursor_pos is not None and row_start <= cursor_pos < row_end) or
+                (user_highlights and not user_highlights.keys().isdisjoint(range(row_start, row_end))) or
+                (show_red_diff and 1 in differences_mask[row_start:row_end]) or
+                (original_data_for_edit_check and reference_data and original_differences_mask is not None and
+                 row_data != original_data_for_edit_check[row_start:row_end])
+            )
+            if row_plain:
+                return []
+
+            # Use cursor background color matching main editor theme
+            cursor_bg = '#404040' if self.is_dark_theme() else '#C8DCFF'
+            styles = []
+            for i, byte in enumerate(row_data):
+                offset = row_start + i
+
+                color = None
+                bg_color = None
+
+                # Check for user highlights first
+                if user_highlights and offset in user_highlights:
+                    highlight_info = user_highlights[offset]
+                    if not highlight_info.get("underline", False):
+                        # Use background color with 25% opacity (#AARRGGBB)
+                        bg_color = '#40' + highlight_info["color"].lstrip('#')
+
+                if original_data_for_edit_check and reference_data and original_differences_mask is not None:
+                    # Check if this byte was edited INSIDE Compare Data (after snapshot)
+                    if offset < len(original_data_for_edit_check) and byte != original_data_for_edit_check[offset]:
+                        # Byte was edited inside Compare Data
+                        if offset < len(reference_data) and byte == reference_data[offset]:
+                            # Edited to match File 2 - green
+                            color = '#00AA00'
+                        elif original_differences_mask[offset]:
+                            # Was different at snapshot (including pre-existing edits) - keep red
                             color = '#FF0000'
-                    elif offset in differences_set and show_red_diff:
-                        color = '#FF0000'
-
-                    # Format the byte with highlighting and per-nibble bold
-                    if is_cursor:
-                        # Highlight entire byte, make specific nibble bold
-                        first_nibble = hex_str[0]
-                        second_nibble = hex_str[1]
-
-                        # Use cursor background color matching main editor theme
-                        cursor_bg = '#404040' if self.is_dark_theme() else '#C8DCFF'
-                        if color:
-                            # Keep color but add background highlight
-                            if cursor_nibble == 0:
-                                html += f'<span style="color: {color}; background-color: {cursor_bg};"><b>{first_nibble}</b>{second_nibble}</span> '
-                            else:
-                                html += f'<span style="color: {color}; background-color: {cursor_bg};">{first_nibble}<b>{second_nibble}</b></span> '
-                        else:
-                            # No color, just highlight and bold
-                            if cursor_nibble == 0:
-                                html += f'<span style="background-color: {cursor_bg};"><b>{first_nibble}</b>{second_nibble}</span> '
-                            else:
-                                html += f'<span style="background-color: {cursor_bg};">{first_nibble}<b>{second_nibble}</b></span> '
-                    elif bg_color:
-                        # User highlight background
-                        if color:
-                            html += f'<span style="color: {color}; background-color: {bg_color}; font-weight: bold;">{hex_str}</span> '
                         else:
-                            html += f'<span style="background-color: {bg_color};">{hex_str}</span> '
-                    elif color:
-                        html += f'<span style="color: {color}; font-weight: bold;">{hex_str}</span> '
-                    else:
-                        html += f'{hex_str} '
-
-                # Padding for incomplete rows
-                padding = bytes_per_row - len(row_data)
-                html += '   ' * padding
-
-                # Decoded text
-                html += ' | '
-                for i, byte in enumerate(row_data):
-                    offset = row_start + i
-                    # Control characters (0x00-0x1F, 0x7F-0x9F) shown as dots
-                    char = chr(byte) if (32 <= byte <= 126) or (160 <= byte <= 255) else '.'
-
-                    color = None
-                    bg_color = None
-                    is_cursor = (cursor_pos is not None and offset == cursor_pos)
-
-                    # Check for user highlights first
-                    if user_highlights and offset in user_highlights:
-                        highlight_info = user_highlights[offset]
-                        if highlight_info.get("underline", False):
-                            # Use underline - keep as text decoration later
-                            pass
-                        else:
-                            # Use background color with 25% opacity
-                            hex_color = highlight_info["color"].lstrip('#')
-                            r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
-                            bg_color = f'rgba({r}, {g}, {b}, 0.25)'
-
-                    if original_data_for_edit_check and reference_data and original_differences_set is not None:
-                        # Check if this byte was edited INSIDE Compare Data (after snapshot)
-                        if offset < len(original_data_for_edit_check) and byte != original_data_for_edit_check[offset]:
-                            # Byte was edited inside Compare Data
-                            if offset < len(reference_data) and byte == reference_data[offset]:
-                                # Edited to match File 2 - green
-                                color = '#00AA00'
-                            elif offset in original_differences_set:
-                                # Was different at snapshot (including pre-existing edits) - keep red
-                                color = '#FF0000'
-                            else:
-                                # Was matching at snapshot, edited to differ - show as blue (new edit)
-                                color = '#0066FF'
-                        elif offset in differences_set and show_red_diff:
-                            # Not edited in Compare Data, but different - show as red
-                            color = '#FF0000'
-                    elif offset in differences_set and show_red_diff:
+                            # Was matching at snapshot, edited to differ - show as blue (new edit)
+                            color = '#0066FF'
+                    elif differences_mask[offset] and show_red_diff:
+                        # Not edited in Compare Data, but different - show as red
                         color = '#FF0000'
+                elif differences_mask[offset] and show_red_diff:
+                    color = '#FF0000'
+
+                if cursor_pos is not None and offset == cursor_pos:
+                    styles.append((i, color, cursor_bg, cursor_nibble))
+                elif color or bg_color:
+                    styles.append((i, color, bg_color, None))
+            return styles
+
+        def comparison_total_rows():
+            return (max(len(file1_current_data), len(file2_data)) + 15) // 16
+
+        def scroll_comparison_to_rows(file1_row, file2_row):
+            # Put the given absolute rows at the top of each view (plain text views scroll by rows)
+            syncing[0] = True
+            file1_display.verticalScrollBar().setValue(file1_row - comparison_window[0])
+            file2_display.verticalScrollBar().setValue(file2_row - comparison_window[0])
+            syncing[0] = False
+
+        def shift_comparison_window(scrollbar, value):
+            # Slide the rendered window by half its size once either view's scrolling hits an end
+            # of it, keeping the top visible row of both views in place
+            if rendering_window[0] or file1_current_data is None or file2_data is None:
+                return
+            first = comparison_window[0]
+            if value >= scrollbar.maximum() and first + COMPARE_WINDOW_ROWS < comparison_total_rows():
+                new_first = min(first + COMPARE_WINDOW_ROWS // 2, comparison_total_rows() - COMPARE_WINDOW_ROWS)
+            elif value <= scrollbar.minimum() and first > 0:
+                new_first = max(first - COMPARE_WINDOW_ROWS // 2, 0)
+            else:
+                return
+            top_rows = (first + file1_display.verticalScrollBar().value(),
+                        first + file2_display.verticalScrollBar().value())
+            comparison_window[0] = new_first
+            update_comparison_display(top_rows)
 
-                    # Format the character
-                    if is_cursor:
-                        # Highlight and bold the character at cursor position
-                        cursor_bg = '#404040' if self.is_dark_theme() else '#C8DCFF'
-                        if color:
-                            html += f'<span style="color: {color}; background-color: {cursor_bg}; font-weight: bold;">{char}</span>'
-                        else:
-                            html += f'<span style="background-color: {cursor_bg}; font-weight: bold;">{char}</span>'
-                    elif bg_color:
-                        # User highlight background
-                        if color:
-                            html += f'<span style="color: {color}; background-color: {bg_color}; font-weight: bold;">{char}</span>'
-                        else:
-                            html += f'<span style="background-color: {bg_color};">{char}</span>'
-                    elif color:
-                        html += f'<span style="color: {color}; font-weight: bold;">{char}</span>'
-                    else:
-                        html += char
-
-                html += '\n'
-
-            html += '</pre>'
-            return html
-
-        def update_comparison_display():
+        def update_comparison_display(top_rows=None):
             if file1_current_data is None or file2_data is None:
                 return
 
+            # Re-center the window when the cursor has moved out of it, and bring the cursor row into view
+            if comp_cursor_position is not None and top_rows is None:
+                cursor_row = comp_cursor_position // 16
+                first = comparison_window[0]
+                if not first <= cursor_row < first + COMPARE_WINDOW_ROWS:
+                    comparison_window[0] = max(0, min(cursor_row - COMPARE_WINDOW_ROWS // 2,
+                                                      comparison_total_rows() - COMPARE_WINDOW_ROWS))
+                    top_rows = (cursor_row, cursor_row)
+
             # Save scroll positions independently
             file1_scrollbar = file1_display.verticalScrollBar()
             file2_scrollbar = file2_display.verticalScrollBar()
             file1_scroll_pos = file1_scrollbar.value()
             file2_scroll_pos = file2_scrollbar.value()
 
-            # Find differences between current and original
-            differences = set()
-            original_differences = set()
-            max_len = max(len(file1_current_data), len(file2_data))
-
-            for i in range(max_len):
-                byte1 = file1_current_data[i] if i < len(file1_current_data) else None
-                byte2 = file2_data[i] if i < len(file2_data) else None
-
-                if byte1 != byte2:
-                    differences.add(i)
+            # Find differences between current and original (indexable 0/1 masks, one byte per offset;
+            # a bytearray so refresh_comparison_rows can patch the rows it redraws)
+            differences = bytearray(byte_difference_mask(file1_current_data, file2_data))
 
             # Track differences at the time Compare Data was opened (snapshot)
-            max_len_snap = max(len(file1_snapshot_data), len(file2_data))
-            for i in range(max_len_snap):
-                snap_byte1 = file1_snapshot_data[i] if i < len(file1_snapshot_data) else None
-                byte2 = file2_data[i] if i < len(file2_data) else None
-
-                if snap_byte1 != byte2:
-                    original_differences.add(i)
+            original_differences = byte_difference_mask(file1_snapshot_data, file2_data)
 
             # Determine which highlights to use
             file1_highlights = None
@@ -9229,15 +9691,74 @@ class HexEditorQt(QMainWindow):
                         file2_highlights = file_tab.byte_highlights
 
             # Display both files with red differences on both sides and cursor highlighting
-            file1_html = format_comparison_view(file1_current_data, differences, True, file1_snapshot_data, file2_data, comp_cursor_position, comp_cursor_nibble, file1_highlights, original_differences)
-            file2_html = format_comparison_view(file2_data, differences, True, cursor_pos=comp_cursor_position, cursor_nibble=comp_cursor_nibble, user_highlights=file2_highlights)
+            row_style_args[0] = (file1_current_data, differences, True, file1_snapshot_data, file2_data, comp_cursor_position, comp_cursor_nibble, file1_highlights, original_differences)
+            row_style_args[1] = (file2_data, differences, True, None, None, comp_cursor_position, comp_cursor_nibble, file2_highlights)
 
-            file1_display.setHtml(file1_html)
-            file2_display.setHtml(file2_html)
+            rendering_window[0] = True
+            file1_display.setPlainText(format_comparison_view(file1_current_data, comparison_window[0], COMPARE_WINDOW_ROWS, row_line_caches[0]))
+            file2_display.setPlainText(format_comparison_view(file2_data, comparison_window[0], COMPARE_WINDOW_ROWS, row_line_caches[1]))
+            dirty_rows.clear()
+            drawn_cursor_row[0] = None if comp_cursor_position is None else comp_cursor_position // 16
 
-            # Restore scroll positions independently
-            file1_scrollbar.setValue(file1_scroll_pos)
-            file2_scrollbar.setValue(file2_scroll_pos)
+            if top_rows is not None:
+                scroll_comparison_to_rows(*top_rows)
+            else:
+                # Restore scroll positions independently
+                syncing[0] = True
+                file1_scrollbar.setValue(file1_scroll_pos)
+                file2_scrollbar.setValue(file2_scroll_pos)
+                syncing[0] = False
+            rendering_window[0] = False
+
+        def refresh_comparison_rows():
+            # Redraw only the edited rows and the old and new cursor rows; anything that moves
+            # the window falls back to a full update_comparison_display
+            if file1_current_data is None or file2_data is None:
+                return
+            first = comparison_window[0]
+            if (row_style_args[0] is None or comp_cursor_position is None or
+                    not first <= comp_cursor_position // 16 < first + COMPARE_WINDOW_ROWS):
+                update_comparison_display()
+                return
+
+            cursor_row = comp_cursor_position // 16
+            rows = dirty_rows | {drawn_cursor_row[0], cursor_row}
+            dirty_rows.clear()
+            drawn_cursor_row[0] = cursor_row
+
+            # Only the cursor changes in the style arguments; the difference mask is patched per row
+            cursor_args = (comp_cursor_position, comp_cursor_nibble)
+            row_style_args[0] = row_style_args[0][:5] + cursor_args + row_style_args[0][7:]
+            row_style_args[1] = row_style_args[1][:5] + cursor_args + row_style_args[1][7:]
+            differences = row_style_args[0][1]
+
+            for row in rows:
+                if row is None or not first <= row < first + COMPARE_WINDOW_ROWS:
+                    continue
+                row_start = row * 16
+                row_mask = byte_difference_mask(file1_current_data[row_start:row_start + 16], file2_data[row_start:row_start + 16])
+                differences[row_start:row_start + len(row_mask)] = row_mask
+
+                block = file1_display.document().findBlockByNumber(row - first)
+                if block.isValid():
+                    line = comparison_row_line(file1_current_data, row_start, row_line_caches[0])
+                    if block.text() != line:
+                        # Replacing the block's text re-highlights it
+                        cursor = QTextCursor(block)
+                        cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+                        cursor.insertText(line)
+                    else:
+                        file1_highlighter.rehighlightBlock(block)
+                block = file2_display.document().findBlockByNumber(row - first)
+                if block.isValid():
+                    file2_highlighter.rehighlightBlock(block)
+
+        # Typing and clicking can outpace redrawing; coalesce their redraws to at most
+        # one per frame (start() restarts the pending countdown)
+        comparison_timer = QTimer(dialog)
+        comparison_timer.setSingleShot(True)
+        comparison_timer.setInterval(16)
+        comparison_timer.timeout.connect(refresh_comparison_rows)
 
         def compare_files():
             nonlocal file1_original_data, file2_data, file1_current_data, file1_snapshot_data, comp_cursor_position, comp_cursor_nibble
@@ -9286,6 +9807,7 @@ class HexEditorQt(QMainWindow):
 
                 comp_cursor_position = 0
                 comp_cursor_nibble = 0
+                comparison_window[0] = 0
                 update_comparison_display()
 
             except Exception as e:
@@ -9313,26 +9835,19 @@ class HexEditorQt(QMainWindow):
             if file1_current_data is None:
                 return
 
+            # Hit-test against the clicked block only, never the whole document text
             cursor = file1_display.cursorForPosition(event.pos())
-            text = file1_display.toPlainText()
-            pos = cursor.position()
-
-            lines = text[:pos].split('\n')
-            if not lines:
-                return
-
-            current_line = lines[-1]
+            line_full = cursor.block().text()
+            col_in_line = cursor.positionInBlock()
 
             # Parse offset
             try:
-                line_full = text.split('\n')[len(lines) - 1] if len(lines) <= len(text.split('\n')) else ""
                 if '|' in line_full:
                     offset_part = line_full.split('|')[0].strip().split()[0]
                     row_offset = int(offset_part, 16)
 
                     # Find column
-                    col_in_line = len(current_line)
-                    hex_start_col = 12
+                    hex_start_col = COMPARE_HEX_COLUMN
 
                     if col_in_line >= hex_start_col:
                         hex_col = col_in_line - hex_start_col
@@ -9346,7 +9861,7 @@ class HexEditorQt(QMainWindow):
                             comp_cursor_position = len(file1_current_data) - 1
 
                         # Update display to show bold cursor
-                        update_comparison_display()
+                        comparison_timer.start()
             except:
                 pass
 
@@ -9375,6 +9890,7 @@ class HexEditorQt(QMainWindow):
                     # Save the position of the byte we're editing before moving cursor
                     edited_position = comp_cursor_position
                     file1_current_data[edited_position] = new_value
+                    dirty_rows.add(edited_position // 16)
 
                     # Move cursor
                     if comp_cursor_nibble == 0:
@@ -9384,7 +9900,7 @@ class HexEditorQt(QMainWindow):
                         if comp_cursor_position < len(file1_current_data) - 1:
                             comp_cursor_position += 1
 
-                    update_comparison_display()
+                    comparison_timer.start()
 
                     # Update main editor if this is the current file
                     if self.current_tab_index >= 0:
@@ -9392,6 +9908,7 @@ class HexEditorQt(QMainWindow):
                         if current_file.file_path == file1_edit.text():
                             current_file.file_data = bytearray(file1_current_data)
                             current_file.modified = True
+                            current_file.pattern_highlights_dirty = True  # Mark pattern highlights for reapplication
                             # Mark the edited byte as replaced (red) if it differs from original
                             if edited_position not in current_file.inserted_bytes:
                                 if edited_position < len(current_file.original_data):
@@ -9410,19 +9927,13 @@ class HexEditorQt(QMainWindow):
             if file2_data is None:
                 return
 
+            # Hit-test against the clicked block only, never the whole document text
             cursor = file2_display.cursorForPosition(event.pos())
-            text = file2_display.toPlainText()
-            pos = cursor.position()
-
-            lines = text[:pos].split('\n')
-            if not lines:
-                return
-
-            current_line = lines[-1]
+            line_full = cursor.block().text()
+            col_in_line = cursor.positionInBlock()
 
             # Parse offset
             try:
-                line_full = text.split('\n')[len(lines) - 1] if len(lines) <= len(text.split('\n')) else ""
                 if '|' not in line_full:
                     return
 
@@ -9430,9 +9941,8 @@ class HexEditorQt(QMainWindow):
                 row_offset = int(offset_part, 16)
 
                 # Find column - need to get the actual character at cursor position
-                col_in_line = len(current_line)
-                hex_start_col = 12
-                hex_end_col = 12 + (16 * 3) - 1  # 16 bytes * 3 chars per byte - 1
+                hex_start_col = COMPARE_HEX_COLUMN
+                hex_end_col = COMPARE_HEX_COLUMN + (16 * 3) - 1  # 16 bytes * 3 chars per byte - 1
 
                 # Check if we're in the hex area
                 if col_in_line < hex_start_col or col_in_line > hex_end_col:
@@ -9447,8 +9957,8 @@ class HexEditorQt(QMainWindow):
                     return
 
                 # Get the character at the click position
-                if pos < len(text):
-                    clicked_char = text[pos]
+                if col_in_line < len(line_full):
+                    clicked_char = line_full[col_in_line]
                     # If clicking on a space (nibble_col == 2), select that byte's second nibble
                     if clicked_char == ' ':
                         # Space after a byte - select this byte's second nibble
@@ -9474,7 +9984,7 @@ class HexEditorQt(QMainWindow):
                 file1_display.verticalScrollBar().setValue(file2_scroll)
                 syncing[0] = False
 
-                update_comparison_display()
+                comparison_timer.start()
             except:
                 pass
 
@@ -10388,6 +10898,7 @@ class HexEditorQt(QMainWindow):
 
                 new_byte = int(new_hex, 16)
                 current_file.file_data[self.cursor_position] = new_byte
+                current_file.mark_pattern_range_dirty(self.cursor_position, self.cursor_position + 1)
 
                 # Mark as modified only if the byte differs from the original
                 if self.cursor_position not in current_file.inserted_bytes:
@@ -10610,6 +11121,7 @@ class HexEditorQt(QMainWindow):
             return
         self.snapshot_timer.stop()
         is_started = self.snapshot_timer.start(3000)  # 3 seconds after last edit
+        self._last_status_key = None  # The next update_status must overwrite this message
         self.status_label.setText(f"Edit detected - snapshot scheduled (timer active: {self.snapshot_timer.isActive()})")
 
 
@@ -10619,9 +11131,13 @@ class HexEditorQt(QMainWindow):
             return
 
         current_file = self.open_files[self.current_tab_index]
-        current_data = bytes(current_file.file_data)
 
-        # Only create snapshot if data has changed
+        # Only create snapshot if data has changed. A bytearray compares against the last
+        # snapshot directly, so an unchanged file returns before the copy below
+        if current_file.file_data == current_file.last_snapshot_data:
+            return
+        current_data = bytes(current_file.file_data)
+        # (an mmap doesn't compare with ==, so check its copy)
         if current_file.last_snapshot_data == current_data:
             return
 
@@ -10722,6 +11238,7 @@ class HexEditorQt(QMainWindow):
 
                 # Restore snapshot data
                 current_file.file_data = bytearray(snapshot['data'])
+                current_file.pattern_highlights_dirty = True  # Mark pattern highlights for reapplication
                 current_file.modified_bytes = set(snapshot['modified_bytes'])
                 current_file.inserted_bytes = set(snapshot['inserted_bytes'])
                 current_file.replaced_bytes = set(snapshot['replaced_bytes'])
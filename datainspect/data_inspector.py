@@ -18,9 +18,430 @@ Each data type can be edited in-place, and changes are written back to the file
 """
 
 import struct
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from functools import lru_cache
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit
 from PyQt5.QtGui import QFont
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QThread, QCoreApplication, pyqtSignal, pyqtSlot
+
+# Two-digit uppercase hex string for every byte value, e.g. HEX_BYTES[0xAB] == "AB"
+HEX_BYTES = tuple(f"{i:02X}" for i in range(256))
+HEX_BYTES_PREFIXED = tuple(f"0x{h}" for h in HEX_BYTES)
+# Byte value of every 1- or 2-digit uppercase hex string, e.g. HEX_BYTE_VALUES["AB"] == 0xAB
+HEX_BYTE_VALUES = {**{f"{i:X}": i for i in range(16)}, **{h: i for i, h in enumerate(HEX_BYTES)}}
+
+# Precompiled struct formats per byte order, keyed by format code (without the byte order prefix)
+_STRUCT_CODES = ('b', 'B', 'h', 'H', 'i', 'I', 'q', 'Q', 'f', 'd', 'HH', 'IHH8s')
+STRUCTS = {
+    'little': {code: struct.Struct('<' + code) for code in _STRUCT_CODES},
+    'big': {code: struct.Struct('>' + code) for code in _STRUCT_CODES},
+}
+
+# Bytes written by an inspector edit, per data type (anything not listed writes 1 byte)
+EDIT_TYPE_SIZES = {
+    'byte_hex': 1, 'int8': 1, 'uint8': 1, 'ansichar': 1,
+    'int16': 2, 'uint16': 2, 'widechar': 2, 'dos_date': 2, 'dos_time': 2,
+    'int24': 3, 'uint24': 3,
+    'int32': 4, 'uint32': 4, 'float': 4, 'dos_datetime': 4, 'time_t_32': 4,
+    'int64': 8, 'uint64': 8, 'double': 8, 'oletime': 8, 'filetime': 8, 'time_t_64': 8,
+    'guid': 16,
+}
+
+# Fixed-width integer types editable from the inspector: data_type -> (signed, display name)
+INT_EDIT_TYPES = {
+    'int16': (True, "Int16"),
+    'uint16': (False, "UInt16"),
+    'int24': (True, "Int24"),
+    'uint24': (False, "UInt24"),
+    'int32': (True, "Int32"),
+    'uint32': (False, "UInt32"),
+    'int64': (True, "Int64"),
+    'uint64': (False, "UInt64"),
+}
+
+# Hex digits per dash-separated GUID text field
+GUID_FIELD_WIDTHS = (8, 4, 4, 4, 12)
+
+# Bytes from the cursor needed by the widest cached interpretation (GUID)
+INSPECTOR_WINDOW = 16
+
+# Longest x86 instruction; bytes from the cursor handed to the disassembler
+DISASM_WINDOW = 15
+DISASM_LABELS = ("Disassembly (x86-16):", "Disassembly (x86-32):", "Disassembly (x86-64):")
+# Completed disassembly rows remembered on the GUI side, keyed by (code bytes, address)
+DISASM_CACHE_SIZE = 4096
+
+
+def format_integral(value, basis, num_digits=None, signed=False):
+    """
+    Format an integral value in the given display basis.
+
+    Args:
+        value: Integer to format
+        basis: 'hex', 'oct' or 'dec'
+        num_digits: Zero-padded hex width (2, 4, 6, 8 or 16 digits)
+        signed: Whether negative values should be shown as two's complement in hex
+    """
+    if basis == 'hex':
+        if signed and value < 0:
+            # For signed negative values, convert to unsigned representation
+            if num_digits == 2:
+                value = value & 0xFF
+            elif num_digits == 4:
+                value = value & 0xFFFF
+            elif num_digits == 6:
+                value = value & 0xFFFFFF
+            elif num_digits == 8:
+                value = value & 0xFFFFFFFF
+            elif num_digits == 16:
+                value = value & 0xFFFFFFFFFFFFFFFF
+        if num_digits == 2 and 0 <= value <= 0xFF:
+            return HEX_BYTES_PREFIXED[value]
+        if num_digits:
+            return f"0x{value:0{num_digits}X}"
+        else:
+            return f"0x{value:X}"
+    elif basis == 'oct':
+        return f"0o{value:o}"
+    else:  # dec
+        return str(value)
+
+
+@lru_cache(maxsize=256)
+def compute_inspector_rows(window, pos, endian, basis, offset_mode):
+    """
+    Interpret the bytes at the cursor as every supported (non-disassembly) data type.
+
+    This is a pure function of its arguments, so results are memoized: moving the
+    cursor back over bytes that were already inspected reuses the cached rows, and
+    editing the bytes changes the window and therefore the cache key.
+
+    Args:
+        window: Up to INSPECTOR_WINDOW bytes starting at the cursor position
+        pos: Cursor position (shown in the Offset row)
+        endian: 'little' or 'big' endian for multi-byte values
+        basis: Integral display basis ('hex', 'dec' or 'oct')
+        offset_mode: 'h' for hex, otherwise decimal offset display
+
+    Returns:
+        Tuple of (label, value, byte_size, data_offset, data_type) rows
+    """
+    structs = STRUCTS[endian]
+    rows = []
+    # Zero-copy views: struct.unpack and int.from_bytes accept memoryview slices directly
+    window_view = memoryview(window)
+
+    def read_bytes(count):
+        """View count bytes from the start of the window, or None if out of bounds."""
+        if count <= len(window):
+            return window_view[:count]
+        return None
+
+    def add_row(label, value, byte_size=1, data_offset=0, data_type=None):
+        rows.append((label, str(value), byte_size, data_offset, data_type))
+
+    # Offset (current cursor position)
+    offset_str = f"0x{pos:X}" if offset_mode == 'h' else str(pos)
+    add_row("Offset:", offset_str, byte_size=0, data_offset=0, data_type='offset')
+
+    # Single byte value (always shown in hex)
+    byte_val = window[0]
+    if basis == 'hex':
+        add_row("Byte (hex):", HEX_BYTES_PREFIXED[byte_val], byte_size=1, data_offset=0, data_type='byte_hex')
+
+    # Int8 (signed 8-bit integer)
+    int8_val = byte_val - 0x100 if byte_val & 0x80 else byte_val
+    add_row("Int8:", format_integral(int8_val, basis, 2, signed=True), byte_size=1, data_offset=0, data_type='int8')
+
+    # UInt8 (unsigned 8-bit integer)
+    add_row("UInt8:", format_integral(byte_val, basis, 2), byte_size=1, data_offset=0, data_type='uint8')
+
+    # Int16 (signed 16-bit integer)
+    bytes_16 = read_bytes(2)
+    if bytes_16:
+        int16_val = structs['h'].unpack(bytes_16)[0]
+        add_row("Int16:", format_integral(int16_val, basis, 4, signed=True), byte_size=2, data_offset=0, data_type='int16')
+
+    # UInt16 (unsigned 16-bit integer)
+    if bytes_16:
+        uint16_val = structs['H'].unpack(bytes_16)[0]
+        add_row("UInt16:", format_integral(uint16_val, basis, 4), byte_size=2, data_offset=0, data_type='uint16')
+
+    # Int32 (signed 32-bit integer)
+    bytes_32 = read_bytes(4)
+    if bytes_32:
+        int32_val = structs['i'].unpack(bytes_32)[0]
+        add_row("Int32:", format_integral(int32_val, basis, 8, signed=True), byte_size=4, data_offset=0, data_type='int32')
+
+    # UInt32 (unsigned 32-bit integer)
+    if bytes_32:
+        uint32_val = structs['I'].unpack(bytes_32)[0]
+        add_row("UInt32:", format_integral(uint32_val, basis, 8), byte_size=4, data_offset=0, data_type='uint32')
+
+    # Int64 (signed 64-bit integer)
+    bytes_64 = read_bytes(8)
+    if bytes_64:
+        int64_val = structs['q'].unpack(bytes_64)[0]
+        add_row("Int64:", format_integral(int64_val, basis, 16, signed=True), byte_size=8, data_offset=0, data_type='int64')
+
+    # UInt64 (unsigned 64-bit integer)
+    if bytes_64:
+        uint64_val = structs['Q'].unpack(bytes_64)[0]
+        add_row("UInt64:", format_integral(uint64_val, basis, 16), byte_size=8, data_offset=0, data_type='uint64')
+
+    # Int24 (signed 24-bit integer - no struct code, decoded with int.from_bytes)
+    bytes_24 = read_bytes(3)
+    if bytes_24:
+        int24_val = int.from_bytes(bytes_24, endian, signed=True)
+        add_row("Int24:", format_integral(int24_val, basis, 6, signed=True), byte_size=3, data_offset=0, data_type='int24')
+
+    # UInt24 (unsigned 24-bit integer)
+    if bytes_24:
+        uint24_val = int.from_bytes(bytes_24, endian)
+        add_row("UInt24:", format_integral(uint24_val, basis, 6), byte_size=3, data_offset=0, data_type='uint24')
+
+    # LEB128 / ULEB128 (variable-length integers)
+    # One decode pass serves both rows: the signed value is the unsigned one sign-extended
+    leb_bytes = read_bytes(min(10, len(window)))
+    if leb_bytes:
+        uleb_val = 0
+        shift = 0
+        leb_size = 0
+        # Decode LEB128: each byte has 7 bits of data + continuation bit
+        for b in leb_bytes:
+            leb_size += 1
+            uleb_val |= (b & 0x7f) << shift
+            shift += 7
+            if (b & 0x80) == 0:  # No continuation bit, done
+                break
+        # Apply sign extension for the signed form
+        leb_val = uleb_val - (1 << shift) if uleb_val & (1 << (shift - 1)) else uleb_val
+        add_row("LEB128:", str(leb_val), byte_size=leb_size, data_offset=0, data_type='leb128')
+        add_row("ULEB128:", str(uleb_val), byte_size=leb_size, data_offset=0, data_type='uleb128')
+
+    # AnsiChar / char8_t (single byte character)
+    # Control characters shown as hex escape sequences
+    ansi_char = chr(byte_val) if (32 <= byte_val <= 126) or (160 <= byte_val <= 255) else f"\\x{byte_val:02x}"
+    add_row("AnsiChar / char8_t:", ansi_char, byte_size=1, data_offset=0, data_type='ansichar')
+
+    # WideChar / char16_t (UTF-16 character)
+    if bytes_16:
+        wide_val = structs['H'].unpack(bytes_16)[0]
+        try:
+            # Avoid surrogate pairs
+            wide_char = chr(wide_val) if wide_val < 0xD800 or wide_val > 0xDFFF else f"\\u{wide_val:04x}"
+        except:
+            wide_char = f"\\u{wide_val:04x}"
+        add_row("WideChar / char16_t:", wide_char, byte_size=2, data_offset=0, data_type='widechar')
+
+    # UTF-8 code point (variable length 1-4 bytes)
+    utf8_bytes = read_bytes(min(4, len(window)))
+    if utf8_bytes:
+        try:
+            # Determine UTF-8 sequence length from first byte
+            utf8_size = 1
+            if utf8_bytes[0] < 0x80:
+                utf8_size = 1
+            elif (utf8_bytes[0] & 0xE0) == 0xC0:
+                utf8_size = 2
+            elif (utf8_bytes[0] & 0xF0) == 0xE0:
+                utf8_size = 3
+            elif (utf8_bytes[0] & 0xF8) == 0xF0:
+                utf8_size = 4
+            utf8_str = bytes(utf8_bytes[:utf8_size]).decode('utf-8')
+            add_row("UTF-8 code point:", utf8_str, byte_size=utf8_size, data_offset=0, data_type='utf8')
+        except:
+            add_row("UTF-8 code point:", "Invalid", byte_size=1, data_offset=0, data_type=None)
+
+    # Single (float32) - IEEE 754 single precision floating point
+    if bytes_32:
+        float_val = structs['f'].unpack(bytes_32)[0]
+        add_row("Single (float32):", f"{float_val:.6f}", byte_size=4, data_offset=0, data_type='float')
+
+    # Double (float64) - IEEE 754 double precision floating point
+    if bytes_64:
+        double_val = structs['d'].unpack(bytes_64)[0]
+        add_row("Double (float64):", f"{double_val:.15f}", byte_size=8, data_offset=0, data_type='double')
+
+    # OLETIME (OLE Automation date - days since 1899-12-30 as double)
+    if bytes_64:
+        ole_val = structs['d'].unpack(bytes_64)[0]
+        try:
+            base_date = datetime(1899, 12, 30)
+            result_date = base_date + timedelta(days=ole_val)
+            add_row("OLETIME:", result_date.strftime("%Y-%m-%d %H:%M:%S"), byte_size=8, data_offset=0, data_type='oletime')
+        except:
+            add_row("OLETIME:", "Invalid", byte_size=8, data_offset=0, data_type=None)
+
+    # FILETIME (Windows FILETIME - 100-nanosecond intervals since 1601-01-01)
+    if bytes_64:
+        filetime_val = structs['Q'].unpack(bytes_64)[0]
+        try:
+            if filetime_val > 0:
+                base_date = datetime(1601, 1, 1)
+                result_date = base_date + timedelta(microseconds=filetime_val / 10)
+                add_row("FILETIME:", result_date.strftime("%Y-%m-%d %H:%M:%S"), byte_size=8, data_offset=0, data_type='filetime')
+            else:
+                add_row("FILETIME:", "Invalid", byte_size=8, data_offset=0, data_type=None)
+        except:
+            add_row("FILETIME:", "Invalid", byte_size=8, data_offset=0, data_type=None)
+
+    # DOS date (2 bytes - packed date format used by MS-DOS)
+    if bytes_16:
+        dos_date = structs['H'].unpack(bytes_16)[0]
+        try:
+            # Extract day (5 bits), month (4 bits), year (7 bits + 1980)
+            day = dos_date & 0x1F
+            month = (dos_date >> 5) & 0x0F
+            year = ((dos_date >> 9) & 0x7F) + 1980
+            if 1 <= day <= 31 and 1 <= month <= 12:
+                add_row("DOS date:", f"{year:04d}-{month:02d}-{day:02d}", byte_size=2, data_offset=0, data_type='dos_date')
+            else:
+                add_row("DOS date:", "Invalid", byte_size=2, data_offset=0, data_type=None)
+        except:
+            add_row("DOS date:", "Invalid", byte_size=2, data_offset=0, data_type=None)
+
+    # DOS time (2 bytes - packed time format used by MS-DOS)
+    if bytes_16:
+        dos_time = structs['H'].unpack(bytes_16)[0]
+        try:
+            # Extract seconds/2 (5 bits), minutes (6 bits), hours (5 bits)
+            seconds = (dos_time & 0x1F) * 2
+            minutes = (dos_time >> 5) & 0x3F
+            hours = (dos_time >> 11) & 0x1F
+            if hours < 24 and minutes < 60 and seconds < 60:
+                add_row("DOS time:", f"{hours:02d}:{minutes:02d}:{seconds:02d}", byte_size=2, data_offset=0, data_type='dos_time')
+            else:
+                add_row("DOS time:", "Invalid", byte_size=2, data_offset=0, data_type=None)
+        except:
+            add_row("DOS time:", "Invalid", byte_size=2, data_offset=0, data_type=None)
+
+    # DOS time & date (4 bytes - combined DOS time and date)
+    bytes_dos = read_bytes(4)
+    if bytes_dos:
+        dos_time, dos_date = structs['HH'].unpack(bytes_dos)
+        try:
+            seconds = (dos_time & 0x1F) * 2
+            minutes = (dos_time >> 5) & 0x3F
+            hours = (dos_time >> 11) & 0x1F
+            day = dos_date & 0x1F
+            month = (dos_date >> 5) & 0x0F
+            year = ((dos_date >> 9) & 0x7F) + 1980
+            if hours < 24 and minutes < 60 and seconds < 60 and 1 <= day <= 31 and 1 <= month <= 12:
+                add_row("DOS time & date:", f"{year:04d}-{month:02d}-{day:02d} {hours:02d}:{minutes:02d}:{seconds:02d}", byte_size=4, data_offset=0, data_type='dos_datetime')
+            else:
+                add_row("DOS time & date:", "Invalid", byte_size=4, data_offset=0, data_type=None)
+        except:
+            add_row("DOS time & date:", "Invalid", byte_size=4, data_offset=0, data_type=None)
+
+    # time_t (32 bit) - Unix timestamp (seconds since 1970-01-01)
+    if bytes_32:
+        time_t_32 = structs['i'].unpack(bytes_32)[0]
+        try:
+            if time_t_32 >= 0:
+                result_date = datetime.utcfromtimestamp(time_t_32)
+                add_row("time_t (32 bit):", result_date.strftime("%Y-%m-%d %H:%M:%S UTC"), byte_size=4, data_offset=0, data_type='time_t_32')
+            else:
+                add_row("time_t (32 bit):", "Invalid", byte_size=4, data_offset=0, data_type=None)
+        except:
+            add_row("time_t (32 bit):", "Invalid", byte_size=4, data_offset=0, data_type=None)
+
+    # time_t (64 bit) - Unix timestamp (seconds since 1970-01-01)
+    if bytes_64:
+        time_t_64 = structs['q'].unpack(bytes_64)[0]
+        try:
+            if time_t_64 >= 0:
+                result_date = datetime.utcfromtimestamp(time_t_64)
+                add_row("time_t (64 bit):", result_date.strftime("%Y-%m-%d %H:%M:%S UTC"), byte_size=8, data_offset=0, data_type='time_t_64')
+            else:
+                add_row("time_t (64 bit):", "Invalid", byte_size=8, data_offset=0, data_type=None)
+        except:
+            add_row("time_t (64 bit):", "Invalid", byte_size=8, data_offset=0, data_type=None)
+
+    # GUID (16 bytes) - Globally Unique Identifier
+    bytes_guid = read_bytes(16)
+    if bytes_guid:
+        try:
+            # Parse GUID structure: 4-byte, 2-byte, 2-byte, 8-byte
+            d1, d2, d3, d4 = structs['IHH8s'].unpack(bytes_guid)
+            guid_str = (f"{d1:08X}-{d2:04X}-{d3:04X}-"
+                        f"{HEX_BYTES[d4[0]]}{HEX_BYTES[d4[1]]}-{''.join([HEX_BYTES[b] for b in d4[2:]])}")
+            add_row("GUID:", guid_str, byte_size=16, data_offset=0, data_type='guid')
+        except:
+            add_row("GUID:", "Invalid", byte_size=16, data_offset=0, data_type=None)
+    return tuple(rows)
+
+
+class DisassemblyWorker(QObject):
+    """
+    Disassembles the bytes at the cursor on a background thread.
+
+    Lives in its own QThread; requests arrive through the queued disassemble_requested
+    signal and each mode's result is sent back through result_ready with the request
+    token, so stale results for a cursor that has since moved can be dropped.
+
+    Signals:
+        disassemble_requested (int, object, object): token, code bytes, address
+        result_ready (int, int, str, int): token, mode index, text, instruction size
+    """
+    disassemble_requested = pyqtSignal(int, object, object)
+    result_ready = pyqtSignal(int, int, str, int)
+
+    def __init__(self):
+        super().__init__()
+        self._cs_engines = None  # Capstone engines, created on first disassembly (False if unavailable)
+        self.disassemble_requested.connect(self.disassemble)
+
+    @pyqtSlot(int, object, object)
+    def disassemble(self, token, code, address):
+        """Disassemble the first instruction of code in every mode and emit the results."""
+        for mode in range(len(DISASM_LABELS)):
+            text, size = self._disassemble_one(mode, code, address)
+            self.result_ready.emit(token, mode, text, size)
+
+    def _disassemble_one(self, mode, code, address):
+        """
+        Disassemble the first instruction of code in one mode.
+
+        Results are cached on the GUI side (DataInspector._disasm_cache), so repeated
+        (code, address) requests never reach the worker.
+
+        Returns:
+            Tuple of (text, instruction size)
+        """
+        engines = self._get_disassemblers()
+        if not engines:
+            return "[capstone library not installed]", 1
+        try:
+            # disasm_lite with count=1 decodes only the first instruction and skips CsInsn objects
+            instr = next(engines[mode].disasm_lite(code, address, 1), None)
+            if instr is None:
+                return "Invalid instruction", 1
+            _, size, mnemonic, op_str = instr
+            return f"{mnemonic} {op_str}", size
+        except:
+            return "Error", 1
+
+    def _get_disassemblers(self):
+        """
+        Return the (x86-16, x86-32, x86-64) Capstone engines, creating them on first use.
+
+        Returns:
+            Tuple of three Cs instances, or None if the capstone library is not installed
+        """
+        if self._cs_engines is None:
+            try:
+                from capstone import Cs, CS_ARCH_X86, CS_MODE_16, CS_MODE_32, CS_MODE_64
+                self._cs_engines = (Cs(CS_ARCH_X86, CS_MODE_16),
+                                    Cs(CS_ARCH_X86, CS_MODE_32),
+                                    Cs(CS_ARCH_X86, CS_MODE_64))
+                # Operand details are never shown, so don't let the engines build them
+                for md in self._cs_engines:
+                    md.detail = False
+            except ImportError:
+                self._cs_engines = False
+        return self._cs_engines or None
 
 
 class DataInspector:
@@ -46,6 +467,18 @@ class DataInspector:
         - Disassembly: x86 machine code (16/32/64-bit)
     """
 
+    # Finished row stylesheets per theme, built once instead of per row
+    _DARK_ROW_STYLES = {
+        'widget': "background-color: #252525; border: 1px solid #3a3a3a; border-radius: 3px; margin: 1px;",
+        'label': "color: #b0b0b0; border: none;",
+        'value_edit': "border: 1px solid #4a4a4a; background-color: #2d2d2d; color: #ffffff; padding: 2px;",
+    }
+    _LIGHT_ROW_STYLES = {
+        'widget': "background-color: #f5f5f5; border: 1px solid #c0c0c0; border-radius: 3px; margin: 1px;",
+        'label': "color: #5a5a5a; border: none;",
+        'value_edit': "border: 1px solid #b0b0b0; background-color: #ffffff; color: #2c3e50; padding: 2px;",
+    }
+
     def __init__(self, editor):
         """
         Initialize the DataInspector.
@@ -62,462 +495,221 @@ class DataInspector:
         """
         self.editor = editor
         self.inspector_content_layout = editor.inspector_content_layout
+        self._disasm_thread = None  # QThread running the DisassemblyWorker, started on first use
+        self._disasm_worker = None
+        self._disasm_token = 0  # Identifies the latest disassembly request
+        self._disasm_rows = []  # Pooled row index per disassembly mode for the latest request
+        self._disasm_key = None  # (code bytes, address) of the latest request
+        self._disasm_cache = OrderedDict()  # LRU of (code bytes, address) -> [(text, size)] per mode
+        self._inspector_rows = []  # Pooled (widget, label_widget, value_edit) rows, reused across updates
+        self._visible_rows = 0  # Number of pooled rows filled by the current update
+        self._rows_dark = None  # Theme the pooled rows were last styled for
+        self._last_update_key = None  # State shown by the last refresh; update() returns early if unchanged
 
     def update(self):
         """
         Update the data inspector display with interpretations at current cursor position.
 
         This method:
-        1. Clears existing inspector widgets
-        2. Reads bytes at the cursor position
-        3. Interprets bytes as various data types
-        4. Creates editable fields for each interpretation
-        5. Connects signals for editing and highlighting
+        1. Reads bytes at the cursor position
+        2. Interprets bytes as various data types (memoized in compute_inspector_rows)
+        3. Fills the pooled inspector rows with the new values
+        4. Hides pooled rows that are not needed at this position
         """
-        # Clear existing inspector widgets
-        for i in reversed(range(self.inspector_content_layout.count())):
-            widget = self.inspector_content_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-
         # Validate state
         if self.editor.current_tab_index < 0 or self.editor.cursor_position is None:
+            self.clear()
             return
 
         current_file = self.editor.open_files[self.editor.current_tab_index]
         pos = self.editor.cursor_position
 
         if pos >= len(current_file.file_data):
+            self.clear()
             return
 
-        data = current_file.file_data
-
-        # Helper function to safely read bytes from file data
-        def read_bytes(offset, count):
-            """Read count bytes starting at offset, or None if out of bounds."""
-            if offset + count <= len(data):
-                return bytes(data[offset:offset + count])
-            return None
-
-        # Helper function to add an inspector row (label + editable value)
-        def add_inspector_row(label, value, byte_size=1, data_offset=0, data_type=None):
-            """
-            Add a row to the inspector showing a label and editable value.
-
-            Args:
-                label: Display name for this data type (e.g., "Int32:")
-                value: Interpreted value to display
-                byte_size: Number of bytes this interpretation uses
-                data_offset: Offset from cursor position where these bytes start
-                data_type: Type identifier for editing (e.g., 'int32', 'float', 'guid')
-            """
-            widget = QWidget()
-
-            # Apply theme-appropriate styling
-            if self.editor.is_dark_theme():
-                widget.setStyleSheet("background-color: #252525; border: 1px solid #3a3a3a; border-radius: 3px; margin: 1px;")
-                label_color = "#b0b0b0"
-                value_bg = "#2d2d2d"
-                value_border = "#4a4a4a"
-                value_color = "#ffffff"
-            else:
-                widget.setStyleSheet("background-color: #f5f5f5; border: 1px solid #c0c0c0; border-radius: 3px; margin: 1px;")
-                label_color = "#5a5a5a"
-                value_bg = "#ffffff"
-                value_border = "#b0b0b0"
-                value_color = "#2c3e50"
-
-            layout = QHBoxLayout()
-            layout.setContentsMargins(8, 4, 8, 4)
-
-            # Create label widget
-            label_widget = QLabel(label)
-            label_widget.setMinimumWidth(80)
-            label_widget.setFont(QFont("Arial", 8))
-            label_widget.setStyleSheet(f"color: {label_color}; border: none;")
-            layout.addWidget(label_widget)
-
-            # Create editable value field
-            value_edit = QLineEdit(str(value))
-            value_edit.setFont(QFont("Courier", 8))
-            value_edit.setMinimumWidth(150)
-            value_edit.setStyleSheet(
-                f"border: 1px solid {value_border}; background-color: {value_bg}; "
-                f"color: {value_color}; padding: 2px;"
-            )
-
-            # Store metadata for highlighting and editing
-            value_edit.setProperty('byte_size', byte_size)
-            value_edit.setProperty('data_offset', data_offset)
-            value_edit.setProperty('data_type', data_type)
-
-            # Connect focus event to highlight the relevant bytes in hex display
-            def on_focus(event):
-                if self.editor.cursor_position is not None:
-                    self.editor.highlight_bytes(self.editor.cursor_position + data_offset, byte_size)
-                QLineEdit.focusInEvent(value_edit, event)
-            value_edit.focusInEvent = on_focus
-
-            # Connect editing finished event to update bytes (except for read-only offset field)
-            if data_type and data_type != 'offset':
-                def on_edit_finished():
-                    if self.editor.cursor_position is not None:
-                        self.update_bytes_from_editor(
-                            value_edit,
-                            self.editor.cursor_position + data_offset,
-                            data_type
-                        )
-                value_edit.editingFinished.connect(on_edit_finished)
-
-            layout.addWidget(value_edit, 1)  # Stretch factor to expand horizontally
-            widget.setLayout(layout)
-            self.inspector_content_layout.addWidget(widget)
-
-        # --- Begin Data Type Interpretations ---
-
-        # Offset (current cursor position)
-        offset_str = f"0x{pos:X}" if self.editor.offset_mode == 'h' else str(pos)
-        add_inspector_row("Offset:", offset_str, byte_size=0, data_offset=0, data_type='offset')
-
-        # Single byte value (always shown in hex)
-        byte_val = data[pos]
-        if self.editor.integral_basis == 'hex':
-            add_inspector_row("Byte (hex):", f"0x{byte_val:02X}", byte_size=1, data_offset=0, data_type='byte_hex')
-
-        # Int8 (signed 8-bit integer)
-        int8_val = struct.unpack('b', bytes([byte_val]))[0]
-        add_inspector_row("Int8:", self.editor.format_integral(int8_val, 2, signed=True), byte_size=1, data_offset=0, data_type='int8')
-
-        # UInt8 (unsigned 8-bit integer)
-        add_inspector_row("UInt8:", self.editor.format_integral(byte_val, 2), byte_size=1, data_offset=0, data_type='uint8')
-
-        # Int16 (signed 16-bit integer)
-        bytes_16 = read_bytes(pos, 2)
-        if bytes_16:
-            fmt = '<h' if self.editor.endian_mode == 'little' else '>h'
-            int16_val = struct.unpack(fmt, bytes_16)[0]
-            add_inspector_row("Int16:", self.editor.format_integral(int16_val, 4, signed=True), byte_size=2, data_offset=0, data_type='int16')
-
-        # UInt16 (unsigned 16-bit integer)
-        if bytes_16:
-            fmt = '<H' if self.editor.endian_mode == 'little' else '>H'
-            uint16_val = struct.unpack(fmt, bytes_16)[0]
-            add_inspector_row("UInt16:", self.editor.format_integral(uint16_val, 4), byte_size=2, data_offset=0, data_type='uint16')
-
-        # Int32 (signed 32-bit integer)
-        bytes_32 = read_bytes(pos, 4)
-        if bytes_32:
-            fmt = '<i' if self.editor.endian_mode == 'little' else '>i'
-            int32_val = struct.unpack(fmt, bytes_32)[0]
-            add_inspector_row("Int32:", self.editor.format_integral(int32_val, 8, signed=True), byte_size=4, data_offset=0, data_type='int32')
-
-        # UInt32 (unsigned 32-bit integer)
-        if bytes_32:
-            fmt = '<I' if self.editor.endian_mode == 'little' else '>I'
-            uint32_val = struct.unpack(fmt, bytes_32)[0]
-            add_inspector_row("UInt32:", self.editor.format_integral(uint32_val, 8), byte_size=4, data_offset=0, data_type='uint32')
-
-        # Int64 (signed 64-bit integer)
-        bytes_64 = read_bytes(pos, 8)
-        if bytes_64:
-            fmt = '<q' if self.editor.endian_mode == 'little' else '>q'
-            int64_val = struct.unpack(fmt, bytes_64)[0]
-            add_inspector_row("Int64:", self.editor.format_integral(int64_val, 16, signed=True), byte_size=8, data_offset=0, data_type='int64')
-
-        # UInt64 (unsigned 64-bit integer)
-        if bytes_64:
-            fmt = '<Q' if self.editor.endian_mode == 'little' else '>Q'
-            uint64_val = struct.unpack(fmt, bytes_64)[0]
-            add_inspector_row("UInt64:", self.editor.format_integral(uint64_val, 16), byte_size=8, data_offset=0, data_type='uint64')
-
-        # Int24 (signed 24-bit integer - manual parsing)
-        bytes_24 = read_bytes(pos, 3)
-        if bytes_24:
-            # Reconstruct 24-bit value based on endianness
-            if self.editor.endian_mode == 'little':
-                int24_val = bytes_24[0] | (bytes_24[1] << 8) | (bytes_24[2] << 16)
-            else:
-                int24_val = (bytes_24[0] << 16) | (bytes_24[1] << 8) | bytes_24[2]
-            # Apply sign bit extension
-            if int24_val & 0x800000:
-                int24_val -= 0x1000000
-            add_inspector_row("Int24:", self.editor.format_integral(int24_val, 6, signed=True), byte_size=3, data_offset=0, data_type='int24')
-
-        # UInt24 (unsigned 24-bit integer)
-        if bytes_24:
-            if self.editor.endian_mode == 'little':
-                uint24_val = bytes_24[0] | (bytes_24[1] << 8) | (bytes_24[2] << 16)
-            else:
-                uint24_val = (bytes_24[0] << 16) | (bytes_24[1] << 8) | bytes_24[2]
-            add_inspector_row("UInt24:", self.editor.format_integral(uint24_val, 6), byte_size=3, data_offset=0, data_type='uint24')
+        window = bytes(current_file.file_data[pos:pos + INSPECTOR_WINDOW])
+        dark = self.editor.is_dark_theme()
 
-        # LEB128 (signed variable-length integer)
-        leb_bytes = read_bytes(pos, min(10, len(data) - pos))
-        if leb_bytes:
-            try:
-                result = 0
-                shift = 0
-                leb_size = 0
-                # Decode LEB128: each byte has 7 bits of data + continuation bit
-                for b in leb_bytes:
-                    leb_size += 1
-                    result |= (b & 0x7f) << shift
-                    shift += 7
-                    if (b & 0x80) == 0:  # No continuation bit, done
-                        break
-                # Apply sign extension
-                if result & (1 << (shift - 1)):
-                    result -= (1 << shift)
-                add_inspector_row("LEB128:", str(result), byte_size=leb_size, data_offset=0, data_type='leb128')
-            except:
-                add_inspector_row("LEB128:", "Invalid", byte_size=1, data_offset=0, data_type=None)
-
-        # ULEB128 (unsigned variable-length integer)
-        if leb_bytes:
-            try:
-                result = 0
-                shift = 0
-                uleb_size = 0
-                for b in leb_bytes:
-                    uleb_size += 1
-                    result |= (b & 0x7f) << shift
-                    shift += 7
-                    if (b & 0x80) == 0:
-                        break
-                add_inspector_row("ULEB128:", str(result), byte_size=uleb_size, data_offset=0, data_type='uleb128')
-            except:
-                add_inspector_row("ULEB128:", "Invalid", byte_size=1, data_offset=0, data_type=None)
-
-        # AnsiChar / char8_t (single byte character)
-        # Control characters shown as hex escape sequences
-        ansi_char = chr(byte_val) if (32 <= byte_val <= 126) or (160 <= byte_val <= 255) else f"\\x{byte_val:02x}"
-        add_inspector_row("AnsiChar / char8_t:", ansi_char, byte_size=1, data_offset=0, data_type='ansichar')
-
-        # WideChar / char16_t (UTF-16 character)
-        if bytes_16:
-            fmt = '<H' if self.editor.endian_mode == 'little' else '>H'
-            wide_val = struct.unpack(fmt, bytes_16)[0]
-            try:
-                # Avoid surrogate pairs
-                wide_char = chr(wide_val) if wide_val < 0xD800 or wide_val > 0xDFFF else f"\\u{wide_val:04x}"
-            except:
-                wide_char = f"\\u{wide_val:04x}"
-            add_inspector_row("WideChar / char16_t:", wide_char, byte_size=2, data_offset=0, data_type='widechar')
-
-        # UTF-8 code point (variable length 1-4 bytes)
-        utf8_bytes = read_bytes(pos, min(4, len(data) - pos))
-        if utf8_bytes:
-            try:
-                # Determine UTF-8 sequence length from first byte
-                utf8_size = 1
-                if utf8_bytes[0] < 0x80:
-                    utf8_size = 1
-                elif (utf8_bytes[0] & 0xE0) == 0xC0:
-                    utf8_size = 2
-                elif (utf8_bytes[0] & 0xF0) == 0xE0:
-                    utf8_size = 3
-                elif (utf8_bytes[0] & 0xF8) == 0xF0:
-                    utf8_size = 4
-                utf8_str = bytes(utf8_bytes[:utf8_size]).decode('utf-8')
-                add_inspector_row("UTF-8 code point:", utf8_str, byte_size=utf8_size, data_offset=0, data_type='utf8')
-            except:
-                add_inspector_row("UTF-8 code point:", "Invalid", byte_size=1, data_offset=0, data_type=None)
-
-        # Single (float32) - IEEE 754 single precision floating point
-        if bytes_32:
-            fmt = '<f' if self.editor.endian_mode == 'little' else '>f'
-            float_val = struct.unpack(fmt, bytes_32)[0]
-            add_inspector_row("Single (float32):", f"{float_val:.6f}", byte_size=4, data_offset=0, data_type='float')
-
-        # Double (float64) - IEEE 754 double precision floating point
-        if bytes_64:
-            fmt = '<d' if self.editor.endian_mode == 'little' else '>d'
-            double_val = struct.unpack(fmt, bytes_64)[0]
-            add_inspector_row("Double (float64):", f"{double_val:.15f}", byte_size=8, data_offset=0, data_type='double')
-
-        # OLETIME (OLE Automation date - days since 1899-12-30 as double)
-        if bytes_64:
-            fmt = '<d' if self.editor.endian_mode == 'little' else '>d'
-            ole_val = struct.unpack(fmt, bytes_64)[0]
-            try:
-                from datetime import datetime, timedelta
-                base_date = datetime(1899, 12, 30)
-                result_date = base_date + timedelta(days=ole_val)
-                add_inspector_row("OLETIME:", result_date.strftime("%Y-%m-%d %H:%M:%S"), byte_size=8, data_offset=0, data_type='oletime')
-            except:
-                add_inspector_row("OLETIME:", "Invalid", byte_size=8, data_offset=0, data_type=None)
-
-        # FILETIME (Windows FILETIME - 100-nanosecond intervals since 1601-01-01)
-        if bytes_64:
-            fmt = '<Q' if self.editor.endian_mode == 'little' else '>Q'
-            filetime_val = struct.unpack(fmt, bytes_64)[0]
-            try:
-                from datetime import datetime, timedelta
-                if filetime_val > 0:
-                    base_date = datetime(1601, 1, 1)
-                    result_date = base_date + timedelta(microseconds=filetime_val / 10)
-                    add_inspector_row("FILETIME:", result_date.strftime("%Y-%m-%d %H:%M:%S"), byte_size=8, data_offset=0, data_type='filetime')
-                else:
-                    add_inspector_row("FILETIME:", "Invalid", byte_size=8, data_offset=0, data_type=None)
-            except:
-                add_inspector_row("FILETIME:", "Invalid", byte_size=8, data_offset=0, data_type=None)
-
-        # DOS date (2 bytes - packed date format used by MS-DOS)
-        if bytes_16:
-            fmt = '<H' if self.editor.endian_mode == 'little' else '>H'
-            dos_date = struct.unpack(fmt, bytes_16)[0]
-            try:
-                # Extract day (5 bits), month (4 bits), year (7 bits + 1980)
-                day = dos_date & 0x1F
-                month = (dos_date >> 5) & 0x0F
-                year = ((dos_date >> 9) & 0x7F) + 1980
-                if 1 <= day <= 31 and 1 <= month <= 12:
-                    add_inspector_row("DOS date:", f"{year:04d}-{month:02d}-{day:02d}", byte_size=2, data_offset=0, data_type='dos_date')
-                else:
-                    add_inspector_row("DOS date:", "Invalid", byte_size=2, data_offset=0, data_type=None)
-            except:
-                add_inspector_row("DOS date:", "Invalid", byte_size=2, data_offset=0, data_type=None)
-
-        # DOS time (2 bytes - packed time format used by MS-DOS)
-        if bytes_16:
-            fmt = '<H' if self.editor.endian_mode == 'little' else '>H'
-            dos_time = struct.unpack(fmt, bytes_16)[0]
-            try:
-                # Extract seconds/2 (5 bits), minutes (6 bits), hours (5 bits)
-                seconds = (dos_time & 0x1F) * 2
-                minutes = (dos_time >> 5) & 0x3F
-                hours = (dos_time >> 11) & 0x1F
-                if hours < 24 and minutes < 60 and seconds < 60:
-                    add_inspector_row("DOS time:", f"{hours:02d}:{minutes:02d}:{seconds:02d}", byte_size=2, data_offset=0, data_type='dos_time')
-                else:
-                    add_inspector_row("DOS time:", "Invalid", byte_size=2, data_offset=0, data_type=None)
-            except:
-                add_inspector_row("DOS time:", "Invalid", byte_size=2, data_offset=0, data_type=None)
-
-        # DOS time & date (4 bytes - combined DOS time and date)
-        bytes_dos = read_bytes(pos, 4)
-        if bytes_dos:
-            fmt = '<HH' if self.editor.endian_mode == 'little' else '>HH'
-            dos_time, dos_date = struct.unpack(fmt, bytes_dos)
-            try:
-                seconds = (dos_time & 0x1F) * 2
-                minutes = (dos_time >> 5) & 0x3F
-                hours = (dos_time >> 11) & 0x1F
-                day = dos_date & 0x1F
-                month = (dos_date >> 5) & 0x0F
-                year = ((dos_date >> 9) & 0x7F) + 1980
-                if hours < 24 and minutes < 60 and seconds < 60 and 1 <= day <= 31 and 1 <= month <= 12:
-                    add_inspector_row("DOS time & date:", f"{year:04d}-{month:02d}-{day:02d} {hours:02d}:{minutes:02d}:{seconds:02d}", byte_size=4, data_offset=0, data_type='dos_datetime')
-                else:
-                    add_inspector_row("DOS time & date:", "Invalid", byte_size=4, data_offset=0, data_type=None)
-            except:
-                add_inspector_row("DOS time & date:", "Invalid", byte_size=4, data_offset=0, data_type=None)
-
-        # time_t (32 bit) - Unix timestamp (seconds since 1970-01-01)
-        if bytes_32:
-            fmt = '<i' if self.editor.endian_mode == 'little' else '>i'
-            time_t_32 = struct.unpack(fmt, bytes_32)[0]
-            try:
-                from datetime import datetime
-                if time_t_32 >= 0:
-                    result_date = datetime.utcfromtimestamp(time_t_32)
-                    add_inspector_row("time_t (32 bit):", result_date.strftime("%Y-%m-%d %H:%M:%S UTC"), byte_size=4, data_offset=0, data_type='time_t_32')
-                else:
-                    add_inspector_row("time_t (32 bit):", "Invalid", byte_size=4, data_offset=0, data_type=None)
-            except:
-                add_inspector_row("time_t (32 bit):", "Invalid", byte_size=4, data_offset=0, data_type=None)
-
-        # time_t (64 bit) - Unix timestamp (seconds since 1970-01-01)
-        if bytes_64:
-            fmt = '<q' if self.editor.endian_mode == 'little' else '>q'
-            time_t_64 = struct.unpack(fmt, bytes_64)[0]
-            try:
-                from datetime import datetime
-                if time_t_64 >= 0:
-                    result_date = datetime.utcfromtimestamp(time_t_64)
-                    add_inspector_row("time_t (64 bit):", result_date.strftime("%Y-%m-%d %H:%M:%S UTC"), byte_size=8, data_offset=0, data_type='time_t_64')
-                else:
-                    add_inspector_row("time_t (64 bit):", "Invalid", byte_size=8, data_offset=0, data_type=None)
-            except:
-                add_inspector_row("time_t (64 bit):", "Invalid", byte_size=8, data_offset=0, data_type=None)
+        # Skip the refresh entirely if nothing the inspector shows has changed
+        # (e.g. display_hex re-rendering for selection painting during a drag)
+        update_key = (current_file, pos, window, self.editor.endian_mode,
+                      self.editor.integral_basis, self.editor.offset_mode, dark)
+        if update_key == self._last_update_key:
+            return
+        self._last_update_key = update_key
 
-        # GUID (16 bytes) - Globally Unique Identifier
-        bytes_guid = read_bytes(pos, 16)
-        if bytes_guid:
-            try:
-                # Parse GUID structure: 4-byte, 2-byte, 2-byte, 8-byte
-                if self.editor.endian_mode == 'little':
-                    guid_fmt = '<IHH8s'
-                    d1, d2, d3, d4 = struct.unpack(guid_fmt, bytes_guid)
-                    guid_str = f"{d1:08X}-{d2:04X}-{d3:04X}-{d4[0]:02X}{d4[1]:02X}-{d4[2]:02X}{d4[3]:02X}{d4[4]:02X}{d4[5]:02X}{d4[6]:02X}{d4[7]:02X}"
-                else:
-                    guid_fmt = '>IHH8s'
-                    d1, d2, d3, d4 = struct.unpack(guid_fmt, bytes_guid)
-                    guid_str = f"{d1:08X}-{d2:04X}-{d3:04X}-{d4[0]:02X}{d4[1]:02X}-{d4[2]:02X}{d4[3]:02X}{d4[4]:02X}{d4[5]:02X}{d4[6]:02X}{d4[7]:02X}"
-                add_inspector_row("GUID:", guid_str, byte_size=16, data_offset=0, data_type='guid')
-            except:
-                add_inspector_row("GUID:", "Invalid", byte_size=16, data_offset=0, data_type=None)
+        # Restyle pooled rows only when the theme actually changed
+        if dark != self._rows_dark:
+            self._rows_dark = dark
+            for row in self._inspector_rows:
+                self._style_row(*row)
+
+        self._visible_rows = 0
+
+        rows = compute_inspector_rows(window, pos, self.editor.endian_mode,
+                                      self.editor.integral_basis, self.editor.offset_mode)
+        for label, value, byte_size, data_offset, data_type in rows:
+            self.add_inspector_row(label, value, byte_size, data_offset, data_type)
 
         # Disassembly (x86-16, x86-32, x86-64) - requires Capstone library
-        disasm_bytes = read_bytes(pos, min(15, len(data) - pos))
+        # Runs on the worker thread; placeholder rows are filled in by _on_disasm_result
+        disasm_bytes = window[:DISASM_WINDOW]
         if disasm_bytes:
-            try:
-                from capstone import Cs, CS_ARCH_X86, CS_MODE_16, CS_MODE_32, CS_MODE_64
+            self._disasm_token += 1
+            self._disasm_key = (disasm_bytes, pos)
+            cached = self._disasm_cache.get(self._disasm_key)
+            if cached is not None and None not in cached:
+                # Revisited window: show the remembered rows without a worker round trip
+                self._disasm_cache.move_to_end(self._disasm_key)
+                for label, (text, size) in zip(DISASM_LABELS, cached):
+                    self.add_inspector_row(label, text, byte_size=size, data_offset=0, data_type=None)
+            else:
+                self._disasm_rows = []
+                for label in DISASM_LABELS:
+                    self._disasm_rows.append(self._visible_rows)
+                    self.add_inspector_row(label, "...", byte_size=1, data_offset=0, data_type=None)
+                self._get_disasm_worker().disassemble_requested.emit(self._disasm_token, disasm_bytes, pos)
+
+        # Hide pooled rows left over from a position with more interpretations
+        for widget, _, _ in self._inspector_rows[self._visible_rows:]:
+            widget.setVisible(False)
+
+    def _get_disasm_worker(self):
+        """Return the disassembly worker, starting its thread on first use."""
+        if self._disasm_worker is None:
+            self._disasm_thread = QThread()
+            self._disasm_worker = DisassemblyWorker()
+            self._disasm_worker.moveToThread(self._disasm_thread)
+            self._disasm_worker.result_ready.connect(self._on_disasm_result)
+            QCoreApplication.instance().aboutToQuit.connect(self._stop_disasm_thread)
+            self._disasm_thread.start()
+        return self._disasm_worker
+
+    def _stop_disasm_thread(self):
+        """Stop the disassembly thread before the application exits."""
+        if self._disasm_thread is not None:
+            self._disasm_thread.quit()
+            self._disasm_thread.wait()
+
+    def _on_disasm_result(self, token, mode, text, size):
+        """Fill a disassembly placeholder row, ignoring results for an outdated cursor."""
+        if token != self._disasm_token:
+            return
+        _, _, value_edit = self._inspector_rows[self._disasm_rows[mode]]
 
-                # x86-16 disassembly
-                try:
-                    md16 = Cs(CS_ARCH_X86, CS_MODE_16)
-                    instructions = list(md16.disasm(disasm_bytes, pos))
-                    if instructions:
-                        instr = instructions[0]
-                        disasm_text = f"{instr.mnemonic} {instr.op_str}"
-                        add_inspector_row("Disassembly (x86-16):", disasm_text, byte_size=instr.size, data_offset=0, data_type=None)
-                    else:
-                        add_inspector_row("Disassembly (x86-16):", "Invalid instruction", byte_size=1, data_offset=0, data_type=None)
-                except:
-                    add_inspector_row("Disassembly (x86-16):", "Error", byte_size=1, data_offset=0, data_type=None)
+        # Remember the result so revisiting this window is filled in immediately
+        entry = self._disasm_cache.get(self._disasm_key)
+        if entry is None:
+            entry = self._disasm_cache[self._disasm_key] = [None] * len(DISASM_LABELS)
+            if len(self._disasm_cache) > DISASM_CACHE_SIZE:
+                self._disasm_cache.popitem(last=False)
+        entry[mode] = (text, size)
 
-                # x86-32 disassembly
-                try:
-                    md32 = Cs(CS_ARCH_X86, CS_MODE_32)
-                    instructions = list(md32.disasm(disasm_bytes, pos))
-                    if instructions:
-                        instr = instructions[0]
-                        disasm_text = f"{instr.mnemonic} {instr.op_str}"
-                        add_inspector_row("Disassembly (x86-32):", disasm_text, byte_size=instr.size, data_offset=0, data_type=None)
-                    else:
-                        add_inspector_row("Disassembly (x86-32):", "Invalid instruction", byte_size=1, data_offset=0, data_type=None)
-                except:
-                    add_inspector_row("Disassembly (x86-32):", "Error", byte_size=1, data_offset=0, data_type=None)
+        value_edit.setText(text)
+        value_edit.setProperty('byte_size', size)
 
-                # x86-64 disassembly
-                try:
-                    md64 = Cs(CS_ARCH_X86, CS_MODE_64)
-                    instructions = list(md64.disasm(disasm_bytes, pos))
-                    if instructions:
-                        instr = instructions[0]
-                        disasm_text = f"{instr.mnemonic} {instr.op_str}"
-                        add_inspector_row("Disassembly (x86-64):", disasm_text, byte_size=instr.size, data_offset=0, data_type=None)
-                    else:
-                        add_inspector_row("Disassembly (x86-64):", "Invalid instruction", byte_size=1, data_offset=0, data_type=None)
-                except:
-                    add_inspector_row("Disassembly (x86-64):", "Error", byte_size=1, data_offset=0, data_type=None)
-            except ImportError:
-                # Capstone library not available
-                add_inspector_row("Disassembly (x86-16):", "[capstone library not installed]", byte_size=1, data_offset=0, data_type=None)
-                add_inspector_row("Disassembly (x86-32):", "[capstone library not installed]", byte_size=1, data_offset=0, data_type=None)
-                add_inspector_row("Disassembly (x86-64):", "[capstone library not installed]", byte_size=1, data_offset=0, data_type=None)
+    def add_inspector_row(self, label, value, byte_size=1, data_offset=0, data_type=None):
+        """
+        Show a row in the inspector with a label and editable value.
+
+        Rows are pooled: the next unused row widget is reused and only its text and
+        metadata are updated; a new row is built only when the pool is exhausted.
+
+        Args:
+            label: Display name for this data type (e.g., "Int32:")
+            value: Interpreted value to display
+            byte_size: Number of bytes this interpretation uses
+            data_offset: Offset from cursor position where these bytes start
+            data_type: Type identifier for editing (e.g., 'int32', 'float', 'guid')
+        """
+        if self._visible_rows >= len(self._inspector_rows):
+            self._inspector_rows.append(self._create_row())
+        widget, label_widget, value_edit = self._inspector_rows[self._visible_rows]
+        self._visible_rows += 1
+
+        label_widget.setText(label)
+        value_edit.setText(str(value))
+
+        # Store metadata for highlighting and editing
+        value_edit.setProperty('byte_size', byte_size)
+        value_edit.setProperty('data_offset', data_offset)
+        value_edit.setProperty('data_type', data_type)
+
+        widget.setVisible(True)
+
+    def _create_row(self):
+        """
+        Build one pooled inspector row and connect its signals.
+
+        The handlers read the row's metadata properties at event time, so the same
+        widgets can represent a different data type on every update.
+
+        Returns:
+            Tuple of (widget, label_widget, value_edit)
+        """
+        widget = QWidget()
+
+        layout = QHBoxLayout()
+        layout.setContentsMargins(8, 4, 8, 4)
+
+        # Create label widget
+        label_widget = QLabel()
+        label_widget.setMinimumWidth(80)
+        label_widget.setFont(QFont("Arial", 8))
+        layout.addWidget(label_widget)
+
+        # Create editable value field
+        value_edit = QLineEdit()
+        value_edit.setFont(QFont("Courier", 8))
+        value_edit.setMinimumWidth(150)
+
+        # Connect focus event to highlight the relevant bytes in hex display
+        def on_focus(event):
+            if self.editor.cursor_position is not None:
+                self.editor.highlight_bytes(
+                    self.editor.cursor_position + value_edit.property('data_offset'),
+                    value_edit.property('byte_size')
+                )
+            QLineEdit.focusInEvent(value_edit, event)
+        value_edit.focusInEvent = on_focus
+
+        # Connect editing finished event to update bytes (except for read-only offset field)
+        def on_edit_finished():
+            data_type = value_edit.property('data_type')
+            if data_type and data_type != 'offset' and self.editor.cursor_position is not None:
+                self.update_bytes_from_editor(
+                    value_edit,
+                    self.editor.cursor_position + value_edit.property('data_offset'),
+                    data_type
+                )
+        value_edit.editingFinished.connect(on_edit_finished)
+
+        layout.addWidget(value_edit, 1)  # Stretch factor to expand horizontally
+        widget.setLayout(layout)
+        self.inspector_content_layout.addWidget(widget)
+
+        self._style_row(widget, label_widget, value_edit)
+        return widget, label_widget, value_edit
+
+    def _style_row(self, widget, label_widget, value_edit):
+        """Apply theme-appropriate stylesheets to one pooled inspector row."""
+        styles = self._DARK_ROW_STYLES if self._rows_dark else self._LIGHT_ROW_STYLES
+        widget.setStyleSheet(styles['widget'])
+        label_widget.setStyleSheet(styles['label'])
+        value_edit.setStyleSheet(styles['value_edit'])
 
     def clear(self):
         """
         Clear all inspector widgets.
 
-        This removes all data type interpretation widgets from the inspector panel.
+        Pooled rows are hidden rather than destroyed so the next update can reuse them.
         """
-        for i in reversed(range(self.inspector_content_layout.count())):
-            widget = self.inspector_content_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
+        self._visible_rows = 0
+        self._last_update_key = None
+        self._disasm_token += 1  # Drop any disassembly result still in flight
+        for widget, _, _ in self._inspector_rows:
+            widget.setVisible(False)
 
     def update_bytes_from_editor(self, line_edit, position, data_type):
         """
@@ -540,158 +732,97 @@ class DataInspector:
 
         current_file = self.editor.open_files[self.editor.current_tab_index]
         file_data = current_file.file_data
+        # Byte order is resolved once per edit; every branch below uses these instead of comparing strings
+        endian = self.editor.endian_mode
+        structs = STRUCTS[endian]
+
+        # The edited field must be redrawn with its formatted value even if the bytes end up unchanged
+        self._last_update_key = None
+
+        # Bytes this edit may overwrite, for the undo step (UTF-8 text can be longer than any fixed-size type)
+        old_bytes = bytes(file_data[position:position + max(INSPECTOR_WINDOW, 4 * len(line_edit.text()))])
+
+        def write_bytes(bytes_val):
+            """Copy bytes_val into the file at position in one slice, truncated at end of file."""
+            end = min(position + len(bytes_val), len(file_data))
+            file_data[position:end] = bytes_val[:end - position]
+
+        def write_packed(packer, value):
+            """Pack value straight into the file buffer, falling back to a clipped copy at end of file."""
+            if position + packer.size <= len(file_data):
+                packer.pack_into(file_data, position, value)
+            else:
+                write_bytes(packer.pack(value))
 
         try:
             text = line_edit.text().strip()
 
-            # Detect and handle hex prefix (0x or 0X)
-            is_hex = text.startswith('0x') or text.startswith('0X')
+            # Detect and handle hex prefix (0x or 0X) with two character compares
+            is_hex = len(text) >= 2 and text[0] == '0' and (text[1] == 'x' or text[1] == 'X')
             if is_hex:
                 text = text[2:]
 
             # --- Convert based on data type ---
 
+            # Single-byte hex input is parsed and range-checked by one table lookup;
+            # int() only runs for other spellings such as 00FF
             if data_type == 'byte_hex':
-                value = int(text, 16)
-                if 0 <= value <= 0xFF:
-                    file_data[position] = value
-                else:
-                    raise ValueError("Byte value out of range")
+                value = HEX_BYTE_VALUES.get(text.upper())
+                if value is None:
+                    value = int(text, 16)
+                    if not 0 <= value <= 0xFF:
+                        raise ValueError("Byte value out of range")
+                file_data[position] = value
 
             elif data_type == 'int8':
                 if is_hex:
-                    value = int(text, 16)
-                    if value > 127:
-                        value = value - 256
-                else:
-                    value = int(text)
-                if -128 <= value <= 127:
+                    value = HEX_BYTE_VALUES.get(text.upper())
+                    if value is None:
+                        value = int(text, 16)
+                        if value > 127:
+                            value = value - 256
+                        if not -128 <= value <= 127:
+                            raise ValueError("Int8 value out of range")
                     file_data[position] = value & 0xFF
                 else:
-                    raise ValueError("Int8 value out of range")
+                    value = int(text)
+                    if -128 <= value <= 127:
+                        file_data[position] = value & 0xFF
+                    else:
+                        raise ValueError("Int8 value out of range")
 
             elif data_type == 'uint8':
-                value = int(text, 16) if is_hex else int(text)
+                value = HEX_BYTE_VALUES.get(text.upper()) if is_hex else int(text)
+                if value is None:
+                    value = int(text, 16)
                 if 0 <= value <= 255:
                     file_data[position] = value
                 else:
                     raise ValueError("UInt8 value out of range")
 
-            elif data_type == 'int16':
-                value = int(text, 16) if is_hex else int(text)
-                if -32768 <= value <= 32767:
-                    fmt = '<h' if self.editor.endian_mode == 'little' else '>h'
-                    bytes_val = struct.pack(fmt, value)
-                    for i, b in enumerate(bytes_val):
-                        if position + i < len(file_data):
-                            file_data[position + i] = b
-                else:
-                    raise ValueError("Int16 value out of range")
-
-            elif data_type == 'uint16':
-                value = int(text, 16) if is_hex else int(text)
-                if 0 <= value <= 65535:
-                    fmt = '<H' if self.editor.endian_mode == 'little' else '>H'
-                    bytes_val = struct.pack(fmt, value)
-                    for i, b in enumerate(bytes_val):
-                        if position + i < len(file_data):
-                            file_data[position + i] = b
-                else:
-                    raise ValueError("UInt16 value out of range")
-
-            elif data_type == 'int32':
-                value = int(text, 16) if is_hex else int(text)
-                if -2147483648 <= value <= 2147483647:
-                    fmt = '<i' if self.editor.endian_mode == 'little' else '>i'
-                    bytes_val = struct.pack(fmt, value)
-                    for i, b in enumerate(bytes_val):
-                        if position + i < len(file_data):
-                            file_data[position + i] = b
-                else:
-                    raise ValueError("Int32 value out of range")
-
-            elif data_type == 'uint32':
-                value = int(text, 16) if is_hex else int(text)
-                if 0 <= value <= 4294967295:
-                    fmt = '<I' if self.editor.endian_mode == 'little' else '>I'
-                    bytes_val = struct.pack(fmt, value)
-                    for i, b in enumerate(bytes_val):
-                        if position + i < len(file_data):
-                            file_data[position + i] = b
-                else:
-                    raise ValueError("UInt32 value out of range")
-
-            elif data_type == 'int64':
+            elif data_type in INT_EDIT_TYPES:
+                # int.to_bytes validates the range and serializes in one call
+                signed, type_name = INT_EDIT_TYPES[data_type]
                 value = int(text, 16) if is_hex else int(text)
-                if -9223372036854775808 <= value <= 9223372036854775807:
-                    fmt = '<q' if self.editor.endian_mode == 'little' else '>q'
-                    bytes_val = struct.pack(fmt, value)
-                    for i, b in enumerate(bytes_val):
-                        if position + i < len(file_data):
-                            file_data[position + i] = b
-                else:
-                    raise ValueError("Int64 value out of range")
-
-            elif data_type == 'uint64':
-                value = int(text, 16) if is_hex else int(text)
-                if 0 <= value <= 18446744073709551615:
-                    fmt = '<Q' if self.editor.endian_mode == 'little' else '>Q'
-                    bytes_val = struct.pack(fmt, value)
-                    for i, b in enumerate(bytes_val):
-                        if position + i < len(file_data):
-                            file_data[position + i] = b
-                else:
-                    raise ValueError("UInt64 value out of range")
+                try:
+                    bytes_val = value.to_bytes(EDIT_TYPE_SIZES[data_type], endian, signed=signed)
+                except OverflowError:
+                    raise ValueError(f"{type_name} value out of range")
+                write_bytes(bytes_val)
 
             elif data_type == 'float':
                 value = float(text)
-                fmt = '<f' if self.editor.endian_mode == 'little' else '>f'
-                bytes_val = struct.pack(fmt, value)
-                for i, b in enumerate(bytes_val):
-                    if position + i < len(file_data):
-                        file_data[position + i] = b
+                write_packed(structs['f'], value)
 
             elif data_type == 'double':
                 value = float(text)
-                fmt = '<d' if self.editor.endian_mode == 'little' else '>d'
-                bytes_val = struct.pack(fmt, value)
-                for i, b in enumerate(bytes_val):
-                    if position + i < len(file_data):
-                        file_data[position + i] = b
-
-            elif data_type == 'int24':
-                value = int(text, 16) if is_hex else int(text)
-                if -8388608 <= value <= 8388607:
-                    if value < 0:
-                        value = value + 0x1000000
-                    if self.editor.endian_mode == 'little':
-                        bytes_val = bytes([value & 0xFF, (value >> 8) & 0xFF, (value >> 16) & 0xFF])
-                    else:
-                        bytes_val = bytes([(value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF])
-                    for i, b in enumerate(bytes_val):
-                        if position + i < len(file_data):
-                            file_data[position + i] = b
-                else:
-                    raise ValueError("Int24 value out of range")
-
-            elif data_type == 'uint24':
-                value = int(text, 16) if is_hex else int(text)
-                if 0 <= value <= 16777215:
-                    if self.editor.endian_mode == 'little':
-                        bytes_val = bytes([value & 0xFF, (value >> 8) & 0xFF, (value >> 16) & 0xFF])
-                    else:
-                        bytes_val = bytes([(value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF])
-                    for i, b in enumerate(bytes_val):
-                        if position + i < len(file_data):
-                            file_data[position + i] = b
-                else:
-                    raise ValueError("UInt24 value out of range")
+                write_packed(structs['d'], value)
 
             elif data_type == 'ansichar':
                 if len(text) == 1:
                     file_data[position] = ord(text)
-                elif text.startswith('\\x') and len(text) == 4:
-                    file_data[position] = int(text[2:], 16)
+                elif text.startswith('\\x') and len(text) == 4 and text[2:].upper() in HEX_BYTE_VALUES:
+                    file_data[position] = HEX_BYTE_VALUES[text[2:].upper()]
                 else:
                     raise ValueError("Invalid AnsiChar format")
 
@@ -699,68 +830,46 @@ class DataInspector:
                 if len(text) == 1:
                     value = ord(text)
                 elif text.startswith('\\u') and len(text) == 6:
-                    value = int(text[2:], 16)
+                    # bytes.fromhex accepts only hex digit pairs (int() would also take signs and '_')
+                    value = int.from_bytes(bytes.fromhex(text[2:]), 'big')
                 else:
                     raise ValueError("Invalid WideChar format")
-                fmt = '<H' if self.editor.endian_mode == 'little' else '>H'
-                bytes_val = struct.pack(fmt, value)
-                for i, b in enumerate(bytes_val):
-                    if position + i < len(file_data):
-                        file_data[position + i] = b
+                write_packed(structs['H'], value)
 
             elif data_type == 'utf8':
                 bytes_val = text.encode('utf-8')
-                for i, b in enumerate(bytes_val):
-                    if position + i < len(file_data):
-                        file_data[position + i] = b
+                write_bytes(bytes_val)
 
             elif data_type == 'guid':
                 # Parse GUID format: XXXXXXXX-XXXX-XXXX-XXXX-XXXXXXXXXXXX
                 guid_parts = text.replace('{', '').replace('}', '').split('-')
-                if len(guid_parts) == 5:
-                    d1 = int(guid_parts[0], 16)
-                    d2 = int(guid_parts[1], 16)
-                    d3 = int(guid_parts[2], 16)
-                    d4_1 = int(guid_parts[3], 16)
-                    d4_2 = int(guid_parts[4], 16)
-
-                    if self.editor.endian_mode == 'little':
-                        bytes_val = struct.pack('<IHH', d1, d2, d3)
-                    else:
-                        bytes_val = struct.pack('>IHH', d1, d2, d3)
-
-                    bytes_val += struct.pack('>HQ', d4_1, d4_2)[0:8]
-
-                    for i, b in enumerate(bytes_val[:16]):
-                        if position + i < len(file_data):
-                            file_data[position + i] = b
-                else:
+                if len(guid_parts) != 5 or not all(0 < len(part) <= width for part, width in zip(guid_parts, GUID_FIELD_WIDTHS)):
                     raise ValueError("Invalid GUID format")
 
+                # One hex parse for all 16 bytes; the text form lists every field big-endian
+                bytes_val = bytes.fromhex(''.join(part.zfill(width) for part, width in zip(guid_parts, GUID_FIELD_WIDTHS)))
+                # Re-pack Data1, Data2 and Data3 in the selected byte order (a no-op for big-endian)
+                write_bytes(structs['IHH8s'].pack(*STRUCTS['big']['IHH8s'].unpack(bytes_val)))
+
             # Mark as modified and update displays
-            self.editor.save_undo_state()
+            self.editor.save_undo_delta(position, old_bytes)
             current_file.modified = True
 
-            # Calculate byte count based on data type
-            byte_count = 1 if data_type in ['byte_hex', 'int8', 'uint8', 'ansichar'] else \
-                         2 if data_type in ['int16', 'uint16', 'widechar', 'dos_date', 'dos_time'] else \
-                         3 if data_type in ['int24', 'uint24'] else \
-                         4 if data_type in ['int32', 'uint32', 'float', 'dos_datetime', 'time_t_32'] else \
-                         8 if data_type in ['int64', 'uint64', 'double', 'oletime', 'filetime', 'time_t_64'] else \
-                         16 if data_type in ['guid'] else 1
+            # Calculate byte count based on data type (UTF-8 text writes its encoded length), clipped to EOF
+            byte_count = len(bytes_val) if data_type == 'utf8' else EDIT_TYPE_SIZES.get(data_type, 1)
+            byte_count = max(0, min(byte_count, len(file_data) - position))
 
             # Mark modified bytes
-            for i in range(byte_count):
-                if position + i < len(file_data):
-                    current_file.modified_bytes.add(position + i)
+            current_file.modified_bytes.update(range(position, position + byte_count))
+            current_file.mark_pattern_range_dirty(position, position + byte_count)
 
             # Update tab title to show modification
             import os
             tab_text = os.path.basename(current_file.file_path) + " *"
             self.editor.tab_widget.setTabText(self.editor.current_tab_index, tab_text)
 
-            # Refresh display
-            self.editor.display_hex()
+            # Refresh display (overwrites keep the row layout, so only the edited bytes are patched)
+            self.editor.refresh_edited_bytes(position, byte_count)
             self.update()
 
         except (ValueError, struct.error) as e:
@@ -605,10 +605,12 @@ class FieldWidget(QWidget):
 
             if bytes_val:
                 self.parent_editor.save_undo_state()
-                for i, b in enumerate(bytes_val):
-                    if subfield.start + i < len(file_data):
-                        file_data[subfield.start + i] = b
-                        current_file.modified_bytes.add(subfield.start + i)
+                # Write and mark the value in one slice each (bytes past the end are dropped)
+                end = min(subfield.start + len(bytes_val), len(file_data))
+                if end > subfield.start:
+                    file_data[subfield.start:end] = bytes_val[:end - subfield.start]
+                    current_file.modified_bytes.update(range(subfield.start, end))
+                    current_file.mark_pattern_range_dirty(subfield.start, end)
 
                 current_file.modified = True
 
@@ -1238,6 +1238,7 @@ class SignatureWidget(QWidget):
                     for i, byte in enumerate(new_bytes):
                         if pointer.offset + i < len(file_data):
                             file_data[pointer.offset + i] = byte
+                    current_file.mark_pattern_range_dirty(pointer.offset, min(pointer.offset + len(new_bytes), len(file_data)))
 
                     pointer.value = self.interpret_value(file_data, pointer.offset, pointer.length, pointer.data_type, self.string_display_mode, pointer)
 